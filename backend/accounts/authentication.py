@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import ClaimsUser, User
+from .services import get_token_version
+
+# Claims written by CustomTokenObtainPairSerializer.get_token, keyed by field.
+CLAIM_FIELDS = {
+    "id": api_settings.USER_ID_CLAIM,
+    "username": "username",
+    "email": "email",
+    "role": "role",
+    "token_version": "token_version",
+}
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves request.user from the token claims when
+    JWT_STATELESS_USER is enabled, skipping the users table lookup. Staleness
+    is capped by the per-user token version. With the setting off it behaves
+    like JWTAuthentication, plus the token version check.
+    """
+
+    def get_user(self, validated_token):
+        if not settings.JWT_STATELESS_USER or not self._has_claims(validated_token):
+            user = super().get_user(validated_token)
+            if validated_token.get("token_version", 0) != user.token_version:
+                raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+            return user
+
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        current_version = get_token_version(user_id)
+        if current_version is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if validated_token["token_version"] != current_version:
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+        return self._build_user(validated_token)
+
+    @staticmethod
+    def _has_claims(validated_token):
+        if any(claim not in validated_token for claim in CLAIM_FIELDS.values()):
+            return False
+        return validated_token["role"] in User.Role.values
+
+    @staticmethod
+    def _build_user(validated_token):
+        # Deactivation bumps the token version, so a token that passed the
+        # version check belongs to an active user.
+        values = {field: validated_token[claim] for field, claim in CLAIM_FIELDS.items()}
+        values["is_active"] = True
+
+        field_names = [f.attname for f in ClaimsUser._meta.concrete_fields if f.attname in values]
+        return ClaimsUser.from_db(
+            router.db_for_read(User),
+            field_names,
+            [values[name] for name in field_names],
+        )
+
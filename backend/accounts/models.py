@@ -16,9 +16,29 @@ class User(AbstractUser, PermissionsMixin):
     department=models.ForeignKey('organization.Department', on_delete=models.SET_NULL, null=True, blank=True, related_name='users')
 
     team = models.ForeignKey("organization.Team",on_delete=models.SET_NULL,null=True,blank=True,related_name="members")
+
+    # Bumped whenever claims baked into issued tokens (role, active state) go stale.
+    token_version = models.PositiveIntegerField(default=0)
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
     def __str__(self): 
-        return self.email
\ No newline at end of file
+        return self.email
+
+
+class ClaimsUser(User):
+    """
+    User built from verified JWT claims. Fields that are not carried in the
+    token stay deferred; touching any of them loads the rest of the row in a
+    single query.
+    """
+
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred and set(fields) <= deferred:
+            fields = list(deferred)
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
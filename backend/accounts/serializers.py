@@ -4,7 +4,9 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework import serializers
 
 from core.permissions.services import PermissionService
+from core.permissions.shared_cache import bump_team_version
 from .models import User
+from .services import bump_token_version
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     username_field = "email"
@@ -17,6 +19,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['user_id'] = user.id
         token['username'] = user.username
         token['email'] = user.email
+        token['token_version'] = user.token_version
         return token
 
 class BaseUserRoleValidationMixin:
@@ -48,10 +51,12 @@ class CreateUserSerializer(BaseUserRoleValidationMixin, serializers.ModelSeriali
         extra_kwargs = {"password": {"write_only": True}}
 
     def create(self, validated_data):
-        return User.objects.create_user(
+        user = User.objects.create_user(
             **validated_data,
             created_by=self.context['request'].user
         )
+        bump_team_version(user.team_id)
+        return user
     
 
 class UpdateUserSerializer(BaseUserRoleValidationMixin, serializers.ModelSerializer):
@@ -77,11 +82,23 @@ class UpdateUserSerializer(BaseUserRoleValidationMixin, serializers.ModelSeriali
                         "user already has a team, cannot change team directly. Please contact admin."
                     )
 
+        # Role and active state are baked into issued tokens.
+        revoke_tokens = (
+            validated_data.get("role", instance.role) != instance.role
+            or (instance.is_active and validated_data.get("is_active") is False)
+        )
+
+        old_team_id = instance.team_id
+
         # Apply all validated fields
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
         instance.save()
+        if instance.team_id != old_team_id:
+            bump_team_version(old_team_id, instance.team_id)
+        if revoke_tokens:
+            bump_token_version(instance)
         return instance
 
 
@@ -1,4 +1,38 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
 from core.permissions.services import PermissionService
+from .models import User
+
+TOKEN_VERSION_CACHE_KEY = "accounts:token_version:{user_id}"
+
 
 def can_assign_role(request_user, target_role):
-    return PermissionService.can_assign_role(request_user, target_role)
\ No newline at end of file
+    return PermissionService.can_assign_role(request_user, target_role)
+
+
+def get_token_version(user_id):
+    """
+    Current token version for a user, or None if the user no longer exists.
+    Cached for JWT_TOKEN_VERSION_CACHE_TIMEOUT seconds.
+    """
+    key = TOKEN_VERSION_CACHE_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        version = User.objects.filter(pk=user_id).values_list("token_version", flat=True).first()
+        if version is not None:
+            cache.set(key, version, settings.JWT_TOKEN_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def bump_token_version(user):
+    """
+    Invalidate every token issued to `user` so far.
+    """
+    User.objects.filter(pk=user.pk).update(token_version=F("token_version") + 1)
+    user.refresh_from_db(fields=["token_version"])
+
+    key = TOKEN_VERSION_CACHE_KEY.format(user_id=user.pk)
+    transaction.on_commit(lambda: cache.delete(key))
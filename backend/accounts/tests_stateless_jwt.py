@@ -0,0 +1,89 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import ClaimsUser, User
+from organization.models import Department
+
+
+@override_settings(JWT_STATELESS_USER=True)
+class StatelessJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", password="password", role=User.Role.ADMIN)
+        self.employee = User.objects.create_user(
+            email="emp@test.com", username="emp", password="password", role=User.Role.EMPLOYEE, department=self.dept
+        )
+
+    def _login(self, email):
+        response = self.client.post(reverse("token_obtain_pair"), {"email": email, "password": "password"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        return response.data["access"]
+
+    def test_claims_user_skips_users_table(self):
+        self._login("emp@test.com")
+        url = reverse("protected_test")
+
+        # Only the token version lookup, which is cached afterwards.
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["role"], User.Role.EMPLOYEE)
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_model_fields_load_lazily_in_one_query(self):
+        self._login("emp@test.com")
+        request = self.client.get(reverse("protected_test")).wsgi_request
+        user = request.user
+
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual(user, self.employee)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.department_id, self.dept.id)
+            self.assertIsNone(user.team_id)
+            self.assertFalse(user.is_superuser)
+
+    def test_role_change_revokes_tokens(self):
+        employee_token = self._login("emp@test.com")
+        self.client.get(reverse("protected_test"))  # warm the version cache
+        self._login("admin@test.com")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("user_detail", kwargs={"pk": self.employee.id}), {"role": User.Role.MANAGER}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {employee_token}")
+        response = self.client.get(reverse("protected_test"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self._login("emp@test.com")
+        response = self.client.get(reverse("protected_test"))
+        self.assertEqual(response.data["role"], User.Role.MANAGER)
+
+    def test_deactivation_revokes_tokens(self):
+        employee_token = self._login("emp@test.com")
+        self._login("admin@test.com")
+
+        response = self.client.delete(reverse("user_detail", kwargs={"pk": self.employee.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {employee_token}")
+        response = self.client.get(reverse("protected_test"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(JWT_STATELESS_USER=False)
+    def test_database_mode_also_checks_token_version(self):
+        employee_token = self._login("emp@test.com")
+        User.objects.filter(pk=self.employee.pk).update(token_version=5)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {employee_token}")
+        response = self.client.get(reverse("protected_test"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -15,6 +15,7 @@ from .serializers import (
     UserReadSerializer,
 )
 from .models import User
+from .services import bump_token_version
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
@@ -122,6 +123,7 @@ class UserDetailView(APIView):
 
         user.is_active = False
         user.save(update_fields=["is_active"])
+        bump_token_version(user)
 
         return Response(
             {"message": "User deactivated successfully"},
@@ -0,0 +1,206 @@
+import csv
+import io
+import json
+import logging
+import os
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from accounts.models import User
+
+from .models import ActivityLog, ActivityLogParticipant, AuditSpoolOffset
+from .services import log_participants, resolve_log_scopes, save_activity_logs
+from .spool import spool_lock
+
+
+logger = logging.getLogger(__name__)
+
+LOG_COPY_COLUMNS = (
+    "id", "user_id", "action_type", "target_type", "target_id", "metadata",
+    "created_at", "project_id", "team_id", "department_id",
+)
+PARTICIPANT_COPY_COLUMNS = ("log_id", "user_id", "role")
+
+
+def _parse_record(line):
+    record = json.loads(line)
+    created_at = parse_datetime(record["created_at"])
+    if created_at is None:
+        raise ValueError(f"Bad created_at {record['created_at']!r}")
+    return ActivityLog(
+        user_id=record["user_id"],
+        action_type=record["action_type"],
+        target_type=record["target_type"],
+        target_id=record["target_id"],
+        metadata=record["metadata"],
+        created_at=created_at,
+    )
+
+
+def _read_pending(spool, batch_size):
+    """
+    Reads up to batch_size complete lines from the current position.
+    Returns (logs, bytes consumed, lines skipped). A final line without its
+    newline is still being written and is left for the next run.
+    """
+    logs, consumed, skipped = [], 0, 0
+    while len(logs) < batch_size:
+        line = spool.readline()
+        if not line.endswith(b"\n"):
+            break
+        consumed += len(line)
+        try:
+            logs.append(_parse_record(line))
+        except (ValueError, KeyError, TypeError):
+            skipped += 1
+            logger.error("Skipping malformed audit spool record: %r", line[:200])
+    return logs, consumed, skipped
+
+
+def _existing_user_ids(logs):
+    """Ids of the actors and participants named by `logs` that still exist."""
+    candidates = {log.user_id for log in logs}
+    candidates.update(participant.user_id for log in logs for participant in log_participants(log))
+    return set(User.objects.filter(id__in=candidates).values_list("id", flat=True))
+
+
+def _drop_missing_users(logs, user_ids):
+    kept = [log for log in logs if log.user_id in user_ids]
+    if len(kept) != len(logs):
+        logger.warning("Dropping %s spooled audit logs whose user no longer exists.", len(logs) - len(kept))
+    return kept
+
+
+def _copy_rows(cursor, table, columns, rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    if hasattr(cursor, "copy_expert"):
+        cursor.copy_expert(sql, buffer)
+    else:
+        with cursor.copy(sql) as copy:
+            copy.write(buffer.getvalue())
+
+
+def _copy_logs(logs, user_ids):
+    """
+    Postgres path: reserves ids from the table's sequence, then streams logs
+    and participants in with COPY. Must run inside the caller's transaction.
+    Participants whose user is not in `user_ids` are left out.
+    """
+    scopes = resolve_log_scopes((log.target_type, log.target_id, log.metadata) for log in logs)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+            [ActivityLog._meta.db_table, len(logs)],
+        )
+        for log, (log_id,), scope in zip(logs, cursor.fetchall(), scopes):
+            log.id = log_id
+            for field, value in scope.items():
+                setattr(log, field, value)
+
+        _copy_rows(cursor, ActivityLog._meta.db_table, LOG_COPY_COLUMNS, [
+            (
+                log.id, log.user_id, log.action_type, log.target_type, log.target_id,
+                json.dumps(log.metadata), log.created_at.isoformat(),
+                log.project_id, log.team_id, log.department_id,
+            )
+            for log in logs
+        ])
+        _copy_rows(cursor, ActivityLogParticipant._meta.db_table, PARTICIPANT_COPY_COLUMNS, [
+            (participant.log_id, participant.user_id, participant.role)
+            for log in logs
+            for participant in log_participants(log)
+            if participant.user_id in user_ids
+        ])
+
+
+def load_logs(logs, user_ids):
+    if connection.vendor == "postgresql":
+        _copy_logs(logs, user_ids)
+    else:
+        save_activity_logs(logs, user_ids=user_ids)
+
+
+def ingest_batch(path, batch_size=5000):
+    """
+    Loads the next batch from the spool at `path`. The rows and the new
+    offset commit together, so a crash at any point either loads the batch
+    and moves past it or does neither. Returns (loaded, skipped), where
+    skipped counts malformed records and records whose user is gone.
+    """
+    with transaction.atomic():
+        state, _ = AuditSpoolOffset.objects.select_for_update().get_or_create(path=path)
+        try:
+            spool = open(path, "rb")
+        except FileNotFoundError:
+            return 0, 0
+
+        with spool:
+            inode = os.fstat(spool.fileno()).st_ino
+            if inode != state.inode:
+                state.inode, state.offset = inode, 0
+            spool.seek(state.offset)
+            logs, consumed, skipped = _read_pending(spool, batch_size)
+
+            if logs:
+                # Users named by a record may have been deleted since it was
+                # spooled; loading them anyway would fail the batch for good.
+                user_ids = _existing_user_ids(logs)
+                kept = _drop_missing_users(logs, user_ids)
+                skipped += len(logs) - len(kept)
+                logs = kept
+            if logs:
+                load_logs(logs, user_ids)
+            if consumed:
+                state.offset += consumed
+                state.save(update_fields=["inode", "offset", "updated_at"])
+
+    _rotate_if_consumed(path, state)
+    return len(logs), skipped
+
+
+def _rotate_if_consumed(path, state):
+    """
+    Moves a fully loaded spool aside once it is large enough, after the
+    offset that covers it has committed. Writers then start a new file,
+    whose different inode tells the next run to begin at 0. The previous
+    file is kept until the next rotation so its inode cannot be reused by
+    the new spool.
+    """
+    if state.offset < settings.AUDIT_SPOOL_ROTATE_BYTES:
+        return
+    with spool_lock(path):
+        stat = os.stat(path)
+        if stat.st_ino == state.inode and stat.st_size == state.offset:
+            os.replace(path, f"{path}.consumed")
+
+
+def spool_lag(path):
+    """
+    How far ingestion is behind the spool: unread bytes and the age in
+    seconds of the oldest unread record.
+    """
+    state = AuditSpoolOffset.objects.filter(path=path).first()
+    try:
+        spool = open(path, "rb")
+    except FileNotFoundError:
+        return {"pending_bytes": 0, "lag_seconds": 0.0}
+
+    with spool:
+        stat = os.fstat(spool.fileno())
+        offset = state.offset if state and state.inode == stat.st_ino else 0
+        spool.seek(offset)
+        line = spool.readline()
+
+    lag_seconds = 0.0
+    if line.endswith(b"\n"):
+        try:
+            lag_seconds = max((timezone.now() - _parse_record(line).created_at).total_seconds(), 0.0)
+        except (ValueError, KeyError, TypeError):
+            pass
+    return {"pending_bytes": stat.st_size - offset, "lag_seconds": lag_seconds}
@@ -0,0 +1,58 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from audit.ingest import ingest_batch, spool_lag
+from audit.spool import spool_path
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Loads activity logs from the AUDIT_SPOOL_PATH spool into the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", help="Spool file to load. Defaults to AUDIT_SPOOL_PATH.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to wait when caught up.")
+        parser.add_argument("--once", action="store_true", help="Exit once the spool is caught up.")
+        parser.add_argument("--status", action="store_true", help="Print the ingestion lag and exit.")
+        parser.add_argument(
+            "--max-lag",
+            type=float,
+            help="With --status, fail when the oldest unloaded record is older than this many seconds.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"] or spool_path()
+        if not path:
+            raise CommandError("No spool configured; set AUDIT_SPOOL_PATH or pass --path.")
+
+        if options["status"]:
+            lag = spool_lag(path)
+            self.stdout.write(f"pending_bytes={lag['pending_bytes']} lag_seconds={lag['lag_seconds']:.1f}")
+            if options["max_lag"] is not None and lag["lag_seconds"] > options["max_lag"]:
+                raise CommandError(f"Audit ingestion is {lag['lag_seconds']:.1f}s behind.")
+            return
+
+        total = 0
+        while True:
+            loaded, skipped = ingest_batch(path, options["batch_size"])
+            total += loaded
+            if loaded or skipped:
+                lag = spool_lag(path)
+                logger.info(
+                    "Loaded %s audit logs (%s skipped); %s bytes pending, %.1fs behind",
+                    loaded,
+                    skipped,
+                    lag["pending_bytes"],
+                    lag["lag_seconds"],
+                )
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS(f"Loaded {total} activity logs from {path}."))
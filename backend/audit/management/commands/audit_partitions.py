@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from audit.partitions import (
+    convert_to_partitioned,
+    detach_partitions,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    partition_name,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintains the monthly partitions of the activity log on Postgres: creates "
+        "upcoming months ahead of time and detaches months past the retention period."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Rebuild the activity log as a partitioned table first. Locks the table while rows are copied.",
+        )
+        parser.add_argument("--ahead", type=int, default=3, help="Months after the current one to create.")
+        parser.add_argument("--retain", type=int, help="Detach partitions older than this many months.")
+        parser.add_argument("--drop", action="store_true", help="Drop detached partitions instead of keeping them.")
+
+    def handle(self, *args, **options):
+        if options["drop"] and options["retain"] is None:
+            raise CommandError("--drop only applies to partitions detached by --retain.")
+        if connection.vendor != "postgresql":
+            raise CommandError("Activity log partitioning requires PostgreSQL.")
+
+        if not is_partitioned():
+            if not options["convert"]:
+                raise CommandError("The activity log is not partitioned; run with --convert first.")
+            convert_to_partitioned(options["ahead"])
+            self.stdout.write("Converted the activity log to monthly partitions.")
+
+        for month in ensure_partitions(options["ahead"]):
+            self.stdout.write(f"Created {partition_name(month)}.")
+
+        if options["retain"] is not None:
+            verb = "Dropped" if options["drop"] else "Detached"
+            for month in detach_partitions(options["retain"], drop=options["drop"]):
+                self.stdout.write(f"{verb} {partition_name(month)}.")
+
+        months = list_partitions()
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(months)} partitions, {months[0]:%Y-%m} to {months[-1]:%Y-%m}." if months else "No partitions."
+        ))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import User
+from audit.models import ActivityLog, ActivityLogParticipant
+from audit.services import log_participants
+
+
+class Command(BaseCommand):
+    help = "Extracts participants from the metadata of historical activity logs. Safe to re-run."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        logs = ActivityLog.objects.only("id", "user_id", "action_type", "metadata").order_by("id")
+
+        last_id = 0
+        written = 0
+        while True:
+            batch = list(logs.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            participants = [participant for log in batch for participant in log_participants(log)]
+            # Metadata may name users that have since been deleted.
+            existing = set(
+                User.objects.filter(id__in={p.user_id for p in participants}).values_list("id", flat=True)
+            )
+            participants = [p for p in participants if p.user_id in existing]
+            with transaction.atomic():
+                created = ActivityLogParticipant.objects.bulk_create(participants, ignore_conflicts=True)
+
+            written += len(created)
+            last_id = batch[-1].id
+            self.stdout.write(f"Processed logs up to id {last_id}.")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled participants for activity logs ({written} rows submitted)."))
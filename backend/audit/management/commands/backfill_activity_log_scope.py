@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from audit.models import ActivityLog
+from audit.services import SCOPE_FIELDS, resolve_log_scopes
+
+
+class Command(BaseCommand):
+    help = "Fills project_id / team_id / department_id on activity logs written before they were recorded."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        pending = ActivityLog.objects.filter(
+            project_id__isnull=True, team_id__isnull=True, department_id__isnull=True
+        ).exclude(target_type="USER")
+
+        last_id = 0
+        updated = 0
+        while True:
+            batch = list(
+                pending.filter(id__gt=last_id)
+                .order_by("id")
+                .only("id", "target_type", "target_id", "metadata")[:batch_size]
+            )
+            if not batch:
+                break
+
+            scopes = resolve_log_scopes((log.target_type, log.target_id, log.metadata) for log in batch)
+            changed = []
+            for log, scope in zip(batch, scopes):
+                if any(scope.values()):
+                    for field, value in scope.items():
+                        setattr(log, field, value)
+                    changed.append(log)
+
+            with transaction.atomic():
+                ActivityLog.objects.bulk_update(changed, SCOPE_FIELDS)
+
+            updated += len(changed)
+            last_id = batch[-1].id
+            self.stdout.write(f"Processed logs up to id {last_id} ({updated} updated).")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled scope on {updated} activity logs."))
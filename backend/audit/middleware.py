@@ -0,0 +1,15 @@
+from .services import audit_batch
+
+
+class AuditBatchMiddleware:
+    """
+    Writes every activity log committed during a request in one batch
+    after the view returns, instead of one INSERT per log_activity call.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with audit_batch():
+            return self.get_response(request)
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0002_activitylog_scope_columns'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityLogParticipant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('ACTOR', 'Actor'), ('ASSIGNEE', 'Assignee'), ('MEMBER', 'Member')], max_length=20)),
+                ('log', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participants', to='audit.activitylog')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_participations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'log'], name='activity_participant_user_idx')],
+                'constraints': [models.UniqueConstraint(fields=('log', 'user', 'role'), name='unique_activity_log_participant')],
+            },
+        ),
+    ]
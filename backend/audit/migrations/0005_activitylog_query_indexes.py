@@ -0,0 +1,68 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:01
+
+from django.db import migrations, models
+
+
+QUERY_INDEXES = [
+    models.Index(fields=["target_type", "target_id", "-created_at"], name="activity_log_target_idx"),
+    models.Index(fields=["user", "-created_at"], name="activity_log_user_idx"),
+    models.Index(fields=["action_type", "-created_at"], name="activity_log_action_idx"),
+]
+
+CREATED_AT_BRIN = "activity_log_created_brin"
+
+
+def add_indexes(apps, schema_editor):
+    ActivityLog = apps.get_model("audit", "ActivityLog")
+    if schema_editor.connection.vendor != "postgresql":
+        for index in QUERY_INDEXES:
+            schema_editor.add_index(ActivityLog, index)
+        return
+
+    # CONCURRENTLY keeps the table writable while the indexes build; a
+    # failed build leaves an INVALID index that IF NOT EXISTS would keep,
+    # so drop any leftover first.
+    for index in QUERY_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+        schema_editor.add_index(ActivityLog, index, concurrently=True)
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {CREATED_AT_BRIN}")
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY {CREATED_AT_BRIN} ON audit_activitylog USING brin (created_at)"
+    )
+
+
+def remove_indexes(apps, schema_editor):
+    ActivityLog = apps.get_model("audit", "ActivityLog")
+    if schema_editor.connection.vendor != "postgresql":
+        for index in QUERY_INDEXES:
+            schema_editor.remove_index(ActivityLog, index)
+        return
+
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {CREATED_AT_BRIN}")
+    for index in QUERY_INDEXES:
+        schema_editor.remove_index(ActivityLog, index, concurrently=True)
+
+
+class Migration(migrations.Migration):
+    """
+    Composite indexes for the activity feed's filters, each ending in the
+    feed's -created_at sort, plus a Postgres-only BRIN index on created_at
+    for date range filters. Logs are appended in created_at order, so the
+    BRIN index stays a few pages even for millions of rows. On Postgres
+    every index is built concurrently, which cannot run in a transaction.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('audit', '0004_spool'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.RunPython(add_indexes, remove_indexes)],
+            state_operations=[
+                migrations.AddIndex(model_name='activitylog', index=index) for index in QUERY_INDEXES
+            ],
+        ),
+    ]
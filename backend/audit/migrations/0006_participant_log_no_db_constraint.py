@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0005_activitylog_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylogparticipant',
+            name='log',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='participants', to='audit.activitylog'),
+        ),
+    ]
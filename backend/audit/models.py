@@ -1,6 +1,7 @@
 # logs, activity tracking
 
 from django.db import models
+from django.utils import timezone
 
 from accounts.models import User
 
@@ -13,8 +14,72 @@ class ActivityLog(models.Model):
     target_type = models.CharField(max_length=50)  
     target_id = models.IntegerField()
     metadata = models.JSONField(default=dict)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # A default rather than auto_now_add so spooled logs keep their commit time.
+    created_at = models.DateTimeField(default=timezone.now)
+
+    # Scope of the target, resolved at write time (see ActivityLogService).
+    # Plain integers so logs survive deletion of what they point to.
+    project_id = models.IntegerField(null=True, blank=True)
+    team_id = models.IntegerField(null=True, blank=True)
+    department_id = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project_id", "-created_at"], name="activity_log_project_idx"),
+            models.Index(fields=["team_id", "-created_at"], name="activity_log_team_idx"),
+            models.Index(fields=["department_id", "-created_at"], name="activity_log_department_idx"),
+            # ActivityLogViewSet filters, each followed by its -created_at sort.
+            models.Index(fields=["target_type", "target_id", "-created_at"], name="activity_log_target_idx"),
+            models.Index(fields=["user", "-created_at"], name="activity_log_user_idx"),
+            models.Index(fields=["action_type", "-created_at"], name="activity_log_action_idx"),
+            # Postgres also has a BRIN index on created_at for range scans,
+            # created outside the model state (see migration 0005).
+        ]
 
     def __str__(self):
         return super().__str__()
 
+
+class ActivityLogParticipant(models.Model):
+    """
+    Users a log concerns, extracted from the log when it is written so
+    per-user feeds do not have to search metadata.
+    """
+
+    class Role(models.TextChoices):
+        ACTOR = "ACTOR", "Actor"
+        ASSIGNEE = "ASSIGNEE", "Assignee"
+        MEMBER = "MEMBER", "Member"
+
+    # No database constraint: a partitioned log table (see audit.partitions)
+    # cannot be the target of a foreign key on id alone.
+    log = models.ForeignKey(ActivityLog, on_delete=models.CASCADE, related_name="participants", db_constraint=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="activity_participations")
+    role = models.CharField(max_length=20, choices=Role.choices)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["log", "user", "role"], name="unique_activity_log_participant"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "log"], name="activity_participant_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.role} in log {self.log_id}"
+
+
+class AuditSpoolOffset(models.Model):
+    """
+    How far audit_ingest has loaded a spool file. The offset moves in the
+    same transaction as the rows it covers, so every record loads once.
+    """
+
+    path = models.CharField(max_length=500, unique=True)
+    # Identifies the file generation; a rotated spool starts again at 0.
+    inode = models.BigIntegerField(default=0)
+    offset = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.path} @ {self.offset}"
@@ -0,0 +1,158 @@
+"""
+Monthly range partitioning of the activity log on Postgres. Partitions
+are named audit_activitylog_pYYYY_MM and hold [first of the month, first
+of the next month) in UTC; audit_activitylog_default catches rows outside
+them. Driven by `manage.py audit_partitions`.
+"""
+
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from accounts.models import User
+
+from .models import ActivityLog, ActivityLogParticipant
+
+
+TABLE = ActivityLog._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+CREATED_AT_BRIN = "activity_log_created_brin"
+
+
+def month_start(moment):
+    moment = moment.astimezone(dt_timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def _bounds(month):
+    return f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def is_partitioned():
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def list_partitions():
+    """Months that have a partition, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    matches = filter(None, (PARTITION_NAME.match(name) for name in names))
+    return sorted(datetime(int(match[1]), int(match[2]), 1, tzinfo=dt_timezone.utc) for match in matches)
+
+
+def convert_to_partitioned(months_ahead):
+    """
+    Rebuilds the log table as a partitioned one in a single transaction:
+    copies every row into monthly partitions, then recreates the id
+    sequence, keys and indexes. Writers wait on the table lock meanwhile.
+    The primary key becomes (id, created_at), as Postgres requires the
+    partition key in it, and the plain user_id index is not recreated since
+    activity_log_user_idx covers it.
+    """
+    staging = f"{TABLE}_partitioned"
+    with connection.schema_editor() as editor:
+        # Deferred foreign key checks still queued for the old table would
+        # block dropping it, so run them now.
+        editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        editor.execute(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE")
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT min(created_at), max(id) FROM {TABLE}")
+            oldest, last_id = cursor.fetchone()
+
+        editor.execute(f"CREATE TABLE {staging} (LIKE {TABLE} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+        month = month_start(oldest or timezone.now())
+        last_month = add_months(month_start(timezone.now()), months_ahead)
+        while month <= last_month:
+            editor.execute(f"CREATE TABLE {partition_name(month)} PARTITION OF {staging} FOR VALUES {_bounds(month)}")
+            month = add_months(month, 1)
+        editor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {staging} DEFAULT")
+        editor.execute(f"INSERT INTO {staging} SELECT * FROM {TABLE}")
+
+        editor.execute(f"DROP TABLE {TABLE}")
+        editor.execute(f"ALTER TABLE {staging} RENAME TO {TABLE}")
+        editor.execute(f"CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id START WITH {(last_id or 0) + 1}")
+        editor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+        editor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, created_at)")
+        editor.execute(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_user_id_fk FOREIGN KEY (user_id) "
+            f"REFERENCES {User._meta.db_table} (id) DEFERRABLE INITIALLY DEFERRED"
+        )
+        for index in ActivityLog._meta.indexes:
+            editor.add_index(ActivityLog, index)
+        editor.execute(f"CREATE INDEX {CREATED_AT_BRIN} ON {TABLE} USING brin (created_at)")
+
+
+def create_partition(month):
+    """
+    Creates and attaches the partition for `month`. Rows of that month that
+    landed in the default partition move into it first, since attaching
+    would otherwise be rejected. The default partition stays locked against
+    writes until the attach commits, so no new row for the month can slip
+    in between.
+    """
+    name = partition_name(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {DEFAULT_PARTITION} IN SHARE ROW EXCLUSIVE MODE")
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= %s AND created_at < %s RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+            [month, add_months(month, 1)],
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES {_bounds(month)}")
+
+
+def ensure_partitions(months_ahead):
+    """Creates any missing partition from the current month to months_ahead ahead; returns the months created."""
+    current = month_start(timezone.now())
+    existing = set(list_partitions())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            create_partition(month)
+            created.append(month)
+    return created
+
+
+def detach_partitions(retain_months, drop=False):
+    """
+    Detaches every partition older than the current month and the
+    retain_months before it. Detached tables keep their rows for archiving
+    unless `drop` is set, which also deletes their participants.
+    """
+    cutoff = add_months(month_start(timezone.now()), -retain_months)
+    old = [month for month in list_partitions() if month < cutoff]
+    for month in old:
+        name = partition_name(month)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+            if drop:
+                cursor.execute(
+                    f"DELETE FROM {ActivityLogParticipant._meta.db_table} WHERE log_id IN (SELECT id FROM {name})"
+                )
+                cursor.execute(f"DROP TABLE {name}")
+    return old
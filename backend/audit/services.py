@@ -1,8 +1,23 @@
+import contextvars
+import logging
+from contextlib import contextmanager
+
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
+
+from organization.models import Team
+from work.models import Project, Task
 
 from .metadata_validation import validate_activity_metadata
-from .models import ActivityLog
+from .models import ActivityLog, ActivityLogParticipant
+from .spool import append_records, spool_path
+
+SCOPE_FIELDS = ("project_id", "team_id", "department_id")
+
+logger = logging.getLogger(__name__)
+
+_audit_batch = contextvars.ContextVar("audit_batch", default=None)
 
 
 class ActivityActionType:
@@ -32,6 +47,137 @@ class ActivityTargetType:
     USER = "USER"
 
 
+MEMBERSHIP_ACTIONS = frozenset({
+    ActivityActionType.USER_ASSIGNED_TO_PROJECT,
+    ActivityActionType.USER_REMOVED_FROM_PROJECT,
+    ActivityActionType.USER_ROLE_CHANGED_IN_PROJECT,
+    ActivityActionType.USER_ADDED_TO_TEAM,
+    ActivityActionType.USER_REMOVED_FROM_TEAM,
+})
+
+
+def _changed_user_ids(metadata, field):
+    change = (metadata or {}).get(field)
+    if not isinstance(change, dict):
+        return []
+    return [value for value in (change.get("old"), change.get("new")) if isinstance(value, int)]
+
+
+def log_participants(log):
+    """
+    Unsaved participant rows for a log: its actor, any assignee named in the
+    metadata, and the affected member for membership actions.
+    """
+    Role = ActivityLogParticipant.Role
+    found = {(log.user_id, Role.ACTOR)}
+    found.update((user_id, Role.ASSIGNEE) for user_id in _changed_user_ids(log.metadata, "assigned_to"))
+    if log.action_type in MEMBERSHIP_ACTIONS:
+        found.update((user_id, Role.MEMBER) for user_id in _changed_user_ids(log.metadata, "user_id"))
+    return [ActivityLogParticipant(log=log, user_id=user_id, role=role) for user_id, role in found]
+
+
+def _metadata_project_id(metadata):
+    value = (metadata or {}).get("project_id")
+    if isinstance(value, dict):
+        value = value.get("new") or value.get("old")
+    return value if isinstance(value, int) else None
+
+
+def resolve_log_scopes(entries):
+    """
+    Resolve the project/team/department scope for (target_type, target_id,
+    metadata) entries, in at most three queries. TASK logs whose task is
+    gone fall back to the project_id recorded in their metadata.
+    """
+    entries = list(entries)
+
+    task_ids = {target_id for target_type, target_id, _ in entries if target_type == ActivityTargetType.TASK}
+    task_projects = dict(Task.objects.filter(id__in=task_ids).values_list("id", "project_id")) if task_ids else {}
+
+    project_ids = []
+    for target_type, target_id, metadata in entries:
+        if target_type == ActivityTargetType.PROJECT:
+            project_ids.append(target_id)
+        elif target_type == ActivityTargetType.TASK:
+            project_ids.append(task_projects.get(target_id) or _metadata_project_id(metadata))
+
+    projects = {}
+    if any(project_ids):
+        projects = {
+            row["id"]: row
+            for row in Project.objects.filter(id__in=set(filter(None, project_ids))).values("id", "team_id", "department_id")
+        }
+
+    team_ids = {target_id for target_type, target_id, _ in entries if target_type == ActivityTargetType.TEAM}
+    team_departments = dict(Team.objects.filter(id__in=team_ids).values_list("id", "department_id")) if team_ids else {}
+
+    project_ids = iter(project_ids)
+    scopes = []
+    for target_type, target_id, _ in entries:
+        scope = dict.fromkeys(SCOPE_FIELDS)
+        if target_type in (ActivityTargetType.PROJECT, ActivityTargetType.TASK):
+            project_id = next(project_ids)
+            project = projects.get(project_id, {})
+            scope.update(
+                project_id=project_id,
+                team_id=project.get("team_id"),
+                department_id=project.get("department_id"),
+            )
+        elif target_type == ActivityTargetType.TEAM:
+            scope.update(team_id=target_id, department_id=team_departments.get(target_id))
+        scopes.append(scope)
+    return scopes
+
+
+def save_activity_logs(logs, user_ids=None):
+    """
+    Resolves scopes for unsaved logs and inserts them with their
+    participants. When `user_ids` is given, participants outside it are left
+    out, for logs whose named users may have been deleted since.
+    """
+    scopes = resolve_log_scopes((log.target_type, log.target_id, log.metadata) for log in logs)
+    for log, scope in zip(logs, scopes):
+        for field, value in scope.items():
+            setattr(log, field, value)
+
+    with transaction.atomic():
+        logs = ActivityLog.objects.bulk_create(logs)
+        ActivityLogParticipant.objects.bulk_create([
+            participant
+            for log in logs
+            for participant in log_participants(log)
+            if user_ids is None or participant.user_id in user_ids
+        ])
+    return logs
+
+
+@contextmanager
+def audit_batch():
+    """
+    Collects the logs that commit while the block runs and writes them in
+    one batch when it exits. Logs still go through transaction.on_commit
+    first, so a rolled back transaction or savepoint drops its logs before
+    they ever reach the batch. Nested blocks join the outermost one.
+    A failed write is logged rather than raised, since the work that
+    produced the logs has already committed.
+    """
+    if _audit_batch.get() is not None:
+        yield
+        return
+
+    entries = []
+    token = _audit_batch.set(entries)
+    try:
+        yield
+    finally:
+        _audit_batch.reset(token)
+        if entries:
+            try:
+                ActivityLogService._flush(entries)
+            except Exception:
+                logger.exception("Could not write %s batched activity logs.", len(entries))
+
+
 class ActivityLogService:
     @staticmethod
     def _normalize_metadata(metadata):
@@ -52,32 +198,117 @@ class ActivityLogService:
             return None
 
         payload, _ = cls._validate_for_write(action_type, cls._normalize_metadata(metadata))
+        [scope] = resolve_log_scopes([(target_type, target_id, payload)])
+
+        with transaction.atomic():
+            log = ActivityLog.objects.create(
+                user=user,
+                action_type=action_type,
+                target_type=target_type,
+                target_id=target_id,
+                metadata=payload,
+                **scope,
+            )
+            ActivityLogParticipant.objects.bulk_create(log_participants(log))
+        return log
 
-        return ActivityLog.objects.create(
+    @classmethod
+    def enqueue_log(cls, *, user, action_type, target_type, target_id, metadata=None):
+        cls.enqueue_logs(
             user=user,
-            action_type=action_type,
-            target_type=target_type,
-            target_id=target_id,
-            metadata=payload,
+            entries=[{
+                "action_type": action_type,
+                "target_type": target_type,
+                "target_id": target_id,
+                "metadata": metadata,
+            }],
         )
 
     @classmethod
-    def enqueue_log(cls, *, user, action_type, target_type, target_id, metadata=None):
+    def create_logs(cls, *, user, entries):
+        """
+        Batch counterpart of create_log for one actor. `entries` are dicts
+        with action_type, target_type, target_id and optional metadata.
+        Scopes, logs and participants are each written in one statement.
+        """
         if not user or not getattr(user, "is_authenticated", False):
-            return
+            return []
+        return cls._write_entries(cls._validated_entries(user, entries))
 
-        payload, _ = cls._validate_for_write(action_type, cls._normalize_metadata(metadata))
+    @classmethod
+    def _validated_entries(cls, user, entries):
+        return [
+            {
+                **entry,
+                "user": user,
+                "metadata": cls._validate_for_write(
+                    entry["action_type"], cls._normalize_metadata(entry.get("metadata"))
+                )[0],
+            }
+            for entry in entries
+        ]
 
-        def _create_log():
-            cls.create_log(
-                user=user,
-                action_type=action_type,
-                target_type=target_type,
-                target_id=target_id,
-                metadata=payload,
+    @classmethod
+    def _write_entries(cls, entries):
+        """Writes already validated entries, each carrying its own user."""
+        logs = [
+            ActivityLog(
+                user=entry["user"],
+                action_type=entry["action_type"],
+                target_type=entry["target_type"],
+                target_id=entry["target_id"],
+                metadata=entry["metadata"],
+                created_at=entry.get("created_at") or timezone.now(),
             )
+            for entry in entries
+        ]
+        if not logs:
+            return []
+        return save_activity_logs(logs)
+
+    @classmethod
+    def _flush(cls, entries):
+        """Hands committed entries to the spool when one is configured, else inserts them."""
+        path = spool_path()
+        if not path:
+            cls._write_entries(entries)
+            return
 
-        transaction.on_commit(_create_log)
+        append_records(path, [
+            {
+                "user_id": entry["user"].pk,
+                "action_type": entry["action_type"],
+                "target_type": entry["target_type"],
+                "target_id": entry["target_id"],
+                "metadata": entry["metadata"],
+                "created_at": entry["created_at"],
+            }
+            for entry in entries
+        ])
+
+    @classmethod
+    def enqueue_logs(cls, *, user, entries):
+        """
+        Validates now and writes once the current transaction commits, into
+        the active audit_batch if there is one. A failed write is logged
+        and does not fail the committed transaction's caller.
+        """
+        if not user or not getattr(user, "is_authenticated", False):
+            return
+
+        entries = cls._validated_entries(user, entries)
+        if entries:
+            transaction.on_commit(lambda: cls._deliver(entries), robust=True)
+
+    @classmethod
+    def _deliver(cls, entries):
+        committed_at = timezone.now()
+        entries = [{**entry, "created_at": committed_at} for entry in entries]
+        batch = _audit_batch.get()
+        if batch is not None:
+            batch.extend(entries)
+        else:
+            cls._flush(entries)
 
     @classmethod
     def log_task_status_change(cls, *, user, task, old, new):
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.db import connection, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from audit.models import ActivityLog
+from audit.services import ActivityActionType, ActivityTargetType
+
+
+SEEDED_LOGS = 20000
+
+ACTIONS = [
+    ActivityActionType.TASK_CREATED,
+    ActivityActionType.TASK_STATUS_CHANGED,
+    ActivityActionType.TASK_ASSIGNED,
+    ActivityActionType.PROJECT_UPDATED,
+    ActivityActionType.USER_ADDED_TO_TEAM,
+]
+
+
+class ActivityLogIndexPlanTests(TestCase):
+    """The feed's filter shapes are answered from an index, already in -created_at order."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(email=f"user{index}@test.com", username=f"user{index}", role=User.Role.EMPLOYEE)
+            for index in range(50)
+        ]
+        cls.start = timezone.now() - timedelta(days=365)
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    user=cls.users[index % len(cls.users)],
+                    action_type=ACTIONS[index % len(ACTIONS)],
+                    target_type=ActivityTargetType.TASK,
+                    target_id=index % 2000,
+                    created_at=cls.start + timedelta(minutes=index * 20),
+                )
+                for index in range(SEEDED_LOGS)
+            ],
+            batch_size=2000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def _plan(self, queryset):
+        return queryset.order_by("-created_at")[:20].explain()
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = self._plan(queryset)
+        self.assertIn(index_name, plan)
+        # The index already yields rows newest first, so no separate sort runs.
+        sort_marker = "Sort" if connection.vendor == "postgresql" else "TEMP B-TREE"
+        self.assertNotIn(sort_marker, plan)
+
+    def test_target_feed(self):
+        self.assertUsesIndex(
+            ActivityLog.objects.filter(target_type=ActivityTargetType.TASK, target_id=7), "activity_log_target_idx"
+        )
+
+    def test_user_feed(self):
+        self.assertUsesIndex(ActivityLog.objects.filter(user=self.users[3]), "activity_log_user_idx")
+
+    def test_action_feed_with_date_range(self):
+        self.assertUsesIndex(
+            ActivityLog.objects.filter(
+                action_type=ActivityActionType.TASK_ASSIGNED,
+                created_at__gte=self.start + timedelta(days=30),
+                created_at__lte=self.start + timedelta(days=60),
+            ),
+            "activity_log_action_idx",
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "BRIN indexes exist on Postgres only")
+    def test_created_at_range_uses_brin(self):
+        queryset = ActivityLog.objects.filter(
+            created_at__gte=self.start + timedelta(days=30), created_at__lte=self.start + timedelta(days=31)
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            # The table is small next to production, so make the planner pick an index when it can.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("activity_log_created_brin", plan)
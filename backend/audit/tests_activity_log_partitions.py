@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from audit.models import ActivityLog, ActivityLogParticipant
+from audit.partitions import add_months, is_partitioned, list_partitions, month_start, partition_name
+from audit.services import ActivityActionType, ActivityLogService, ActivityTargetType
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from work.models import Project, Task
+
+
+class PartitionMonthTests(SimpleTestCase):
+    def test_month_arithmetic_crosses_years(self):
+        january = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(add_months(january, -1), datetime(2025, 12, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(add_months(january, 13), datetime(2027, 2, 1, tzinfo=dt_timezone.utc))
+
+    def test_month_start_is_utc(self):
+        late_evening = datetime(2026, 3, 31, 23, 30, tzinfo=dt_timezone(timedelta(hours=-5)))
+
+        self.assertEqual(month_start(late_evening), datetime(2026, 4, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(partition_name(month_start(late_evening)), "audit_activitylog_p2026_04")
+
+
+@override_settings(AUDIT_LOG_RECENT_WINDOW_DAYS=90)
+class RecentWindowTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", role=User.Role.ADMIN)
+        self.recent = self._log(timezone.now())
+        self.old = self._log(timezone.now() - timedelta(days=200))
+        self.client.force_authenticate(user=self.admin)
+
+    def _log(self, created_at):
+        log = ActivityLogService.create_log(
+            user=self.admin,
+            action_type=ActivityActionType.PROJECT_CREATED,
+            target_type=ActivityTargetType.PROJECT,
+            target_id=1,
+        )
+        ActivityLog.objects.filter(pk=log.pk).update(created_at=created_at)
+        return log
+
+    def _ids(self, params=None):
+        response = self.client.get("/api/activity-logs/", params or {})
+        self.assertEqual(response.status_code, 200)
+        return {row["id"] for row in response.data["results"]}
+
+    def test_list_defaults_to_the_recent_window(self):
+        self.assertEqual(self._ids(), {self.recent.id})
+
+    def test_created_at_filter_replaces_the_window(self):
+        since = (timezone.now() - timedelta(days=365)).isoformat()
+
+        self.assertEqual(self._ids({"created_at__gte": since}), {self.recent.id, self.old.id})
+        self.assertEqual(
+            self._ids({"created_at__lte": (timezone.now() - timedelta(days=100)).isoformat()}), {self.old.id}
+        )
+
+    @override_settings(AUDIT_LOG_RECENT_WINDOW_DAYS=0)
+    def test_zero_window_lists_everything(self):
+        self.assertEqual(self._ids(), {self.recent.id, self.old.id})
+
+    def test_old_logs_stay_retrievable(self):
+        response = self.client.get(f"/api/activity-logs/{self.old.id}/")
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_scope_bounds_created_at(self):
+        since = timezone.now() - timedelta(days=30)
+
+        scoped = PermissionService.scope_activity_logs(self.admin, ActivityLog.objects.all(), since=since)
+
+        self.assertEqual(list(scoped), [self.recent])
+
+    @override_settings(AUDIT_LOG_RECENT_WINDOW_DAYS=0)
+    def test_created_at_filter_bounds_the_scope(self):
+        since = timezone.now() - timedelta(days=365)
+        scope = mock.patch.object(
+            PermissionService, "scope_activity_logs", wraps=PermissionService.scope_activity_logs
+        )
+
+        with scope as scope_activity_logs:
+            self.assertEqual(self._ids({"created_at__gte": since.isoformat()}), {self.recent.id, self.old.id})
+
+        self.assertEqual(scope_activity_logs.call_args.kwargs["since"], since)
+
+    def test_invalid_created_at_filter_is_rejected(self):
+        response = self.client.get("/api/activity-logs/", {"created_at__gte": "yesterday"})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class RecentWindowDefaultTests(SimpleTestCase):
+    def test_window_is_off_unless_configured(self):
+        self.assertEqual(settings.AUDIT_LOG_RECENT_WINDOW_DAYS, 0)
+
+
+@skipUnless(connection.vendor != "postgresql", "checks the non-Postgres refusal")
+class PartitionCommandOtherVendorTests(TestCase):
+    def test_command_requires_postgres(self):
+        with self.assertRaises(CommandError):
+            call_command("audit_partitions", stdout=StringIO())
+
+
+class PartitionCommandArgumentTests(SimpleTestCase):
+    def test_drop_requires_retain(self):
+        with self.assertRaisesMessage(CommandError, "--drop"):
+            call_command("audit_partitions", "--drop", stdout=StringIO())
+
+
+@skipUnless(connection.vendor == "postgresql", "partitioning is Postgres only")
+class PartitionCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="user@test.com", username="user", role=User.Role.ADMIN)
+        self.now = timezone.now()
+        self.old = self._log(self.now - timedelta(days=400))
+        self.recent = self._log(self.now)
+
+    def _log(self, created_at):
+        log = ActivityLogService.create_log(
+            user=self.user,
+            action_type=ActivityActionType.PROJECT_CREATED,
+            target_type=ActivityTargetType.PROJECT,
+            target_id=1,
+        )
+        ActivityLog.objects.filter(pk=log.pk).update(created_at=created_at)
+        log.created_at = created_at
+        return log
+
+    def _assert_feed_skips_old_partitions(self, user):
+        call_command("audit_partitions", "--convert", stdout=StringIO())
+
+        since = self.now - timedelta(days=20)
+        plan = PermissionService.scope_activity_logs(user, ActivityLog.objects.all(), since=since).explain()
+
+        self.assertIn(partition_name(month_start(self.now)), plan)
+        self.assertNotIn(partition_name(month_start(self.old.created_at)), plan)
+
+    def test_convert_keeps_rows_and_ids(self):
+        with self.assertRaises(CommandError):
+            call_command("audit_partitions", stdout=StringIO())
+
+        call_command("audit_partitions", "--convert", "--ahead", "2", stdout=StringIO())
+
+        self.assertTrue(is_partitioned())
+        self.assertEqual(list_partitions()[-1], add_months(month_start(self.now), 2))
+        self.assertCountEqual(ActivityLog.objects.values_list("id", flat=True), [self.old.id, self.recent.id])
+        newer = self._log(self.now)
+        self.assertGreater(newer.id, self.recent.id)
+        self.assertTrue(ActivityLogParticipant.objects.filter(log=newer).exists())
+
+    def test_recent_window_prunes_old_partitions(self):
+        self._assert_feed_skips_old_partitions(self.user)
+
+    def test_manager_feed_prunes_old_partitions(self):
+        manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        dept = Department.objects.create(name="Engineering", code="ENG")
+        team = Team.objects.create(name="Team A", code="TA", department=dept, manager=manager)
+        Project.objects.create(
+            name="P1", code="P1", team=team, department=dept, start_date="2026-01-01", created_by=manager
+        )
+
+        self._assert_feed_skips_old_partitions(manager)
+
+    def test_employee_feed_prunes_old_partitions(self):
+        employee = User.objects.create_user(email="employee@test.com", username="employee", role=User.Role.EMPLOYEE)
+        dept = Department.objects.create(name="Engineering", code="ENG")
+        team = Team.objects.create(name="Team A", code="TA", department=dept, manager=self.user)
+        project = Project.objects.create(
+            name="P1", code="P1", team=team, department=dept, start_date="2026-01-01", created_by=self.user
+        )
+        Task.objects.create(project=project, title="Task", assigned_to=employee)
+
+        self._assert_feed_skips_old_partitions(employee)
+
+    def test_retention_detaches_old_months(self):
+        call_command("audit_partitions", "--convert", stdout=StringIO())
+
+        call_command("audit_partitions", "--retain", "6", "--drop", stdout=StringIO())
+
+        self.assertNotIn(month_start(self.old.created_at), list_partitions())
+        self.assertFalse(ActivityLog.objects.filter(pk=self.old.pk).exists())
+        self.assertFalse(ActivityLogParticipant.objects.filter(log_id=self.old.pk).exists())
@@ -0,0 +1,124 @@
+from unittest import mock
+
+from django.db import DatabaseError, connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from audit.middleware import AuditBatchMiddleware
+from audit.models import ActivityLog, ActivityLogParticipant
+from audit.services import ActivityActionType, ActivityLogService, ActivityTargetType, audit_batch, log_activity
+from organization.models import Department, Team
+from work.models import Project, Task
+
+
+class AuditBatchTests(TestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="P1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        self.tasks = [Task.objects.create(project=self.project, title=f"Task {index}") for index in range(3)]
+
+    def _log(self, task):
+        log_activity(
+            user=self.manager,
+            action_type=ActivityActionType.TASK_CREATED,
+            target_type=ActivityTargetType.TASK,
+            target_id=task.id,
+            metadata={"title": {"old": None, "new": task.title}},
+        )
+
+    def _log_inserts(self, context):
+        return [query for query in context.captured_queries if query["sql"].startswith('INSERT INTO "audit_activitylog"')]
+
+    def test_batch_writes_every_committed_log_in_one_insert(self):
+        with CaptureQueriesContext(connection) as context:
+            with audit_batch():
+                with self.captureOnCommitCallbacks(execute=True):
+                    for task in self.tasks:
+                        self._log(task)
+                self.assertFalse(ActivityLog.objects.exists())
+
+        self.assertEqual(len(self._log_inserts(context)), 1)
+        logs = ActivityLog.objects.filter(target_type=ActivityTargetType.TASK)
+        self.assertCountEqual(logs.values_list("target_id", flat=True), [task.id for task in self.tasks])
+        self.assertTrue(all(log.project_id == self.project.id for log in logs))
+        self.assertEqual(ActivityLogParticipant.objects.filter(log__in=logs).count(), 3)
+
+    def test_nothing_is_written_before_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._log(self.tasks[0])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(ActivityLog.objects.exists())
+
+    def test_rolled_back_savepoint_drops_its_logs(self):
+        with audit_batch():
+            with self.captureOnCommitCallbacks(execute=True):
+                self._log(self.tasks[0])
+                try:
+                    with transaction.atomic():
+                        self._log(self.tasks[1])
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                with transaction.atomic():
+                    self._log(self.tasks[2])
+
+        self.assertCountEqual(
+            ActivityLog.objects.values_list("target_id", flat=True), [self.tasks[0].id, self.tasks[2].id]
+        )
+
+    def test_nested_batches_join_the_outer_one(self):
+        with CaptureQueriesContext(connection) as context:
+            with audit_batch():
+                with audit_batch(), self.captureOnCommitCallbacks(execute=True):
+                    self._log(self.tasks[0])
+                self.assertFalse(ActivityLog.objects.exists())
+                with self.captureOnCommitCallbacks(execute=True):
+                    self._log(self.tasks[1])
+
+        self.assertEqual(len(self._log_inserts(context)), 1)
+        self.assertEqual(ActivityLog.objects.count(), 2)
+
+    def test_without_a_batch_each_commit_writes_immediately(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._log(self.tasks[0])
+
+        self.assertEqual(ActivityLog.objects.count(), 1)
+
+    def test_middleware_batches_a_request(self):
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                for task in self.tasks:
+                    self._log(task)
+            return HttpResponse()
+
+        with CaptureQueriesContext(connection) as context:
+            AuditBatchMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(len(self._log_inserts(context)), 1)
+        self.assertEqual(ActivityLog.objects.count(), 3)
+
+    def test_failed_flush_keeps_the_response(self):
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._log(self.tasks[0])
+            return HttpResponse(status=201)
+
+        with mock.patch.object(ActivityLogService, "_flush", side_effect=DatabaseError):
+            with self.assertLogs("audit.services", "ERROR"):
+                response = AuditBatchMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_failed_write_without_a_batch_is_logged(self):
+        with mock.patch.object(ActivityLogService, "_flush", side_effect=DatabaseError):
+            with self.assertLogs(level="ERROR"), self.captureOnCommitCallbacks(execute=True):
+                self._log(self.tasks[0])
+
+        self.assertFalse(ActivityLog.objects.exists())
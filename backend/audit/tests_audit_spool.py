@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from audit.ingest import ingest_batch, spool_lag
+from audit.models import ActivityLog, ActivityLogParticipant, AuditSpoolOffset
+from audit.services import ActivityActionType, ActivityTargetType, audit_batch, log_activity
+from audit.spool import append_records
+from organization.models import Department, Team
+from work.models import Project, Task
+
+
+class AuditSpoolTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "audit.ndjson")
+        settings_override = override_settings(AUDIT_SPOOL_PATH=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="P1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        self.task = Task.objects.create(project=self.project, title="Task")
+
+    def _log(self, count=1):
+        with audit_batch(), self.captureOnCommitCallbacks(execute=True):
+            for _ in range(count):
+                log_activity(
+                    user=self.manager,
+                    action_type=ActivityActionType.TASK_CREATED,
+                    target_type=ActivityTargetType.TASK,
+                    target_id=self.task.id,
+                    metadata={"title": {"old": None, "new": self.task.title}},
+                )
+
+    def _record(self, **overrides):
+        return {
+            "user_id": self.manager.id,
+            "action_type": ActivityActionType.TASK_CREATED,
+            "target_type": ActivityTargetType.TASK,
+            "target_id": self.task.id,
+            "metadata": {},
+            "created_at": timezone.now(),
+            **overrides,
+        }
+
+    def _ingest(self):
+        call_command("audit_ingest", "--once", stdout=StringIO())
+
+    def test_committed_logs_go_to_the_spool_not_the_table(self):
+        self._log(count=2)
+
+        self.assertFalse(ActivityLog.objects.exists())
+        with open(self.path, "rb") as spool:
+            self.assertEqual(len(spool.read().splitlines()), 2)
+
+    def test_ingest_loads_scoped_logs_with_participants_and_commit_time(self):
+        self._log()
+        with open(self.path, "rb") as spool:
+            spooled_at = spool.read()
+
+        self._ingest()
+
+        log = ActivityLog.objects.get()
+        self.assertEqual((log.project_id, log.team_id, log.department_id), (self.project.id, self.team.id, self.dept.id))
+        self.assertEqual(ActivityLogParticipant.objects.filter(log=log).count(), 1)
+        self.assertIn(log.created_at.isoformat()[:19].encode(), spooled_at)
+
+    def test_each_record_is_loaded_exactly_once(self):
+        self._log(count=3)
+        self._ingest()
+        self._ingest()
+        self._log()
+        self._ingest()
+
+        self.assertEqual(ActivityLog.objects.count(), 4)
+        self.assertEqual(AuditSpoolOffset.objects.get(path=self.path).offset, os.path.getsize(self.path))
+
+    def test_failed_load_leaves_the_offset_behind(self):
+        self._log(count=2)
+
+        with mock.patch("audit.ingest.load_logs", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                ingest_batch(self.path)
+        self.assertFalse(AuditSpoolOffset.objects.filter(path=self.path, offset__gt=0).exists())
+
+        self.assertEqual(ingest_batch(self.path), (2, 0))
+
+    def test_torn_record_waits_then_is_skipped_once_sealed(self):
+        with open(self.path, "ab") as spool:
+            spool.write(b'{"user_id": 1, "acti')
+
+        self.assertEqual(ingest_batch(self.path), (0, 0))
+
+        append_records(self.path, [self._record()])
+        with self.assertLogs("audit.ingest", "ERROR"):
+            self.assertEqual(ingest_batch(self.path), (1, 1))
+        self.assertEqual(ActivityLog.objects.count(), 1)
+
+    def test_records_of_deleted_users_are_skipped(self):
+        append_records(self.path, [self._record(user_id=self.manager.id + 1000), self._record()])
+
+        with self.assertLogs("audit.ingest", "WARNING"):
+            self.assertEqual(ingest_batch(self.path), (1, 1))
+
+    def test_deleted_participants_are_left_out(self):
+        assignee = User.objects.create_user(email="gone@test.com", username="gone", role=User.Role.EMPLOYEE)
+        append_records(self.path, [
+            self._record(
+                action_type=ActivityActionType.TASK_REASSIGNED,
+                metadata={"assigned_to": {"old": self.manager.id, "new": assignee.id}},
+            ),
+            self._record(
+                action_type=ActivityActionType.USER_ADDED_TO_TEAM,
+                target_type=ActivityTargetType.TEAM,
+                target_id=self.team.id,
+                metadata={"user_id": {"old": None, "new": assignee.id}, "team_id": {"old": None, "new": self.team.id}},
+            ),
+        ])
+        assignee.delete()
+
+        self.assertEqual(ingest_batch(self.path), (2, 0))
+        self.assertEqual(AuditSpoolOffset.objects.get(path=self.path).offset, os.path.getsize(self.path))
+        self.assertEqual(
+            set(ActivityLogParticipant.objects.values_list("user_id", flat=True)), {self.manager.id}
+        )
+
+    @override_settings(AUDIT_SPOOL_ROTATE_BYTES=1)
+    def test_consumed_spool_rotates_and_the_new_file_starts_at_zero(self):
+        self._log()
+        self._ingest()
+        self.assertTrue(os.path.exists(f"{self.path}.consumed"))
+        self.assertFalse(os.path.exists(self.path))
+
+        self._log(count=2)
+        self._ingest()
+
+        self.assertEqual(ActivityLog.objects.count(), 3)
+
+    def test_status_reports_lag(self):
+        append_records(self.path, [self._record(created_at=timezone.now() - timedelta(minutes=5))])
+
+        lag = spool_lag(self.path)
+        self.assertEqual(lag["pending_bytes"], os.path.getsize(self.path))
+        self.assertGreaterEqual(lag["lag_seconds"], 300)
+        with self.assertRaises(CommandError):
+            call_command("audit_ingest", "--status", "--max-lag", "60", stdout=StringIO())
+
+        self._ingest()
+        self.assertEqual(spool_lag(self.path), {"pending_bytes": 0, "lag_seconds": 0.0})
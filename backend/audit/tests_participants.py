@@ -0,0 +1,61 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from audit.models import ActivityLog, ActivityLogParticipant
+from audit.services import ActivityActionType, ActivityLogService, ActivityTargetType
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+
+
+class ActivityLogParticipantTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.other = User.objects.create_user(email="emp2@test.com", username="emp2", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+
+        self.membership_log = ActivityLogService.create_log(
+            user=self.manager,
+            action_type=ActivityActionType.USER_ADDED_TO_TEAM,
+            target_type=ActivityTargetType.TEAM,
+            target_id=self.team.id,
+            metadata={"user_id": {"old": None, "new": self.employee.id}, "team_id": {"old": None, "new": self.team.id}},
+        )
+        self.other_log = ActivityLogService.create_log(
+            user=self.manager,
+            action_type=ActivityActionType.USER_ADDED_TO_TEAM,
+            target_type=ActivityTargetType.TEAM,
+            target_id=self.team.id,
+            metadata={"user_id": {"old": None, "new": self.other.id}, "team_id": {"old": None, "new": self.team.id}},
+        )
+
+    def _participants(self, log):
+        return set(ActivityLogParticipant.objects.filter(log=log).values_list("user_id", "role"))
+
+    def test_create_log_records_actor_and_member(self):
+        self.assertSetEqual(
+            self._participants(self.membership_log),
+            {
+                (self.manager.id, ActivityLogParticipant.Role.ACTOR),
+                (self.employee.id, ActivityLogParticipant.Role.MEMBER),
+            },
+        )
+
+    def test_employee_feed_uses_participants(self):
+        visible = PermissionService.scope_activity_logs(self.employee, ActivityLog.objects.all())
+        self.assertIn(self.membership_log, visible)
+        self.assertNotIn(self.other_log, visible)
+
+    def test_backfill_restores_participants(self):
+        ActivityLogParticipant.objects.all().delete()
+        self.assertFalse(PermissionService.scope_activity_logs(self.employee, ActivityLog.objects.all()).exists())
+
+        call_command("backfill_activity_log_participants", "--batch-size", "1", stdout=StringIO())
+        call_command("backfill_activity_log_participants", stdout=StringIO())
+
+        self.assertEqual(ActivityLogParticipant.objects.count(), 4)
+        self.assertIn(self.membership_log, PermissionService.scope_activity_logs(self.employee, ActivityLog.objects.all()))
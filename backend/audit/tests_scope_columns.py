@@ -0,0 +1,73 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from audit.models import ActivityLog
+from audit.services import ActivityActionType, ActivityLogService, ActivityTargetType
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from work.models import Project, Task
+
+
+class ActivityLogScopeColumnTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", role=User.Role.ADMIN)
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.other_manager = User.objects.create_user(email="manager2@test.com", username="manager2", role=User.Role.MANAGER)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.other_team = Team.objects.create(name="Team B", code="TB", department=self.dept, manager=self.other_manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.admin
+        )
+        self.task = Task.objects.create(project=self.project, title="Task 1")
+
+    def _log(self, target_type, target_id, metadata=None, action_type=ActivityActionType.TASK_STATUS_CHANGED):
+        return ActivityLogService.create_log(
+            user=self.admin,
+            action_type=action_type,
+            target_type=target_type,
+            target_id=target_id,
+            metadata=metadata or {"status": {"old": "TODO", "new": "DONE"}},
+        )
+
+    def _scope(self, log):
+        return (log.project_id, log.team_id, log.department_id)
+
+    def test_create_log_records_scope(self):
+        task_log = self._log(ActivityTargetType.TASK, self.task.id)
+        team_log = self._log(
+            ActivityTargetType.TEAM,
+            self.team.id,
+            {"user_id": {"old": None, "new": self.manager.id}, "team_id": {"old": None, "new": self.team.id}},
+            ActivityActionType.USER_ADDED_TO_TEAM,
+        )
+
+        self.assertEqual(self._scope(task_log), (self.project.id, self.team.id, self.dept.id))
+        self.assertEqual(self._scope(team_log), (None, self.team.id, self.dept.id))
+
+    def test_deleted_task_falls_back_to_metadata_project(self):
+        task_id = self.task.id
+        self.task.delete()
+        log = self._log(
+            ActivityTargetType.TASK,
+            task_id,
+            {"project_id": {"old": self.project.id, "new": None}, "status": {"old": "TODO", "new": None}},
+            ActivityActionType.TASK_DELETED,
+        )
+
+        self.assertEqual(self._scope(log), (self.project.id, self.team.id, self.dept.id))
+        self.assertIn(log, PermissionService.scope_activity_logs(self.manager, ActivityLog.objects.all()))
+        self.assertNotIn(log, PermissionService.scope_activity_logs(self.other_manager, ActivityLog.objects.all()))
+
+    def test_backfill_fills_missing_scope_in_batches(self):
+        logs = [self._log(ActivityTargetType.TASK, self.task.id) for _ in range(3)]
+        ActivityLog.objects.update(project_id=None, team_id=None, department_id=None)
+
+        call_command("backfill_activity_log_scope", "--batch-size", "2", stdout=StringIO())
+
+        for log in logs:
+            log.refresh_from_db()
+            self.assertEqual(self._scope(log), (self.project.id, self.team.id, self.dept.id))
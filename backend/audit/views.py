@@ -1,5 +1,11 @@
+from datetime import timedelta
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db.models import TextField
 from django.db.models.functions import Cast
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, viewsets
 from rest_framework.pagination import PageNumberPagination
@@ -49,7 +55,28 @@ class ActivityLogViewSet(BaseScopedReadOnlyViewSet):
             .order_by("-created_at")
         )
 
-        return PermissionService.scope_activity_logs(user, base_queryset)
+        return PermissionService.scope_activity_logs(user, base_queryset, since=self._feed_since())
+
+    def _feed_since(self):
+        """
+        Lower created_at bound of the list: the client's created_at__gte, or
+        with AUDIT_LOG_RECENT_WINDOW_DAYS set and no created_at filter, the
+        recent window. Passed down so every visibility subquery reads only
+        the newest partitions instead of the whole history.
+        """
+        if self.action != "list":
+            return None
+        params = self.request.query_params
+        if "created_at__gte" in params:
+            try:
+                return forms.DateTimeField().clean(params["created_at__gte"])
+            except ValidationError:
+                # The filter backend rejects the value with a 400.
+                return None
+        window_days = settings.AUDIT_LOG_RECENT_WINDOW_DAYS
+        if not window_days or "created_at__lte" in params:
+            return None
+        return timezone.now() - timedelta(days=window_days)
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
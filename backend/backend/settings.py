@@ -64,6 +64,9 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.permissions.middleware.PermissionDecisionCacheMiddleware",
+    "core.permissions.middleware.PermissionInstrumentationMiddleware",
+    "audit.middleware.AuditBatchMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -150,7 +153,7 @@ AUTH_USER_MODEL = "accounts.User"
 # ---------------------------
 REST_FRAMEWORK={
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.StatelessJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -163,6 +166,33 @@ REST_FRAMEWORK={
 }
 
 
+# ---------------------------
+# PERMISSIONS
+# ---------------------------
+# Memoize PermissionService decisions for the length of one request.
+PERMISSION_DECISION_CACHE_ENABLED = env.bool("PERMISSION_DECISION_CACHE_ENABLED", default=True)
+# Time permission checks and attribute SQL queries to them (X-Permission-Stats header).
+PERMISSION_INSTRUMENTATION_ENABLED = env.bool("PERMISSION_INSTRUMENTATION_ENABLED", default=False)
+# Share team member ids and project managers across workers through the cache.
+PERMISSION_SHARED_CACHE_ENABLED = env.bool("PERMISSION_SHARED_CACHE_ENABLED", default=False)
+PERMISSION_SHARED_CACHE_ALIAS = env.str("PERMISSION_SHARED_CACHE_ALIAS", default="default")
+PERMISSION_SHARED_CACHE_TIMEOUT = env.int("PERMISSION_SHARED_CACHE_TIMEOUT", default=300)
+
+
+# ---------------------------
+# AUDIT
+# ---------------------------
+# Append deferred activity logs to this NDJSON spool for `manage.py audit_ingest`
+# to load, instead of inserting them during the request. Unset writes directly.
+AUDIT_SPOOL_PATH = env.str("AUDIT_SPOOL_PATH", default=None)
+# audit_ingest rotates a fully loaded spool once it has grown past this size.
+AUDIT_SPOOL_ROTATE_BYTES = env.int("AUDIT_SPOOL_ROTATE_BYTES", default=64 * 1024 * 1024)
+# When set, the activity feed lists only this many recent days unless a
+# created_at filter is given, so partitioned log tables read only their newest
+# partitions. 0 (the default) lists the whole history.
+AUDIT_LOG_RECENT_WINDOW_DAYS = env.int("AUDIT_LOG_RECENT_WINDOW_DAYS", default=0)
+
+
 # ---------------------------
 # SIMPLE JWT CONFIGURATION
 # ---------------------------
@@ -185,6 +215,11 @@ SIMPLE_JWT = {
     
 }
 
+# Build request.user from token claims instead of loading the users row.
+JWT_STATELESS_USER = env.bool("JWT_STATELESS_USER", default=False)
+# How long a user's token version may be served from cache, in seconds.
+JWT_TOKEN_VERSION_CACHE_TIMEOUT = env.int("JWT_TOKEN_VERSION_CACHE_TIMEOUT", default=30)
+
 # ---------------------------
 # GITHUB OAUTH CONFIGURATION
 # ---------------------------
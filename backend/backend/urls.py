@@ -8,5 +8,6 @@ urlpatterns = [
     path("api/organization/", include("organization.urls")),
     path("api/work/", include("work.urls")),
     path("api/", include("audit.urls")),
+    path("api/core/", include("core.urls")),
     path("api/integrations/github/", include("integrations.github.urls")),
 ]
\ No newline at end of file
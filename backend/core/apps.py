@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = 'core'
+
+    def ready(self):
+        from django.conf import settings
+
+        import core.permissions.signals
+
+        if settings.PERMISSION_INSTRUMENTATION_ENABLED:
+            from core.permissions.instrumentation import install_instrumentation
+
+            install_instrumentation()
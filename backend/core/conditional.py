@@ -0,0 +1,64 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class ConditionalGetMixin:
+    """
+    ETag support for list and retrieve. Each response carries a weak ETag
+    derived from the requesting user, the full path and a cheap version of
+    the data behind it; a matching If-None-Match gets a 304 before anything
+    is serialized.
+
+    By default a list is versioned by the row count and newest
+    ``etag_updated_field`` of the filtered queryset, and an object by its own
+    ``etag_updated_field``. Override get_list_version/get_object_version when
+    a cheaper source exists.
+    """
+
+    etag_updated_field = "updated_at"
+
+    def get_list_version(self, queryset):
+        version = queryset.order_by().aggregate(count=Count("pk"), last=Max(self.etag_updated_field))
+        return version["count"], version["last"]
+
+    def get_object_version(self, obj):
+        return getattr(obj, self.etag_updated_field)
+
+    def get_etag(self, version):
+        user = self.request.user
+        raw = "|".join(str(part) for part in (
+            user.pk,
+            getattr(user, "role", ""),
+            self.request.get_full_path(),
+            version,
+        ))
+        return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+    def _etag_matches(self, etag):
+        header = self.request.headers.get("If-None-Match")
+        if not header:
+            return False
+        # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+        candidates = {tag.removeprefix("W/") for tag in parse_etags(header)}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+
+    def _conditional_response(self, version, render):
+        etag = self.get_etag(version)
+        if self._etag_matches(etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = render()
+        response["ETag"] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        version = self.get_list_version(self.filter_queryset(self.get_queryset()))
+        return self._conditional_response(version, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        version = self.get_object_version(self.get_object())
+        return self._conditional_response(version, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs))
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.perf.plans import budget_key, budget_violations, iter_cases, load_budgets, measure_case, save_budgets
+from core.perf.synthetic_org import seed_synthetic_org
+
+
+DEFAULT_MAX_MS = 50
+
+
+class Command(BaseCommand):
+    help = (
+        "Loads a synthetic org into a throwaway test database and reports query "
+        "counts, execution time and sequential scans for every PermissionService "
+        "scope_* and *_for_id call."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=100, help="Number of synthetic teams to load.")
+        parser.add_argument(
+            "--record",
+            action="store_true",
+            help="Write the measurements to core/perf/budgets.json as the new budgets.",
+        )
+
+    def handle(self, *args, **options):
+        with_plans = connection.vendor == "postgresql"
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            sample = seed_synthetic_org(teams=options["teams"])
+            if with_plans:
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE")
+            measurements = {
+                budget_key(name, role): measure_case(func, with_plans=with_plans)
+                for name, role, func in iter_cases(sample)
+            }
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        budgets = load_budgets()
+        for key, measurement in sorted(measurements.items()):
+            line = f"{key:<45} queries={measurement['queries']}"
+            if with_plans:
+                line += f" time={measurement['execution_ms']:.1f}ms seq_scans={','.join(measurement['seq_scans']) or '-'}"
+            violations = budget_violations(measurement, budgets[key]) if key in budgets else ["no recorded budget"]
+            style = self.style.ERROR if violations else self.style.SUCCESS
+            self.stdout.write(style(f"{line} {'; '.join(violations)}".rstrip()))
+
+        if options["record"]:
+            for key, measurement in measurements.items():
+                budget = budgets.setdefault(key, {"max_ms": DEFAULT_MAX_MS, "allow_seq_scan": []})
+                budget["queries"] = measurement["queries"]
+                if with_plans:
+                    # Leave headroom for noisy CI machines.
+                    budget["max_ms"] = max(DEFAULT_MAX_MS, round(measurement["execution_ms"] * 3))
+                    budget["allow_seq_scan"] = measurement["seq_scans"]
+            save_budgets(budgets)
+            self.stdout.write(f"Recorded budgets for {len(measurements)} cases.")
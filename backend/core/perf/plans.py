@@ -0,0 +1,157 @@
+"""
+Query-plan inspection for PermissionService. Each case names one scope_*
+or can_*_for_id call for one role; budgets.json records how many queries
+it may issue, how long it may run and which guarded tables it may
+sequentially scan.
+"""
+
+import json
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from audit.models import ActivityLog
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+BUDGETS_PATH = Path(__file__).with_name("budgets.json")
+
+GUARDED_TABLES = {"work_task", "work_assignment", "audit_activitylog"}
+
+ROLES = ("admin", "manager", "employee")
+
+
+def scope_cases(sample):
+    """
+    (name, callable(user) -> queryset) for every scope_* method.
+    """
+    return [
+        ("scope_visible_users", lambda user: PermissionService.scope_visible_users(user, User.objects.all())),
+        ("scope_departments", lambda user: PermissionService.scope_departments(user, Department.objects.all())),
+        ("scope_projects", lambda user: PermissionService.scope_projects(user, Project.objects.all())),
+        ("scope_tasks", lambda user: PermissionService.scope_tasks(
+            user, Task.objects.filter(project_id=sample["project_id"])
+        )),
+        ("scope_assignments", lambda user: PermissionService.scope_assignments(user, Assignment.objects.all())),
+        ("scope_user_assignments", lambda user: PermissionService.scope_user_assignments(
+            user, sample["employee"].id, Assignment.objects.all(), status="current"
+        )),
+        ("scope_project_assignments", lambda user: PermissionService.scope_project_assignments(
+            user, sample["project_id"], Assignment.objects.all(), status="current"
+        )),
+        ("scope_teams", lambda user: PermissionService.scope_teams(user, Team.objects.all())),
+        ("scope_activity_logs", lambda user: PermissionService.scope_activity_logs(
+            user, ActivityLog.objects.order_by("-created_at")
+        )[:20]),
+    ]
+
+
+def decision_cases(sample):
+    """
+    (name, callable(user) -> bool) for every *_for_id check.
+    """
+    project_id = sample["project_id"]
+    task_id = sample["task_id"]
+    return [
+        ("can_create_project_for_team_id", lambda user: PermissionService.can_create_project_for_team_id(user, sample["team_id"])),
+        ("is_project_member_for_id", lambda user: PermissionService.is_project_member_for_id(user, project_id)),
+        ("can_view_project_for_id", lambda user: PermissionService.can_view_project_for_id(user, project_id)),
+        ("can_update_project_for_id", lambda user: PermissionService.can_update_project_for_id(user, project_id)),
+        ("can_delete_project_for_id", lambda user: PermissionService.can_delete_project_for_id(user, project_id)),
+        ("can_assign_user_for_project_id", lambda user: PermissionService.can_assign_user_for_project_id(user, project_id)),
+        ("can_create_task_for_project_id", lambda user: PermissionService.can_create_task_for_project_id(user, project_id)),
+        ("can_view_task_collection", lambda user: PermissionService.can_view_task_collection(user, project_id)),
+        ("can_view_task_for_id", lambda user: PermissionService.can_view_task_for_id(user, task_id)),
+        ("can_update_task_for_id", lambda user: PermissionService.can_update_task_for_id(user, task_id)),
+        ("can_delete_task_for_id", lambda user: PermissionService.can_delete_task_for_id(user, task_id)),
+    ]
+
+
+def budget_key(name, role):
+    return f"{name}:{role}"
+
+
+def load_budgets():
+    with open(BUDGETS_PATH) as handle:
+        return json.load(handle)
+
+
+def save_budgets(budgets):
+    with open(BUDGETS_PATH, "w") as handle:
+        json.dump(budgets, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def count_queries(func):
+    """
+    Runs func and returns (result, captured SQL statements).
+    """
+    with CaptureQueriesContext(connection) as context:
+        result = func()
+        if hasattr(result, "query"):
+            result = list(result)
+    return result, [query["sql"] for query in context.captured_queries]
+
+
+def explain(sql):
+    """
+    Runs EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) on PostgreSQL and returns
+    the top-level plan document.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+        document = cursor.fetchone()[0]
+    if isinstance(document, str):
+        document = json.loads(document)
+    return document[0]
+
+
+def iter_plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def seq_scanned_tables(document):
+    return {
+        node["Relation Name"]
+        for node in iter_plan_nodes(document["Plan"])
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in GUARDED_TABLES
+    }
+
+
+def measure_case(func, *, with_plans):
+    """
+    Executes one case and returns its measurements: query count and, on
+    PostgreSQL, total execution time and the guarded tables it seq-scans.
+    """
+    _, statements = count_queries(func)
+    measurement = {"queries": len(statements)}
+    if with_plans:
+        documents = [explain(sql) for sql in statements]
+        measurement["execution_ms"] = sum(document["Execution Time"] for document in documents)
+        measurement["seq_scans"] = sorted(set().union(*(seq_scanned_tables(document) for document in documents)))
+    return measurement
+
+
+def budget_violations(measurement, budget):
+    violations = []
+    if measurement["queries"] > budget["queries"]:
+        violations.append(f"{measurement['queries']} queries (budget {budget['queries']})")
+    if "execution_ms" in measurement and measurement["execution_ms"] > budget["max_ms"]:
+        violations.append(f"{measurement['execution_ms']:.1f} ms (budget {budget['max_ms']} ms)")
+    unexpected = set(measurement.get("seq_scans", [])) - set(budget["allow_seq_scan"])
+    if unexpected:
+        violations.append(f"sequential scan on {', '.join(sorted(unexpected))}")
+    return violations
+
+
+def iter_cases(sample):
+    for name, build in scope_cases(sample) + decision_cases(sample):
+        for role in ROLES:
+            user = sample[role]
+            yield name, role, (lambda build=build, user=user: build(user))
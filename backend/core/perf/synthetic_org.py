@@ -0,0 +1,158 @@
+"""
+Bulk loader for a synthetic organization used by the permission query-plan
+suite. Rows are written with bulk_create so that tens of thousands of tasks
+and activity logs load in seconds; derived tables are rebuilt afterwards.
+"""
+
+import random
+
+from accounts.models import User
+from audit.models import ActivityLog, ActivityLogParticipant
+from audit.services import log_participants
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+from work.services.project_access import rebuild_project_access
+from work.services.task_stats import refresh_task_stats
+
+
+PROJECTS_PER_TEAM = 10
+EMPLOYEES_PER_TEAM = 20
+ASSIGNMENTS_PER_PROJECT = 8
+TASKS_PER_PROJECT = 50
+LOGS_PER_TASK = 2
+TEAMS_PER_DEPARTMENT = 10
+
+
+def _bulk(model, objects):
+    return model.objects.bulk_create(objects, batch_size=2000)
+
+
+def seed_synthetic_org(teams=100, seed=0):
+    """
+    Loads `teams` teams worth of departments, users, projects, assignments,
+    tasks and activity logs. Returns a sample of ids per role that the
+    query-plan cases use as their subjects.
+    """
+    rng = random.Random(seed)
+    prefix = f"syn{seed}"
+
+    departments = _bulk(Department, [
+        Department(name=f"{prefix} Department {index}", code=f"{prefix}D{index}")
+        for index in range(max(1, teams // TEAMS_PER_DEPARTMENT))
+    ])
+
+    admin = User.objects.create_user(
+        email=f"{prefix}-admin@synthetic.test",
+        username=f"{prefix}-admin",
+        role=User.Role.ADMIN,
+    )
+
+    managers = _bulk(User, [
+        User(
+            email=f"{prefix}-manager{index}@synthetic.test",
+            username=f"{prefix}-manager{index}",
+            role=User.Role.MANAGER,
+            password="!",
+            department=departments[index % len(departments)],
+        )
+        for index in range(teams)
+    ])
+
+    team_rows = _bulk(Team, [
+        Team(
+            name=f"{prefix} Team {index}",
+            code=f"{prefix}T{index}",
+            department=managers[index].department,
+            manager=managers[index],
+            created_by=admin,
+        )
+        for index in range(teams)
+    ])
+
+    employees = _bulk(User, [
+        User(
+            email=f"{prefix}-employee{index}@synthetic.test",
+            username=f"{prefix}-employee{index}",
+            role=User.Role.EMPLOYEE,
+            password="!",
+            department=team_rows[index % teams].department,
+            team=team_rows[index % teams],
+        )
+        for index in range(teams * EMPLOYEES_PER_TEAM)
+    ])
+    members_by_team = {}
+    for employee in employees:
+        members_by_team.setdefault(employee.team_id, []).append(employee)
+
+    projects = _bulk(Project, [
+        Project(
+            name=f"{prefix} Project {index}",
+            code=f"{prefix}P{index}",
+            team=team_rows[index % teams],
+            manager=team_rows[index % teams].manager,
+            department=team_rows[index % teams].department,
+            start_date="2026-01-01",
+            created_by=admin,
+        )
+        for index in range(teams * PROJECTS_PER_TEAM)
+    ])
+
+    assignments = []
+    assignees_by_project = {}
+    for project in projects:
+        members = rng.sample(members_by_team[project.team_id], ASSIGNMENTS_PER_PROJECT)
+        assignees_by_project[project.id] = members
+        assignments.extend(
+            Assignment(
+                project=project,
+                user=member,
+                role=Assignment.Role.SOFTWARE_ENGINEER,
+                assigned_by=project.manager,
+            )
+            for member in members
+        )
+    _bulk(Assignment, assignments)
+
+    tasks = []
+    for project in projects:
+        for index in range(TASKS_PER_PROJECT):
+            status = rng.choice(Task.Status.values)
+            tasks.append(Task(
+                project=project,
+                assigned_to=rng.choice(assignees_by_project[project.id]),
+                title=f"{project.code} task {index}",
+                priority=rng.choice(Task.Priority.values),
+                status=status,
+                created_by=project.manager,
+            ))
+    tasks = _bulk(Task, tasks)
+
+    logs = []
+    for task in tasks:
+        for _ in range(LOGS_PER_TASK):
+            logs.append(ActivityLog(
+                user=task.assigned_to,
+                action_type="TASK_STATUS_CHANGED",
+                target_type="TASK",
+                target_id=task.id,
+                metadata={"status": {"old": "TODO", "new": task.status}},
+                project_id=task.project_id,
+                team_id=task.project.team_id,
+                department_id=task.project.department_id,
+            ))
+    logs = _bulk(ActivityLog, logs)
+    _bulk(ActivityLogParticipant, [participant for log in logs for participant in log_participants(log)])
+
+    rebuild_project_access()
+    refresh_task_stats([project.id for project in projects])
+
+    sample_project = projects[0]
+    sample_task = next(task for task in tasks if task.project_id == sample_project.id)
+    return {
+        "admin": admin,
+        "manager": sample_project.manager,
+        "employee": sample_task.assigned_to,
+        "project_id": sample_project.id,
+        "team_id": sample_project.team_id,
+        "task_id": sample_task.id,
+    }
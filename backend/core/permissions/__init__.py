@@ -1,6 +1,6 @@
 from .role_permissions import IsAdmin, IsManager, IsEmployee, IsAdminOrManager, IsSelfOrAdmin
 from .project_permissions import ProjectPermission, UserProjectPermission
-from .task_permissions import TaskPermission
+from .task_permissions import TaskPermission, UserTaskPermission
 from .assignment_permissions import AssignmentPermission
 from .team_permissions import TeamPermission, IsAdminOrTeamManager
 from .user_permissions import UserPermission
@@ -0,0 +1,42 @@
+import copy
+
+from organization.models import Team
+from work.models import Project
+
+
+class AccessContext:
+    """
+    What a request acts on, resolved once per request by BaseScopedViewSet:
+    the user, the target object, and the project and team it belongs to.
+    Views and serializers read from here instead of loading them again.
+
+    `original` is a shallow copy of the object taken when it was resolved,
+    so write hooks can diff against it after the serializer has changed obj.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.obj = None
+        self.original = None
+        self.project = None
+        self._team = None
+
+    def bind(self, obj):
+        self.obj = obj
+        self.original = copy.copy(obj)
+        if isinstance(obj, Project):
+            self.project = obj
+        elif isinstance(obj, Team):
+            self._team = obj
+        else:
+            self.project = getattr(obj, "project", None)
+
+    def verified(self, obj):
+        """True if obj passed the view's scoping and object permissions."""
+        return obj is not None and obj is self.obj
+
+    @property
+    def team(self):
+        if self._team is None and self.project is not None:
+            self._team = self.project.team
+        return self._team
@@ -0,0 +1,152 @@
+"""
+Opt-in timing and query attribution for permission checks.
+
+When PERMISSION_INSTRUMENTATION_ENABLED is set, every PermissionService
+static method and every DRF permission class exported by core.permissions is
+wrapped to record call counts, wall time and SQL queries issued inside the
+call. Nested calls are recorded per method, but only outermost calls count
+towards the per-request totals so time is not counted twice.
+"""
+
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from types import ModuleType
+
+from django.db import connection
+from rest_framework.permissions import BasePermission
+
+from .services import PermissionService
+
+
+PERMISSION_CLASS_METHODS = ("has_permission", "has_object_permission")
+
+_request_stats = contextvars.ContextVar("permission_request_stats", default=None)
+_call_depth = contextvars.ContextVar("permission_call_depth", default=0)
+
+_totals_lock = threading.Lock()
+_method_totals = defaultdict(lambda: {"calls": 0, "time_ms": 0.0, "queries": 0})
+
+# (owner, attribute) -> original class attribute, for uninstall.
+_originals = {}
+
+
+class PermissionRequestStats:
+    """Permission-check totals for one request."""
+
+    def __init__(self):
+        self.calls = 0
+        self.time_ms = 0.0
+        self.queries = 0
+
+    def as_header(self):
+        return f"calls={self.calls}; time_ms={self.time_ms:.2f}; queries={self.queries}"
+
+
+@contextmanager
+def permission_request_stats():
+    stats = PermissionRequestStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+def method_totals():
+    with _totals_lock:
+        return {name: dict(totals) for name, totals in _method_totals.items()}
+
+
+def reset_method_totals():
+    with _totals_lock:
+        _method_totals.clear()
+
+
+def _record(name, elapsed_ms, queries, outermost):
+    with _totals_lock:
+        totals = _method_totals[name]
+        totals["calls"] += 1
+        totals["time_ms"] += elapsed_ms
+        totals["queries"] += queries
+
+    stats = _request_stats.get()
+    if outermost and stats is not None:
+        stats.calls += 1
+        stats.time_ms += elapsed_ms
+        stats.queries += queries
+
+
+def _instrument(name, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        depth = _call_depth.get()
+        token = _call_depth.set(depth + 1)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_query):
+                return func(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            _call_depth.reset(token)
+            _record(name, elapsed_ms, queries, outermost=depth == 0)
+
+    return wrapper
+
+
+def _permission_classes():
+    from core import permissions
+
+    modules = [
+        value for value in vars(permissions).values()
+        if isinstance(value, ModuleType) and value.__name__.startswith(f"{permissions.__name__}.")
+    ]
+    return [
+        value
+        for module in modules
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, BasePermission)
+        and value.__module__ == module.__name__
+    ]
+
+
+def _replace(owner, attribute, value):
+    _originals[(owner, attribute)] = owner.__dict__[attribute]
+    setattr(owner, attribute, value)
+
+
+def instrumentation_installed():
+    return bool(_originals)
+
+
+def install_instrumentation():
+    if _originals:
+        return
+
+    for attribute, value in list(vars(PermissionService).items()):
+        if isinstance(value, staticmethod):
+            wrapped = _instrument(f"PermissionService.{attribute}", value.__func__)
+            _replace(PermissionService, attribute, staticmethod(wrapped))
+
+    for permission_class in _permission_classes():
+        for attribute in PERMISSION_CLASS_METHODS:
+            if attribute in permission_class.__dict__:
+                method = permission_class.__dict__[attribute]
+                _replace(permission_class, attribute, _instrument(f"{permission_class.__name__}.{attribute}", method))
+
+
+def uninstall_instrumentation():
+    for (owner, attribute), original in _originals.items():
+        setattr(owner, attribute, original)
+    _originals.clear()
@@ -0,0 +1,82 @@
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .instrumentation import permission_request_stats
+from .services import permission_decision_cache
+
+
+logger = logging.getLogger(__name__)
+
+_totals_lock = threading.Lock()
+_decision_cache_totals = defaultdict(lambda: {"requests": 0, "hits": 0, "misses": 0})
+
+
+def record_decision_cache_stats(view_name, stats):
+    with _totals_lock:
+        totals = _decision_cache_totals[view_name]
+        totals["requests"] += 1
+        totals["hits"] += stats["hits"]
+        totals["misses"] += stats["misses"]
+
+
+def decision_cache_totals():
+    with _totals_lock:
+        return {view_name: dict(totals) for view_name, totals in _decision_cache_totals.items()}
+
+
+def reset_decision_cache_totals():
+    with _totals_lock:
+        _decision_cache_totals.clear()
+
+
+class PermissionDecisionCacheMiddleware:
+    """
+    Scopes PermissionService decision memoization to a single request and
+    records how many permission lookups were answered from the cache.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with permission_decision_cache() as cache:
+            response = self.get_response(request)
+
+        if cache is not None:
+            match = getattr(request, "resolver_match", None)
+            view_name = match.view_name if match else request.path
+            stats = cache.stats()
+            record_decision_cache_stats(view_name, stats)
+            logger.debug(
+                "Permission decision cache for %s: %s hits, %s misses",
+                view_name,
+                stats["hits"],
+                stats["misses"],
+            )
+
+        return response
+
+
+class PermissionInstrumentationMiddleware:
+    """
+    Reports the permission-check totals of each request in the
+    X-Permission-Stats header. Only active with PERMISSION_INSTRUMENTATION_ENABLED.
+    """
+
+    header = "X-Permission-Stats"
+
+    def __init__(self, get_response):
+        if not settings.PERMISSION_INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with permission_request_stats() as stats:
+            response = self.get_response(request)
+
+        response[self.header] = stats.as_header()
+        return response
@@ -1,11 +1,37 @@
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
+from .access_context import AccessContext
+
 
 # CRITICAL: NEVER bypass PermissionService for access control.
 class BaseScopedViewSet(ModelViewSet):
+    access_context = None
+
     def get_queryset(self):
         raise NotImplementedError("Must use PermissionService scoping")
 
+    def get_access_context(self):
+        if self.access_context is None:
+            self.access_context = AccessContext(self.request.user)
+        return self.access_context
+
+    def get_object(self):
+        # Scoping and object permissions run once; later calls reuse the result.
+        context = self.get_access_context()
+        if context.obj is None:
+            context.bind(super().get_object())
+        return context.obj
+
+    def get_snapshot(self):
+        """The target object as it was before this request changed it."""
+        self.get_object()
+        return self.get_access_context().original
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["access"] = self.get_access_context()
+        return context
+
 
 # CRITICAL: NEVER bypass PermissionService for access control.
 class BaseScopedReadOnlyViewSet(ReadOnlyModelViewSet):
@@ -1,9 +1,17 @@
-from django.db.models import Q, TextField
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q, TextField
 from django.db.models.functions import Cast
 
 from accounts.models import User
+from audit.models import ActivityLog, ActivityLogParticipant
 from organization.models import Department, Team
-from work.models import Assignment, Project, Task
+from work.models import Assignment, Project, ProjectAccess, Task
+
+from .shared_cache import project_managed_by, team_has_member
 
 
 # CRITICAL: NEVER bypass PermissionService for access control.
@@ -18,6 +26,129 @@ def _validate_scope_inputs(user, queryset):
         raise ValueError("User role must be valid")
 
 
+def _accessible_project_ids(user, *access_kinds):
+    return ProjectAccess.objects.filter(user=user, access_kind__in=access_kinds).values("project_id")
+
+
+# ---------------- BULK RULES ---------------- #
+
+def _active_membership(user, project_ref):
+    return Exists(
+        Assignment.objects.filter(project_id=OuterRef(project_ref), user_id=user.id, is_active=True)
+    )
+
+
+def _team_membership(user):
+    return Exists(User.objects.filter(id=user.id, team_id=OuterRef("pk")))
+
+
+def _manager_only(q):
+    return lambda user: q(user) if PermissionService.is_manager(user) else None
+
+
+# (target type, action) -> (model, rule). Each rule mirrors the matching
+# single-object check for non-admin users; None means nothing is permitted.
+_BULK_RULES = {
+    ("PROJECT", "view"): (Project, lambda user: Q(manager_id=user.id) | _active_membership(user, "pk")),
+    ("PROJECT", "update"): (Project, lambda user: Q(manager_id=user.id)),
+    ("PROJECT", "delete"): (Project, lambda user: Q(manager_id=user.id)),
+    ("TASK", "view"): (Task, lambda user: Q(project__manager_id=user.id) | _active_membership(user, "project_id")),
+    ("TASK", "update"): (Task, lambda user: Q(project__manager_id=user.id) | Q(assigned_to_id=user.id)),
+    ("TASK", "delete"): (Task, lambda user: Q(project__manager_id=user.id)),
+    ("TEAM", "view"): (Team, lambda user: Q(manager_id=user.id) | _team_membership(user)),
+    ("TEAM", "manage"): (Team, _manager_only(lambda user: Q(manager_id=user.id))),
+    ("ASSIGNMENT", "view"): (Assignment, lambda user: Q(project__manager_id=user.id) | Q(user_id=user.id)),
+    ("ASSIGNMENT", "update"): (Assignment, lambda user: Q(project__manager_id=user.id)),
+}
+
+
+def _normalize_ids(ids):
+    normalized = set()
+    for value in ids:
+        try:
+            normalized.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return normalized
+
+
+# ---------------- DECISION CACHE ---------------- #
+
+_decision_cache = contextvars.ContextVar("permission_decision_cache", default=None)
+
+
+class PermissionDecisionCache:
+    """
+    Memoizes permission decisions for the lifetime of one request.
+    Keys are (method name, user id, target id).
+    """
+
+    def __init__(self):
+        self.decisions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.decisions.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+
+@contextmanager
+def permission_decision_cache():
+    """
+    Opens a decision cache scope. Yields None when the cache is disabled
+    through PERMISSION_DECISION_CACHE_ENABLED.
+    """
+    if not getattr(settings, "PERMISSION_DECISION_CACHE_ENABLED", True):
+        yield None
+        return
+
+    cache = PermissionDecisionCache()
+    token = _decision_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _decision_cache.reset(token)
+
+
+def clear_permission_decision_cache():
+    cache = _decision_cache.get()
+    if cache is not None:
+        cache.clear()
+
+
+def _decision_key_part(value):
+    value = getattr(value, "pk", value)
+    return None if value is None else str(value)
+
+
+def _memoize_decision(func):
+    @wraps(func)
+    def wrapper(user, target):
+        cache = _decision_cache.get()
+        if cache is None:
+            return func(user, target)
+
+        user_id = _decision_key_part(user)
+        target_id = _decision_key_part(target)
+        if user_id is None or target_id is None:
+            return func(user, target)
+
+        key = (func.__name__, user_id, target_id)
+        if key in cache.decisions:
+            cache.hits += 1
+            return cache.decisions[key]
+
+        cache.misses += 1
+        decision = func(user, target)
+        cache.decisions[key] = decision
+        return decision
+
+    return wrapper
+
+
 class PermissionService:
 
     # ---------------- COMMON ---------------- #
@@ -68,9 +199,9 @@ class PermissionService:
         if PermissionService.is_admin(user):
             return queryset
         if PermissionService.is_manager(user):
-            return queryset.filter(manager=user)
+            return queryset.filter(id__in=_accessible_project_ids(user, ProjectAccess.Kind.MANAGER))
         if PermissionService.is_employee(user):
-            return queryset.filter(assignments__user=user, assignments__is_active=True).distinct()
+            return queryset.filter(id__in=_accessible_project_ids(user, ProjectAccess.Kind.MEMBER))
         return queryset.none()
 
     @staticmethod
@@ -79,7 +210,7 @@ class PermissionService:
         if PermissionService.is_admin(user):
             return queryset
         if PermissionService.is_manager(user):
-            return queryset.filter(project__manager=user)
+            return queryset.filter(project_id__in=_accessible_project_ids(user, ProjectAccess.Kind.MANAGER))
         if PermissionService.is_employee(user):
             return queryset.filter(assigned_to=user)
         return queryset.none()
@@ -90,7 +221,7 @@ class PermissionService:
         if PermissionService.is_admin(user):
             return queryset
         if PermissionService.is_manager(user):
-            return queryset.filter(project__manager=user)
+            return queryset.filter(project_id__in=_accessible_project_ids(user, ProjectAccess.Kind.MANAGER))
         if PermissionService.is_employee(user):
             return queryset.filter(user=user)
         return queryset.none()
@@ -133,54 +264,80 @@ class PermissionService:
         return queryset.none()
 
     @staticmethod
-    def scope_activity_logs(user, queryset):
+    def scope_activity_logs(user, queryset, *, since=None):
+        """
+        `since` bounds created_at in the feed and in each visibility
+        subquery, which lets Postgres skip older partitions of a partitioned
+        log table.
+        """
         _validate_scope_inputs(user, queryset)
+        logs = ActivityLog.objects.all()
+        participants = ActivityLogParticipant.objects.all()
+        if since is not None:
+            queryset = queryset.filter(created_at__gte=since)
+            logs = logs.filter(created_at__gte=since)
+            participants = participants.filter(log__created_at__gte=since)
 
         if PermissionService.is_admin(user):
             return queryset
 
         if PermissionService.is_manager(user):
-            project_ids = Project.objects.filter(Q(manager=user) | Q(team__manager=user)).values("id")
-            team_ids = Team.objects.filter(manager=user).values("id")
-            task_ids = Task.objects.filter(
-                Q(project__manager=user) | Q(project__team__manager=user)
-            ).values("id")
-
-            return queryset.filter(
-                Q(user=user)
-                | Q(target_type="PROJECT", target_id__in=project_ids)
-                | Q(target_type="TEAM", target_id__in=team_ids)
-                | Q(target_type="TASK", target_id__in=task_ids)
+            project_ids = list(
+                _accessible_project_ids(user, ProjectAccess.Kind.MANAGER, ProjectAccess.Kind.TEAM_MANAGER)
+                .values_list("project_id", flat=True)
+                .distinct()
             )
+            team_ids = list(Team.objects.filter(manager=user).values_list("id", flat=True))
+
+            # project_id/team_id are denormalized onto each log at write time.
+            # With the ids resolved up front the OR becomes a BitmapOr over
+            # three indexes; an OR of subqueries, or an IN over their union,
+            # makes Postgres scan the whole log table instead.
+            return queryset.filter(Q(user=user) | Q(project_id__in=project_ids) | Q(team_id__in=team_ids))
 
         if PermissionService.is_employee(user):
             task_ids = Task.objects.filter(assigned_to=user).values("id")
-
-            project_assignment_q = Q(action_type__in=[
-                "USER_ASSIGNED_TO_PROJECT",
-                "USER_REMOVED_FROM_PROJECT",
-                "USER_ROLE_CHANGED_IN_PROJECT",
-            ]) & (
-                Q(metadata__user_id__new=user.id)
-                | Q(metadata__user_id__old=user.id)
+            # Own actions plus project/team membership changes about the user.
+            log_ids = participants.filter(
+                user=user,
+                role__in=[ActivityLogParticipant.Role.ACTOR, ActivityLogParticipant.Role.MEMBER],
+            ).values("log_id").union(
+                logs.filter(target_type="TASK", target_id__in=task_ids).values("id"),
             )
+            return queryset.filter(id__in=log_ids)
 
-            team_membership_q = Q(action_type__in=[
-                "USER_ADDED_TO_TEAM",
-                "USER_REMOVED_FROM_TEAM",
-            ]) & (
-                Q(metadata__user_id__new=user.id)
-                | Q(metadata__user_id__old=user.id)
-            )
+        return queryset.none()
 
-            return queryset.filter(
-                Q(user=user)
-                | Q(target_type="TASK", target_id__in=task_ids)
-                | project_assignment_q
-                | team_membership_q
-            )
+    # ---------------- BULK ---------------- #
 
-        return queryset.none()
+    @staticmethod
+    def filter_permitted_ids(user, target_type, ids, action="view"):
+        """
+        Set-based counterpart of the can_* checks: returns the subset of ids
+        (PROJECT, TASK, TEAM or ASSIGNMENT) the user may act on, in one query.
+        Ids that do not exist are never returned.
+        """
+        _validate_scope_inputs(user, ids)
+        try:
+            model, rule = _BULK_RULES[(target_type, action)]
+        except KeyError:
+            raise ValueError(f"Unsupported bulk permission check: {action} on {target_type}")
+
+        ids = _normalize_ids(ids)
+        if not ids:
+            return set()
+
+        queryset = model.objects.filter(id__in=ids)
+        if not PermissionService.is_admin(user):
+            condition = rule(user)
+            if condition is None:
+                return set()
+            queryset = queryset.filter(condition)
+        return set(queryset.values_list("id", flat=True))
+
+    @staticmethod
+    def can_view_many(user, target_type, ids):
+        return PermissionService.filter_permitted_ids(user, target_type, ids, action="view")
 
     # ---------------- USER ---------------- #
 
@@ -209,6 +366,16 @@ class PermissionService:
             return True
         return PermissionService.is_manager(user) and str(getattr(user, "id", None)) == str(manager_id)
 
+    @staticmethod
+    def can_view_user_tasks(user, target_user_id):
+        # Managers may look up anyone; scope_tasks still limits the rows to
+        # their own projects.
+        if user is None:
+            raise ValueError("User must be provided")
+        if PermissionService.is_admin(user) or PermissionService.is_manager(user):
+            return True
+        return str(getattr(user, "id", None)) == str(target_user_id)
+
     # ---------------- TEAM ---------------- #
 
     @staticmethod
@@ -229,18 +396,20 @@ class PermissionService:
         return PermissionService.can_manage_team(user, team)
 
     @staticmethod
+    @_memoize_decision
     def can_view_team(user, team):
         _validate_scope_inputs(user, team)
         if PermissionService.is_admin(user):
             return True
         if team.manager_id == user.id:
             return True
-        return team.members.filter(id=user.id).exists()
+        return team_has_member(team.id, user.id)
 
     @staticmethod
+    @_memoize_decision
     def is_team_member(user, team):
         _validate_scope_inputs(user, team)
-        return team.members.filter(id=user.id).exists()
+        return team_has_member(team.id, user.id)
 
     # ---------------- PROJECT ---------------- #
 
@@ -254,6 +423,7 @@ class PermissionService:
         return False
 
     @staticmethod
+    @_memoize_decision
     def can_create_project_for_team_id(user, team_id):
         if user is None:
             raise ValueError("User must be provided")
@@ -264,6 +434,7 @@ class PermissionService:
         return Team.objects.filter(id=team_id, manager_id=user.id).exists()
 
     @staticmethod
+    @_memoize_decision
     def can_view_project(user, project):
         _validate_scope_inputs(user, project)
         if PermissionService.is_admin(user):
@@ -275,17 +446,33 @@ class PermissionService:
         ).exists()
 
     @staticmethod
+    @_memoize_decision
     def is_project_member(user, project):
         _validate_scope_inputs(user, project)
         return Assignment.objects.filter(project=project, user=user, is_active=True).exists()
 
     @staticmethod
+    @_memoize_decision
     def is_project_member_for_id(user, project_id):
         if user is None:
             raise ValueError("User must be provided")
         return Assignment.objects.filter(project_id=project_id, user=user, is_active=True).exists()
 
     @staticmethod
+    def filter_project_member_ids(project_id, user_ids):
+        """
+        Subset of user_ids that are active members of the project, in one query.
+        """
+        user_ids = _normalize_ids(user_ids)
+        if not user_ids:
+            return set()
+        return set(
+            Assignment.objects.filter(project_id=project_id, user_id__in=user_ids, is_active=True)
+            .values_list("user_id", flat=True)
+        )
+
+    @staticmethod
+    @_memoize_decision
     def can_view_project_for_id(user, project_id):
         if user is None:
             raise ValueError("User must be provided")
@@ -308,12 +495,13 @@ class PermissionService:
         return project.manager_id == user.id
 
     @staticmethod
+    @_memoize_decision
     def can_update_project_for_id(user, project_id):
         if user is None:
             raise ValueError("User must be provided")
         if PermissionService.is_admin(user):
             return True
-        return Project.objects.filter(id=project_id, manager_id=user.id).exists()
+        return project_managed_by(project_id, user.id)
 
     @staticmethod
     def can_delete_project(user, project):
@@ -333,12 +521,13 @@ class PermissionService:
         return project.manager_id == user.id
 
     @staticmethod
+    @_memoize_decision
     def can_assign_user_for_project_id(user, project_id):
         if user is None:
             raise ValueError("User must be provided")
         if PermissionService.is_admin(user):
             return True
-        return Project.objects.filter(id=project_id, manager_id=user.id).exists()
+        return project_managed_by(project_id, user.id)
 
     @staticmethod
     def can_remove_user(user, assignment):
@@ -373,6 +562,7 @@ class PermissionService:
         return project.manager_id == user.id
 
     @staticmethod
+    @_memoize_decision
     def can_create_task_for_project_id(user, project_id):
         if user is None:
             raise ValueError("User must be provided")
@@ -381,6 +571,7 @@ class PermissionService:
         return Project.objects.filter(id=project_id, manager_id=user.id).exists()
 
     @staticmethod
+    @_memoize_decision
     def can_view_task_collection(user, project_id):
         if user is None:
             raise ValueError("User must be provided")
@@ -393,6 +584,7 @@ class PermissionService:
         ).exists()
 
     @staticmethod
+    @_memoize_decision
     def can_view_task(user, task):
         _validate_scope_inputs(user, task)
         if PermissionService.is_admin(user):
@@ -404,6 +596,7 @@ class PermissionService:
         ).exists()
 
     @staticmethod
+    @_memoize_decision
     def can_view_task_for_id(user, task_id):
         if user is None:
             raise ValueError("User must be provided")
@@ -422,6 +615,7 @@ class PermissionService:
         return task.assigned_to_id == user.id
 
     @staticmethod
+    @_memoize_decision
     def can_update_task_for_id(user, task_id):
         if user is None:
             raise ValueError("User must be provided")
@@ -438,6 +632,7 @@ class PermissionService:
         return task.project.manager_id == user.id
 
     @staticmethod
+    @_memoize_decision
     def can_delete_task_for_id(user, task_id):
         if user is None:
             raise ValueError("User must be provided")
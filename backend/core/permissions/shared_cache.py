@@ -0,0 +1,127 @@
+"""
+Cross-process cache of team member ids and project managers, shared by all
+workers through Django's cache framework.
+
+Every entry is stored under a version key. Writers never touch the entries:
+they replace the version with a fresh token, so readers miss and reload.
+Versions are bumped immediately and again on commit, so a worker that
+refilled an entry from pre-commit data cannot keep serving it.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+_MISSING = "missing"
+
+
+def shared_cache_enabled():
+    return settings.PERMISSION_SHARED_CACHE_ENABLED
+
+
+def _cache():
+    return caches[settings.PERMISSION_SHARED_CACHE_ALIAS]
+
+
+def _team_version_key(team_id):
+    return f"permissions:team:{team_id}:version"
+
+
+def _project_version_key(project_id):
+    return f"permissions:project:{project_id}:version"
+
+
+def _current_version(version_key):
+    cache = _cache()
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, None)
+        version = cache.get(version_key)
+    return version
+
+
+def _bump(version_key):
+    def bump():
+        _cache().set(version_key, uuid.uuid4().hex, None)
+
+    if not shared_cache_enabled():
+        return
+    bump()
+    transaction.on_commit(bump)
+
+
+def _cached(version_key, name, load):
+    cache = _cache()
+    key = f"{version_key}:{_current_version(version_key)}:{name}"
+    value = cache.get(key)
+    if value is None:
+        value = load()
+        cache.set(key, value, settings.PERMISSION_SHARED_CACHE_TIMEOUT)
+    return value
+
+
+def _as_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def bump_team_version(*team_ids):
+    for team_id in {team_id for team_id in team_ids if team_id is not None}:
+        _bump(_team_version_key(team_id))
+
+
+def bump_project_version(*project_ids):
+    for project_id in {project_id for project_id in project_ids if project_id is not None}:
+        _bump(_project_version_key(project_id))
+
+
+def team_versions(*team_ids):
+    """Current version tokens of the given teams, read in one cache round trip."""
+    keys = [_team_version_key(team_id) for team_id in team_ids]
+    found = _cache().get_many(keys)
+    return [found.get(key) or _current_version(key) for key in keys]
+
+
+def team_member_ids(team_id):
+    from accounts.models import User
+
+    return _cached(
+        _team_version_key(team_id),
+        "members",
+        lambda: frozenset(User.objects.filter(team_id=team_id).values_list("id", flat=True)),
+    )
+
+
+def project_manager_id(project_id):
+    from work.models import Project
+
+    def load():
+        manager_id = Project.objects.filter(id=project_id).values_list("manager_id", flat=True).first()
+        return _MISSING if manager_id is None else manager_id
+
+    manager_id = _cached(_project_version_key(project_id), "manager", load)
+    return None if manager_id == _MISSING else manager_id
+
+
+def team_has_member(team_id, user_id):
+    if shared_cache_enabled():
+        return user_id in team_member_ids(team_id)
+
+    from accounts.models import User
+
+    return User.objects.filter(team_id=team_id, id=user_id).exists()
+
+
+def project_managed_by(project_id, user_id):
+    normalized_id = _as_id(project_id)
+    if shared_cache_enabled() and normalized_id is not None:
+        return project_manager_id(normalized_id) == user_id
+
+    from work.models import Project
+
+    return Project.objects.filter(id=project_id, manager_id=user_id).exists()
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from organization.models import Team
+from work.models import Assignment, Project, Task
+
+from .services import clear_permission_decision_cache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=Task)
+def invalidate_permission_decisions(sender, **kwargs):
+    """
+    Any write to a model the permission rules read from drops the decisions
+    memoized so far in the current request.
+    """
+    clear_permission_decision_cache()
@@ -15,7 +15,8 @@ class TaskPermission(BasePermission):
         if not project_id:
             return False
 
-        if request.method == 'POST':
+        # Bulk transitions update existing tasks; their rules run per task.
+        if request.method == 'POST' and getattr(view, 'action', None) != 'bulk_transition':
             return PermissionService.can_create_task_for_project_id(request.user, project_id)
 
         return PermissionService.can_view_task_collection(request.user, project_id)
@@ -31,3 +32,14 @@ class TaskPermission(BasePermission):
             return PermissionService.can_view_task(request.user, obj)
 
         return False
+
+
+class UserTaskPermission(BasePermission):
+    def has_permission(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return False
+
+        user_pk = view.kwargs.get('user_pk')
+        if user_pk is None:
+            return True
+        return PermissionService.can_view_user_tasks(request.user, user_pk)
@@ -0,0 +1,90 @@
+from rest_framework.exceptions import ValidationError
+
+
+def _split(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Serializer mixin accepting a ``fields`` keyword that limits the output to
+    those field names. With many=True the keyword reaches every child.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsMixin:
+    """
+    Viewset mixin for ``?fields=a,b`` and ``?omit=c`` on list and retrieve.
+
+    Lists default to ``list_fields`` and details to every serializer field;
+    ``fields`` replaces the default set and ``omit`` removes from it. The id
+    is always kept. On lists the queryset is narrowed with .only() so omitted
+    columns are never read; ``sparse_required_fields`` names model fields
+    the view itself needs, such as pagination keys, and
+    ``sparse_select_related`` the nested relations to join when selected.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+    list_fields = None
+    sparse_required_fields = ()
+    sparse_select_related = ()
+
+    def get_sparse_fields(self):
+        if self.action not in ("list", "retrieve"):
+            return None
+        if not hasattr(self, "_sparse_fields"):
+            self._sparse_fields = self._resolve_sparse_fields()
+        return self._sparse_fields
+
+    def _resolve_sparse_fields(self):
+        available = list(self.get_serializer_class()().fields)
+        params = self.request.query_params
+        requested = _split(params.get(self.fields_query_param, ""))
+        omitted = _split(params.get(self.omit_query_param, ""))
+
+        unknown = sorted(set(requested + omitted) - set(available))
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(unknown)}."})
+
+        if requested:
+            selected = requested
+        elif self.action == "list" and self.list_fields is not None:
+            selected = list(self.list_fields)
+        else:
+            selected = available
+        return [name for name in available if name == "id" or (name in selected and name not in omitted)]
+
+    def get_serializer(self, *args, **kwargs):
+        if "fields" not in kwargs and getattr(self, "action", None) in ("list", "retrieve"):
+            kwargs["fields"] = self.get_sparse_fields()
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action != "list":
+            return queryset
+
+        serializer_fields = self.get_serializer_class()().fields
+        sources = {
+            serializer_fields[name].source
+            for name in self.get_sparse_fields()
+            if serializer_fields[name].source != "*"
+        }
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        columns = (sources & model_fields) | set(self.sparse_required_fields)
+
+        # Related rows are rendered as keys, so the joins are dropped, except
+        # for selected relations the serializer nests.
+        queryset = queryset.select_related(None)
+        for relation in sorted(sources & set(self.sparse_select_related)):
+            related_model = queryset.model._meta.get_field(relation).related_model
+            columns |= {f"{relation}__{field.name}" for field in related_model._meta.concrete_fields}
+            queryset = queryset.select_related(relation)
+        return queryset.only(*sorted(columns))
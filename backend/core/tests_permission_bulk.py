@@ -0,0 +1,126 @@
+import random
+
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+SINGLE_OBJECT_CHECKS = {
+    ("PROJECT", "view"): PermissionService.can_view_project,
+    ("PROJECT", "update"): PermissionService.can_update_project,
+    ("PROJECT", "delete"): PermissionService.can_delete_project,
+    ("TASK", "view"): PermissionService.can_view_task,
+    ("TASK", "update"): PermissionService.can_update_task,
+    ("TASK", "delete"): PermissionService.can_delete_task,
+    ("TEAM", "view"): PermissionService.can_view_team,
+    ("TEAM", "manage"): PermissionService.can_manage_team,
+    ("ASSIGNMENT", "view"): PermissionService.can_view_assignment,
+    ("ASSIGNMENT", "update"): PermissionService.can_update_assignment,
+}
+
+MODELS = {
+    "PROJECT": Project,
+    "TASK": Task,
+    "TEAM": Team,
+    "ASSIGNMENT": Assignment,
+}
+
+
+class BulkPermissionEquivalenceTests(APITestCase):
+    SEEDS = range(4)
+
+    def _build_org(self, rng, seed):
+        departments = [
+            Department.objects.create(name=f"Dept {seed}-{index}", code=f"D{seed}{index}")
+            for index in range(2)
+        ]
+
+        def make_user(role, index):
+            return User.objects.create_user(
+                email=f"{role.lower()}{seed}-{index}@test.com",
+                username=f"{role.lower()}{seed}-{index}",
+                role=role,
+                department=rng.choice(departments),
+            )
+
+        admins = [make_user(User.Role.ADMIN, 0)]
+        managers = [make_user(User.Role.MANAGER, index) for index in range(3)]
+        employees = [make_user(User.Role.EMPLOYEE, index) for index in range(6)]
+
+        teams = []
+        for index in range(3):
+            teams.append(Team.objects.create(
+                name=f"Team {seed}-{index}",
+                code=f"T{seed}{index}",
+                department=rng.choice(departments),
+                # An employee may end up as a team manager through data drift.
+                manager=rng.choice(managers + employees[:1]),
+            ))
+
+        for member in managers + employees:
+            member.team = rng.choice(teams + [None])
+            member.save(update_fields=["team"])
+
+        projects = []
+        for index in range(5):
+            team = rng.choice(teams)
+            projects.append(Project.objects.create(
+                name=f"Project {seed}-{index}",
+                code=f"P{seed}{index}",
+                team=team,
+                department=team.department,
+                start_date="2026-01-01",
+                created_by=admins[0],
+            ))
+
+        for project in projects:
+            for member in rng.sample(managers + employees, 4):
+                Assignment.objects.create(
+                    project=project,
+                    user=member,
+                    role=Assignment.Role.SOFTWARE_ENGINEER,
+                    is_active=rng.random() < 0.7,
+                )
+
+        for index in range(12):
+            Task.objects.create(
+                project=rng.choice(projects),
+                title=f"Task {seed}-{index}",
+                assigned_to=rng.choice(managers + employees + [None]),
+                status=rng.choice(Task.Status.values),
+            )
+
+        return admins + managers + employees
+
+    def test_bulk_checks_match_single_object_checks(self):
+        for seed in self.SEEDS:
+            rng = random.Random(seed)
+            users = self._build_org(rng, seed)
+
+            for (target_type, action), single_check in SINGLE_OBJECT_CHECKS.items():
+                objects = list(MODELS[target_type].objects.all())
+                ids = [obj.id for obj in objects] + [10 ** 9]
+
+                for user in users:
+                    with self.subTest(seed=seed, target=target_type, action=action, user=user.username):
+                        expected = {obj.id for obj in objects if single_check(user, obj)}
+                        self.assertSetEqual(
+                            PermissionService.filter_permitted_ids(user, target_type, ids, action=action),
+                            expected,
+                        )
+
+    def test_bulk_check_issues_a_single_query(self):
+        users = self._build_org(random.Random(99), 99)
+        employee = users[-1]
+        project_ids = list(Project.objects.values_list("id", flat=True))
+
+        with self.assertNumQueries(1):
+            PermissionService.can_view_many(employee, "PROJECT", project_ids)
+
+    def test_unknown_target_is_rejected(self):
+        users = self._build_org(random.Random(7), 7)
+        with self.assertRaises(ValueError):
+            PermissionService.filter_permitted_ids(users[0], "DEPARTMENT", [1])
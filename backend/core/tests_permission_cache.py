@@ -0,0 +1,100 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from core.permissions.middleware import decision_cache_totals, reset_decision_cache_totals
+from core.permissions.services import PermissionService, permission_decision_cache
+from organization.models import Department, Team
+from organization.signals import sync_project_managers_on_team_update
+from work.models import Assignment, Project, Task
+
+
+class PermissionDecisionCacheTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", password="password", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", password="password", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1",
+            code="P1",
+            team=self.team,
+            department=self.dept,
+            start_date="2026-01-01",
+            created_by=self.manager,
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.task = Task.objects.create(project=self.project, title="Task 1", assigned_to=self.employee)
+
+    def test_repeated_decision_is_answered_once_per_scope(self):
+        with permission_decision_cache() as cache:
+            with CaptureQueriesContext(connection) as context:
+                self.assertTrue(PermissionService.is_project_member_for_id(self.employee, self.project.id))
+                self.assertTrue(PermissionService.is_project_member_for_id(self.employee, str(self.project.id)))
+                self.assertTrue(PermissionService.is_project_member(self.employee, self.project))
+                self.assertTrue(PermissionService.is_project_member(self.employee, self.project))
+
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 2})
+
+    def test_no_memoization_outside_a_scope(self):
+        with CaptureQueriesContext(connection) as context:
+            PermissionService.is_project_member_for_id(self.employee, self.project.id)
+            PermissionService.is_project_member_for_id(self.employee, self.project.id)
+        self.assertEqual(len(context.captured_queries), 2)
+
+    @override_settings(PERMISSION_DECISION_CACHE_ENABLED=False)
+    def test_cache_can_be_disabled(self):
+        with permission_decision_cache() as cache:
+            with CaptureQueriesContext(connection) as context:
+                PermissionService.is_project_member_for_id(self.employee, self.project.id)
+                PermissionService.is_project_member_for_id(self.employee, self.project.id)
+        self.assertIsNone(cache)
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_writes_invalidate_memoized_decisions(self):
+        with permission_decision_cache():
+            self.assertTrue(PermissionService.is_project_member_for_id(self.employee, self.project.id))
+            Assignment.objects.filter(project=self.project, user=self.employee).get().delete()
+            self.assertFalse(PermissionService.is_project_member_for_id(self.employee, self.project.id))
+
+    def test_patch_request_records_hits(self):
+        reset_decision_cache_totals()
+        self.client.force_authenticate(user=self.manager)
+        url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.task.id})
+
+        response = self.client.patch(url, {"assigned_to": self.employee.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        totals = decision_cache_totals()["project-tasks-detail"]
+        self.assertEqual(totals["requests"], 1)
+        self.assertGreater(totals["misses"], 0)
+
+    def test_team_manager_change_invalidates_project_decisions(self):
+        successor = User.objects.create_user(email="next@test.com", username="next", role=User.Role.MANAGER)
+
+        with permission_decision_cache():
+            self.assertFalse(PermissionService.can_update_project_for_id(successor, self.project.id))
+            # Only the project sync runs, as for a team saved after the cache was last cleared.
+            Team.objects.filter(pk=self.team.pk).update(manager=successor)
+            self.team.refresh_from_db()
+            sync_project_managers_on_team_update(Team, self.team, created=False)
+            self.assertTrue(PermissionService.can_update_project_for_id(successor, self.project.id))
+
+    def test_stats_endpoint_reports_and_resets_cache_totals(self):
+        admin = User.objects.create_user(email="admin@test.com", username="admin", role=User.Role.ADMIN)
+        reset_decision_cache_totals()
+        self.client.force_authenticate(user=self.manager)
+        self.client.get(reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.task.id}))
+
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(reverse("permission_stats"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["decision_cache"]["project-tasks-detail"]["requests"], 1)
+        self.assertEqual(self.client.delete(reverse("permission_stats")).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn("project-tasks-detail", decision_cache_totals())
@@ -0,0 +1,77 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from core.permissions import TaskPermission
+from core.permissions.instrumentation import (
+    install_instrumentation,
+    method_totals,
+    reset_method_totals,
+    uninstall_instrumentation,
+)
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+@override_settings(PERMISSION_INSTRUMENTATION_ENABLED=True)
+class PermissionInstrumentationTests(APITestCase):
+    def setUp(self):
+        install_instrumentation()
+        self.addCleanup(uninstall_instrumentation)
+        reset_method_totals()
+
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", role=User.Role.ADMIN)
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.admin
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.task = Task.objects.create(project=self.project, title="Task 1", assigned_to=self.employee)
+
+    def test_calls_queries_and_time_are_recorded(self):
+        PermissionService.is_project_member_for_id(self.employee, self.project.id)
+        PermissionService.is_admin(self.employee)
+
+        totals = method_totals()
+        self.assertEqual(totals["PermissionService.is_project_member_for_id"]["calls"], 1)
+        self.assertEqual(totals["PermissionService.is_project_member_for_id"]["queries"], 1)
+        self.assertEqual(totals["PermissionService.is_admin"]["queries"], 0)
+        self.assertGreaterEqual(totals["PermissionService.is_admin"]["time_ms"], 0)
+
+    def test_response_header_reports_request_totals(self):
+        self.client.force_authenticate(user=self.employee)
+        url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.task.id})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response["X-Permission-Stats"], r"^calls=\d+; time_ms=\d+\.\d{2}; queries=\d+$")
+        self.assertIn("TaskPermission.has_object_permission", method_totals())
+
+    def test_uninstall_restores_original_methods(self):
+        uninstall_instrumentation()
+        PermissionService.is_admin(self.admin)
+        self.assertEqual(method_totals(), {})
+        self.assertNotIn("__wrapped__", vars(TaskPermission.has_permission))
+
+    def test_stats_endpoint_is_admin_only(self):
+        PermissionService.is_admin(self.admin)
+        url = reverse("permission_stats")
+
+        self.client.force_authenticate(user=self.manager)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["enabled"])
+        self.assertIn("PermissionService.is_admin", response.data["methods"])
+
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(method_totals(), {})
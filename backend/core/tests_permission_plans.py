@@ -0,0 +1,55 @@
+import os
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from core.perf.plans import budget_key, budget_violations, iter_cases, load_budgets, measure_case
+from core.perf.synthetic_org import seed_synthetic_org
+
+
+class PermissionQueryCountTests(TestCase):
+    """
+    Query counts are backend independent, so they are checked on every run
+    against a small synthetic org.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sample = seed_synthetic_org(teams=2)
+
+    def test_every_case_has_a_budget(self):
+        budgets = load_budgets()
+        missing = [budget_key(name, role) for name, role, _ in iter_cases(self.sample) if budget_key(name, role) not in budgets]
+        self.assertEqual(missing, [])
+
+    def test_query_counts_stay_within_budget(self):
+        budgets = load_budgets()
+        for name, role, func in iter_cases(self.sample):
+            key = budget_key(name, role)
+            with self.subTest(case=key):
+                measurement = measure_case(func, with_plans=False)
+                self.assertEqual(budget_violations(measurement, budgets[key]), [])
+
+
+@skipUnless(connection.vendor == "postgresql", "Query plans are only checked on PostgreSQL.")
+class PermissionQueryPlanTests(TestCase):
+    """
+    Loads a large synthetic org (PERMISSION_PLAN_TEAMS teams, 100 by default)
+    and runs EXPLAIN (ANALYZE, BUFFERS) on every case. Fails when a plan starts
+    sequentially scanning a guarded table or runs past its time budget.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sample = seed_synthetic_org(teams=int(os.environ.get("PERMISSION_PLAN_TEAMS", 100)))
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_plans_stay_within_budget(self):
+        budgets = load_budgets()
+        for name, role, func in iter_cases(self.sample):
+            key = budget_key(name, role)
+            with self.subTest(case=key):
+                measurement = measure_case(func, with_plans=True)
+                self.assertEqual(budget_violations(measurement, budgets[key]), [])
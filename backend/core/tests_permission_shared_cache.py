@@ -0,0 +1,83 @@
+import shutil
+import tempfile
+
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from organization.serializers import TeamSerializer
+from organization.services.team_service import assign_user_to_team
+from work.models import Project
+
+
+class SharedPermissionCacheTestsMixin:
+    def setUp(self):
+        caches["default"].clear()
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", role=User.Role.ADMIN)
+        self.manager = User.objects.create_user(
+            email="manager@test.com", username="manager", role=User.Role.MANAGER, department=self.dept
+        )
+        self.new_manager = User.objects.create_user(
+            email="manager2@test.com", username="manager2", role=User.Role.MANAGER, department=self.dept
+        )
+        self.employee = User.objects.create_user(
+            email="emp@test.com", username="emp", role=User.Role.EMPLOYEE, department=self.dept
+        )
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.admin
+        )
+
+    def test_membership_is_served_from_cache_until_assignment(self):
+        self.assertFalse(PermissionService.is_team_member(self.employee, self.team))
+        with self.assertNumQueries(0):
+            self.assertFalse(PermissionService.is_team_member(self.employee, self.team))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_user_to_team(self.team, self.employee.id, actor=self.admin)
+
+        self.assertTrue(PermissionService.is_team_member(self.employee, self.team))
+        self.assertTrue(PermissionService.can_view_team(self.employee, self.team))
+
+    def test_project_manager_follows_team_manager_change(self):
+        self.assertTrue(PermissionService.can_update_project_for_id(self.manager, self.project.id))
+        with self.assertNumQueries(0):
+            self.assertTrue(PermissionService.can_assign_user_for_project_id(self.manager, str(self.project.id)))
+
+        serializer = TeamSerializer(self.team, data={"manager": self.new_manager.id}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertFalse(PermissionService.can_update_project_for_id(self.manager, self.project.id))
+        self.assertTrue(PermissionService.can_update_project_for_id(self.new_manager, self.project.id))
+        self.assertTrue(PermissionService.is_team_member(self.new_manager, self.team))
+
+    def test_deleted_project_is_forgotten(self):
+        project_id = self.project.id
+        self.assertTrue(PermissionService.can_update_project_for_id(self.manager, project_id))
+        self.project.delete()
+        self.assertFalse(PermissionService.can_update_project_for_id(self.manager, project_id))
+
+
+@override_settings(
+    PERMISSION_SHARED_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "permission-tests"}},
+)
+class LocMemSharedPermissionCacheTests(SharedPermissionCacheTestsMixin, APITestCase):
+    pass
+
+
+class FileBasedSharedPermissionCacheTests(SharedPermissionCacheTestsMixin, APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.cache_dir, ignore_errors=True)
+        cls.enterClassContext(override_settings(
+            PERMISSION_SHARED_CACHE_ENABLED=True,
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": cls.cache_dir}},
+        ))
+        super().setUpClass()
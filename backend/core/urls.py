@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import PermissionStatsView
+
+urlpatterns = [
+    path("permissions/stats/", PermissionStatsView.as_view(), name="permission_stats"),
+]
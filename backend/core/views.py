@@ -0,0 +1,23 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.permissions import IsAdmin
+from core.permissions.instrumentation import instrumentation_installed, method_totals, reset_method_totals
+from core.permissions.middleware import decision_cache_totals, reset_decision_cache_totals
+
+
+class PermissionStatsView(APIView):
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        totals = method_totals()
+        return Response({
+            "enabled": instrumentation_installed(),
+            "methods": totals,
+            "decision_cache": decision_cache_totals(),
+        })
+
+    def delete(self, request):
+        reset_method_totals()
+        reset_decision_cache_totals()
+        return Response(status=204)
@@ -37,6 +37,7 @@ class Team(models.Model):
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     is_activate = models.BooleanField(default=True)
     created_by = models.ForeignKey(
         User,
@@ -3,6 +3,7 @@ from rest_framework import serializers
 from accounts.models import User
 from .models import Department, Team
 from core.permissions.services import PermissionService
+from core.permissions.shared_cache import bump_team_version
 
 class DepartmentSerializer(serializers.ModelSerializer):
     class Meta:
@@ -55,8 +56,10 @@ class TeamSerializer(serializers.ModelSerializer):
 
         manager = team.manager
         if manager:
+            old_team_id = manager.team_id
             manager.team = team
             manager.save(update_fields = ['team'])
+            bump_team_version(old_team_id, team.id)
         
         return team
     
@@ -71,8 +74,11 @@ class TeamSerializer(serializers.ModelSerializer):
                     old_manager.save(update_fields=['team'])
                 
                 if new_manager:
+                    bump_team_version(new_manager.team_id)
                     new_manager.team = team
                     new_manager.save(update_fields=['team'])
+
+                bump_team_version(team.id)
             return team 
     
 
@@ -2,6 +2,7 @@ from django.db import transaction
 from rest_framework.exceptions import ValidationError
 from accounts.models import User
 from audit.services import ActivityActionType, ActivityTargetType, log_activity
+from core.permissions.shared_cache import bump_team_version
 
 def assign_user_to_team(team, user_id, actor=None):
     """
@@ -29,6 +30,7 @@ def assign_user_to_team(team, user_id, actor=None):
     with transaction.atomic():
         user.team = team
         user.save(update_fields=['team'])
+        bump_team_version(old_team_id, team.id)
 
     if old_team_id != team.id:
         log_activity(
@@ -3,6 +3,7 @@ from django.dispatch import receiver
 from .models import Department, Team
 from django.db import transaction
 from django.apps import apps
+from django.utils import timezone
 
 @receiver(post_save, sender=Team)
 def sync_project_managers_on_team_update(sender,instance,created, ** kwargs):
@@ -13,11 +14,19 @@ def sync_project_managers_on_team_update(sender,instance,created, ** kwargs):
         return # No need to sync on team creation
     
     Project = apps.get_model('work', 'Project')
+    from core.permissions.services import clear_permission_decision_cache
+    from core.permissions.shared_cache import bump_project_version
+    from work.services.project_access import refresh_project_access_for_team
 
-    if instance.manager:
-        
-        with transaction.atomic():
+    with transaction.atomic():
+        if instance.manager:
             # Update all projects under this team to have the same manager
-            Project.objects.filter(team=instance).update(manager=instance.manager)
+            Project.objects.filter(team=instance).update(manager=instance.manager, updated_at=timezone.now())
+            bump_project_version(*Project.objects.filter(team=instance).values_list("id", flat=True))
+            # The bulk update sends no post_save, so drop decisions memoized with the old manager.
+            clear_permission_decision_cache()
+
+        # The bulk update skips Project.save, so refresh the access index here.
+        refresh_project_access_for_team(instance.id)
 
 
@@ -7,8 +7,10 @@ from . serializers import DepartmentSerializer, TeamSerializer, TeamAssignUserSe
 from core.permissions import TeamPermission, IsAdmin, IsAdminOrTeamManager
 from core.permissions.services import PermissionService
 from core.permissions.scoped_viewsets import BaseScopedViewSet
+from core.conditional import ConditionalGetMixin
+from core.permissions.shared_cache import shared_cache_enabled, team_versions
 from rest_framework.exceptions import MethodNotAllowed, PermissionDenied
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from accounts.authentication import StatelessJWTAuthentication
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -22,7 +24,7 @@ class DepartmentViewSet(
 ):
     serializer_class = DepartmentSerializer
     queryset = Department.objects.none()
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAdmin]
 
     def get_queryset(self):
@@ -40,10 +42,11 @@ class DepartmentViewSet(
         raise MethodNotAllowed(request.method, detail="Delete operation is not allowed.")
     
 class TeamViewSet(
+    ConditionalGetMixin,
     BaseScopedViewSet
 ):
     serializer_class = TeamSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [TeamPermission]
     queryset = Team.objects.none()
     
@@ -53,6 +56,16 @@ class TeamViewSet(
             return Team.objects.none()
 
         return PermissionService.scope_teams(user, Team.objects.all())
+
+    # Membership changes (User.team) do not touch Team.updated_at, so the
+    # version also carries which teams are listed and, with the shared
+    # cache on, each team's version, which those writes bump.
+    def get_list_version(self, queryset):
+        rows = list(queryset.order_by("id").values_list("id", "updated_at"))
+        team_ids = [team_id for team_id, _ in rows]
+        last = max((updated_at for _, updated_at in rows), default=None)
+        members = team_versions(*team_ids) if shared_cache_enabled() else None
+        return team_ids, last, members
     
     def perform_create(self, serializer):
         request_user = self.request.user
@@ -96,7 +109,7 @@ class TeamViewSet(
                 status=status.HTTP_400_BAD_REQUEST
             )
         team.is_activate = False
-        team.save(update_fields=["is_activate"])
+        team.save(update_fields=["is_activate", "updated_at"])
         return Response({"detail": "Team deactivated successfully."}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], permission_classes=[IsAdminOrTeamManager], url_path='assign-user')
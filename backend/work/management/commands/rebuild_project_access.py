@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from work.services.project_access import find_project_access_drift, rebuild_project_access
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the user → project access index from scratch and verifies it against the live rules."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare the index with the live rules; do not rebuild.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            written = rebuild_project_access()
+            self.stdout.write(f"Rebuilt project access index ({written} rows).")
+
+        missing, stale = find_project_access_drift()
+        if missing or stale:
+            for user_id, project_id, access_kind in sorted(missing):
+                self.stderr.write(f"missing: user={user_id} project={project_id} kind={access_kind}")
+            for user_id, project_id, access_kind in sorted(stale):
+                self.stderr.write(f"stale: user={user_id} project={project_id} kind={access_kind}")
+            raise CommandError(
+                f"Project access index drift: {len(missing)} missing, {len(stale)} stale."
+            )
+
+        self.stdout.write(self.style.SUCCESS("Project access index matches the live rules."))
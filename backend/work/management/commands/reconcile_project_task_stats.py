@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from work.services.task_stats import find_task_stats_drift, refresh_task_stats
+
+
+class Command(BaseCommand):
+    help = "Recounts per-project task stats and repairs rows that drifted from the task table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift; do not repair it.",
+        )
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Limit to this project id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        drift = find_task_stats_drift(options["project_ids"])
+        for project_id, (expected, stored) in sorted(drift.items()):
+            if stored is None:
+                self.stderr.write(f"missing: project={project_id}")
+                continue
+            changes = ", ".join(
+                f"{field} {stored[field]} -> {value}" for field, value in expected.items() if stored[field] != value
+            )
+            self.stderr.write(f"drift: project={project_id} {changes}")
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Project task stats match the task table."))
+            return
+        if options["check"]:
+            raise CommandError(f"Project task stats drift in {len(drift)} project(s).")
+
+        refresh_task_stats(drift)
+        self.stdout.write(self.style.SUCCESS(f"Repaired task stats for {len(drift)} project(s)."))
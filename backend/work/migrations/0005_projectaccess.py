@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-18 08:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_project_access(apps, schema_editor):
+    Project = apps.get_model('work', 'Project')
+    Assignment = apps.get_model('work', 'Assignment')
+    ProjectAccess = apps.get_model('work', 'ProjectAccess')
+
+    rows = set()
+    for project_id, manager_id, team_manager_id in Project.objects.values_list('id', 'manager_id', 'team__manager_id'):
+        if manager_id:
+            rows.add((manager_id, project_id, 'MANAGER'))
+        if team_manager_id:
+            rows.add((team_manager_id, project_id, 'TEAM_MANAGER'))
+    for user_id, project_id in Assignment.objects.filter(is_active=True).values_list('user_id', 'project_id'):
+        rows.add((user_id, project_id, 'MEMBER'))
+
+    ProjectAccess.objects.bulk_create(
+        [ProjectAccess(user_id=user_id, project_id=project_id, access_kind=kind) for user_id, project_id, kind in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0004_project_team'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_kind', models.CharField(choices=[('MANAGER', 'Project Manager'), ('TEAM_MANAGER', 'Team Manager'), ('MEMBER', 'Member')], max_length=20)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='access_entries', to='work.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_access', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'access_kind', 'project'], name='project_access_user_kind_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'project', 'access_kind'), name='unique_project_access_per_kind')],
+            },
+        ),
+        migrations.RunPython(populate_project_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0005_projectaccess'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status_order', '-priority', '-created_at', '-id'], name='task_project_order_idx'),
+        ),
+    ]
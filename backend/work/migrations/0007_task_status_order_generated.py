@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    status_order becomes a stored generated column. A field cannot be altered
+    into a GeneratedField, so it is dropped and re-added (which computes it
+    for every existing row); the index that covers it is rebuilt around that.
+    """
+
+    dependencies = [
+        ('work', '0006_task_project_order_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_project_order_idx',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='status_order',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='status_order',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=models.Case(models.When(status='TODO', then=models.Value(1)), models.When(status='IN_PROGRESS', then=models.Value(2)), models.When(status='REVIEW', then=models.Value(3)), models.When(status='BLOCKED', then=models.Value(4)), models.When(status='DONE', then=models.Value(5)), output_field=models.PositiveSmallIntegerField()), output_field=models.PositiveSmallIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status_order', '-priority', '-created_at', '-id'], name='task_project_order_idx'),
+        ),
+    ]
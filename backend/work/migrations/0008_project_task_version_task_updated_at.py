@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0007_task_status_order_generated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='task_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
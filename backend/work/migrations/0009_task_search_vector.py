@@ -0,0 +1,48 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:39
+
+from django.db import migrations
+
+
+SEARCH_CONFIG = "english"
+
+ADD_SEARCH_VECTOR = [
+    f"""
+    ALTER TABLE work_task ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX task_search_vector_idx ON work_task USING gin (search_vector)",
+]
+
+DROP_SEARCH_VECTOR = [
+    "DROP INDEX IF EXISTS task_search_vector_idx",
+    "ALTER TABLE work_task DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _execute_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    """
+    Postgres only: a stored tsvector over task title (weight A) and
+    description (weight B), kept current by the database on every write,
+    with a GIN index. The column is not part of the model state, so normal
+    task queries never select it; work.services.task_search reads it.
+    """
+
+    dependencies = [
+        ('work', '0008_project_task_version_task_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(_execute_on_postgres(ADD_SEARCH_VECTOR), _execute_on_postgres(DROP_SEARCH_VECTOR)),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+STATUS_COUNT_FIELDS = {
+    "TODO": "todo_count",
+    "IN_PROGRESS": "in_progress_count",
+    "REVIEW": "review_count",
+    "BLOCKED": "blocked_count",
+    "DONE": "done_count",
+}
+PRIORITY_COUNT_FIELDS = {
+    1: "high_priority_count",
+    2: "medium_priority_count",
+    3: "low_priority_count",
+}
+
+
+def backfill_task_stats(apps, schema_editor):
+    Project = apps.get_model("work", "Project")
+    ProjectTaskStats = apps.get_model("work", "ProjectTaskStats")
+    Task = apps.get_model("work", "Task")
+
+    aggregates = {field: Count("id", filter=Q(status=status)) for status, field in STATUS_COUNT_FIELDS.items()}
+    aggregates.update({field: Count("id", filter=Q(priority=priority)) for priority, field in PRIORITY_COUNT_FIELDS.items()})
+    aggregates["estimated_hours_total"] = Coalesce(Sum("estimated_hours"), 0)
+
+    counted = {
+        row.pop("project_id"): row
+        for row in Task.objects.order_by().values("project_id").annotate(**aggregates)
+    }
+    ProjectTaskStats.objects.bulk_create(
+        [
+            ProjectTaskStats(project_id=project_id, **counted.get(project_id, {}))
+            for project_id in Project.objects.values_list("id", flat=True).iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0010_task_assignee_order_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTaskStats',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_stats', serialize=False, to='work.project')),
+                ('todo_count', models.IntegerField(default=0)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('review_count', models.IntegerField(default=0)),
+                ('blocked_count', models.IntegerField(default=0)),
+                ('done_count', models.IntegerField(default=0)),
+                ('high_priority_count', models.IntegerField(default=0)),
+                ('medium_priority_count', models.IntegerField(default=0)),
+                ('low_priority_count', models.IntegerField(default=0)),
+                ('estimated_hours_total', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Project task stats',
+                'verbose_name_plural': 'Project task stats',
+            },
+        ),
+        migrations.RunPython(backfill_task_stats, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,8 @@
 # Projects, Task, assignments, deadlines, statuses
 
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import F, Q
 
 # Create your models here.
 
@@ -30,6 +30,9 @@ class Project(models.Model):
 
     created_at=models.DateTimeField(auto_now_add=True)
     updated_at=models.DateTimeField(auto_now=True)
+
+    # Incremented on every write to this project's tasks; cheap ETag source.
+    task_version=models.PositiveIntegerField(default=0, editable=False)
     
 
     class Meta:
@@ -51,6 +54,10 @@ class Project(models.Model):
     def __str__(self):
         return f"{self.name} ({self.code})"
 
+    @staticmethod
+    def bump_task_version(*project_ids):
+        Project.objects.filter(id__in=project_ids).update(task_version=F("task_version") + 1)
+
     def save(self, *args, **kwargs):
         if self.team:
             if not self.team.manager:
@@ -59,6 +66,9 @@ class Project(models.Model):
         self.full_clean()
         super().save(*args, **kwargs)
 
+        from core.permissions.shared_cache import bump_project_version
+        bump_project_version(self.id)
+
 class Assignment(models.Model):
     class Role(models.TextChoices):
         PROJECT_MANAGER = "PROJECT_MANAGER", "Project Manager"
@@ -120,6 +130,38 @@ class Assignment(models.Model):
     def __str__(self):
         return f"{self.user} → {self.project} ({self.role})"
 
+class ProjectAccess(models.Model):
+    """
+    Denormalized user → project visibility, kept in sync from Project,
+    Assignment and Team writes (see work.services.project_access).
+    """
+    class Kind(models.TextChoices):
+        MANAGER = "MANAGER", "Project Manager"
+        TEAM_MANAGER = "TEAM_MANAGER", "Team Manager"
+        MEMBER = "MEMBER", "Member"
+
+    user = models.ForeignKey('accounts.User', on_delete=models.CASCADE, related_name='project_access')
+    project = models.ForeignKey('work.Project', on_delete=models.CASCADE, related_name='access_entries')
+    access_kind = models.CharField(max_length=20, choices=Kind.choices)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "project", "access_kind"],
+                name="unique_project_access_per_kind",
+            )
+        ]
+
+        indexes = [
+            models.Index(
+                fields=["user", "access_kind", "project"],
+                name="project_access_user_kind_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} → {self.project_id} ({self.access_kind})"
+
 class Task(models.Model):
     class Status(models.TextChoices):
         TODO = "TODO", "To Do"
@@ -146,12 +188,19 @@ class Task(models.Model):
     priority = models.PositiveSmallIntegerField(choices=Priority.choices, default=Priority.LOW)  # 1-High, 2-Medium, 3-Low
     estimated_hours = models.PositiveIntegerField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey('accounts.User', on_delete=models.SET_NULL, null=True, related_name='tasks_created')
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.TODO)
 
-    status_order = models.PositiveSmallIntegerField(
-        editable=False,
-        db_index=True
+    # Computed by the database, so QuerySet.update() and bulk writes keep it in step.
+    status_order = models.GeneratedField(
+        expression=models.Case(
+            *[models.When(status=status.value, then=models.Value(order)) for status, order in STATUS_ORDER.items()],
+            output_field=models.PositiveSmallIntegerField(),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+        db_index=True,
     )
     class Meta:
         ordering = ['status_order', '-priority', '-created_at']
@@ -161,13 +210,57 @@ class Task(models.Model):
 
         indexes = [
         models.Index(fields=['project']),
-        models.Index(fields=['assigned_to']),
+        # Serves the keyset pagination in work.pagination.
+        models.Index(fields=['project', 'status_order', '-priority', '-created_at', '-id'], name='task_project_order_idx'),
+        # Same ordering per assignee, for the cross-project task lists.
+        models.Index(fields=['assigned_to', 'status_order', '-priority', '-created_at', '-id'], name='task_assignee_order_idx'),
     ]
 
     def __str__(self):
         return f"{self.title} ({self.project.code})"
 
     def save(self, *args, **kwargs):
-        self.status_order = self.STATUS_ORDER[self.status]
-        super().save(*args, **kwargs)
+        from .services.task_stats import TASK_STATS_SOURCES, record_task_save
+
+        # No savepoint: a failure here must abort any enclosing transaction anyway.
+        with transaction.atomic(savepoint=False):
+            # The row as the stats currently count it, locked so a concurrent
+            # save of the same task waits and then starts from our values.
+            previous = None if self._state.adding else (
+                Task.objects.select_for_update().filter(pk=self.pk).values(*TASK_STATS_SOURCES).first()
+            )
+            super().save(*args, **kwargs)
+            record_task_save(self, previous, kwargs.get("update_fields"))
+            Project.bump_task_version(self.project_id)
+
+
+class ProjectTaskStats(models.Model):
+    """
+    Per-project task counts by status and priority plus total estimated
+    hours, adjusted with F() deltas by every task write
+    (see work.services.task_stats).
+    """
+    project = models.OneToOneField('work.Project', on_delete=models.CASCADE, primary_key=True, related_name='task_stats')
+
+    # Signed so that a drifted row cannot make a task write fail; the
+    # reconcile_project_task_stats command repairs drift.
+    todo_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    blocked_count = models.IntegerField(default=0)
+    done_count = models.IntegerField(default=0)
+
+    high_priority_count = models.IntegerField(default=0)
+    medium_priority_count = models.IntegerField(default=0)
+    low_priority_count = models.IntegerField(default=0)
+
+    estimated_hours_total = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Project task stats'
+        verbose_name_plural = 'Project task stats'
+
+    def __str__(self):
+        return f"Task stats for project {self.project_id}"
+
 
@@ -0,0 +1,109 @@
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskKeysetPagination(BasePagination):
+    """
+    Keyset pagination over the Task.Meta ordering (status_order, -priority,
+    -created_at), with -id as the tie-breaker. The cursor carries the sort
+    key of the last row, so every page is an index range scan however deep
+    it is. Requests without a cursor or page_size are left unpaginated
+    unless always_paginate is set.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 200
+    ordering = ("status_order", "-priority", "-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+    always_paginate = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if (
+            not self.always_paginate
+            and self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self._after(self.decode_cursor(cursor)))
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def encode_cursor(self, task):
+        position = [task.status_order, task.priority, task.created_at.isoformat(), task.id]
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            status_order, priority, created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            created_at = parse_datetime(created_at)
+            if created_at is None:
+                raise ValueError
+            return int(status_order), int(priority), created_at, int(task_id)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _after(position):
+        status_order, priority, created_at, task_id = position
+        return (
+            Q(status_order__gt=status_order)
+            | Q(status_order=status_order, priority__lt=priority)
+            | Q(status_order=status_order, priority=priority, created_at__lt=created_at)
+            | Q(status_order=status_order, priority=priority, created_at=created_at, id__lt=task_id)
+        )
+
+
+class AssigneeTaskPagination(TaskKeysetPagination):
+    """Always-on keyset pages for one assignee's tasks across projects."""
+
+    always_paginate = True
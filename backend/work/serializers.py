@@ -6,8 +6,26 @@ from .models import Project, Assignment, Task
 from django.core.exceptions import ValidationError,PermissionDenied
 
 from core.permissions.services import PermissionService
+from core.sparse_fields import SparseFieldsSerializerMixin
+from .services.task_rules import TaskRuleViolation, check_task_update
+from .services.task_stats import PRIORITY_COUNT_FIELDS, STATUS_COUNT_FIELDS
+
+class ProjectTaskStatsSerializer(serializers.BaseSerializer):
+    def to_representation(self, stats):
+        by_status = {status: getattr(stats, field) for status, field in STATUS_COUNT_FIELDS.items()}
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_priority": {
+                Task.Priority(priority).name: getattr(stats, field)
+                for priority, field in PRIORITY_COUNT_FIELDS.items()
+            },
+            "estimated_hours": stats.estimated_hours_total,
+        }
+
+class ProjectSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    task_stats = ProjectTaskStatsSerializer(read_only=True)
 
-class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = [
@@ -24,6 +42,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             'created_by',
             'created_at',
             'updated_at',
+            'task_stats',
         ]
         read_only_fields = [
             'id',
@@ -130,7 +149,7 @@ class ProjectMemberSerializer(serializers.ModelSerializer):
             'assigned_at',
         ]
 
-class TaskReadSerializer(serializers.ModelSerializer):
+class TaskReadSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = "__all__"
@@ -168,6 +187,47 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return user
         
         
+class TaskBulkCreateListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        # Raised from here rather than validate() so errors stay per item.
+        attrs = super().to_internal_value(data)
+        request = self.context["request"]
+        project_id = request.parser_context["kwargs"]["project_pk"]
+
+        # One membership query for every assignee in the batch.
+        assignee_ids = {item["assigned_to"] for item in attrs if item.get("assigned_to") is not None}
+        members = PermissionService.filter_project_member_ids(project_id, assignee_ids)
+
+        errors = [
+            {"assigned_to": ["Assignee must belong to this project."]}
+            if item.get("assigned_to") is not None and item["assigned_to"] not in members
+            else {}
+            for item in attrs
+        ]
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return attrs
+
+
+class TaskBulkCreateSerializer(TaskCreateSerializer):
+    """
+    One item of POST projects/{pk}/tasks/bulk/. Assignees are plain ids
+    checked for the whole batch by TaskBulkCreateListSerializer.
+    """
+    assigned_to = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta(TaskCreateSerializer.Meta):
+        list_serializer_class = TaskBulkCreateListSerializer
+
+    def validate_assigned_to(self, user_id):
+        return user_id
+
+
+class TaskBulkTransitionSerializer(serializers.Serializer):
+    task_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
+    status = serializers.ChoiceField(choices=Task.Status.choices)
+
+
 class TaskUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
@@ -180,62 +240,41 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
             "assigned_to",
         ]
 
+    def _access(self):
+        access = self.context.get("access")
+        if access is not None and access.verified(self.instance):
+            return access
+        return None
+
+    def _project(self):
+        access = self._access()
+        return access.project if access else self.instance.project
+
     def validate(self, attrs):
         request = self.context["request"]
         user = request.user
         task = self.instance
-        project = task.project
-
-        if PermissionService.is_admin(user):
-            return attrs
-
-        if not PermissionService.can_update_task(user, task):
-            raise PermissionDenied("You do not have permission to update this task.")
-
-        # EMPLOYEE rules
-        if PermissionService.is_employee(user):
-            illegal_fields = set(attrs.keys()) - {"status"}
-            if illegal_fields:
-                raise serializers.ValidationError(
-                    "Employees can only update task status."
-                )
-
-            new_status = attrs.get("status")
-
-            if task.status == Task.Status.DONE:
-                raise serializers.ValidationError(
-                    "Completed tasks are immutable."
-                )
 
-            if (
-                task.status == Task.Status.BLOCKED
-                and new_status
-                and new_status != Task.Status.BLOCKED
-            ):
-                raise serializers.ValidationError(
-                    "Only managers can unblock tasks."
-                )
-
-            return attrs
-
-        if PermissionService.can_update_project(user, project):
-            new_status = attrs.get("status")
-
-            if task.status == Task.Status.DONE:
-                raise serializers.ValidationError(
-                    "Completed tasks are immutable."
-                )
-
-            return attrs
-
-        # Anything else is forbidden
-        raise PermissionDenied("You do not have permission to update this task.")
+        try:
+            check_task_update(
+                user,
+                task,
+                attrs.keys(),
+                attrs.get("status"),
+                # TaskPermission already checked the object when the view loaded it.
+                permitted=bool(self._access()) or PermissionService.can_update_task(user, task),
+                manages_project=PermissionService.can_update_project(user, self._project()),
+            )
+        except TaskRuleViolation as exc:
+            if exc.permission:
+                raise PermissionDenied(str(exc))
+            raise serializers.ValidationError(str(exc))
+        return attrs
 
     def validate_assigned_to(self, new_user):
         request = self.context["request"]
         user = request.user
-        task = self.instance
-        project = task.project
+        project = self._project()
 
         if PermissionService.is_admin(user):
             return new_user
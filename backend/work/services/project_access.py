@@ -0,0 +1,114 @@
+from django.db import transaction
+
+from work.models import Assignment, Project, ProjectAccess
+
+
+REBUILD_CHUNK_SIZE = 500
+
+
+def expected_project_access(project_ids=None):
+    """
+    Returns the (user_id, project_id, access_kind) rows implied by the live
+    Project, Team and Assignment data.
+    """
+    projects = Project.objects.all()
+    assignments = Assignment.objects.filter(is_active=True)
+    if project_ids is not None:
+        projects = projects.filter(id__in=project_ids)
+        assignments = assignments.filter(project_id__in=project_ids)
+
+    rows = set()
+    for project_id, manager_id, team_manager_id in projects.values_list("id", "manager_id", "team__manager_id"):
+        if manager_id:
+            rows.add((manager_id, project_id, ProjectAccess.Kind.MANAGER))
+        if team_manager_id:
+            rows.add((team_manager_id, project_id, ProjectAccess.Kind.TEAM_MANAGER))
+
+    for user_id, project_id in assignments.values_list("user_id", "project_id"):
+        rows.add((user_id, project_id, ProjectAccess.Kind.MEMBER))
+
+    return rows
+
+
+def _current_project_access(project_ids):
+    entries = ProjectAccess.objects.filter(project_id__in=project_ids)
+    return {
+        (user_id, project_id, access_kind): entry_id
+        for entry_id, user_id, project_id, access_kind in entries.values_list("id", "user_id", "project_id", "access_kind")
+    }
+
+
+def refresh_project_access(project_ids):
+    """
+    Recomputes the access rows of the given projects and applies the difference.
+    """
+    project_ids = {project_id for project_id in project_ids if project_id is not None}
+    if not project_ids:
+        return
+
+    with transaction.atomic():
+        expected = expected_project_access(project_ids)
+        current = _current_project_access(project_ids)
+
+        stale_ids = [entry_id for row, entry_id in current.items() if row not in expected]
+        if stale_ids:
+            ProjectAccess.objects.filter(id__in=stale_ids).delete()
+
+        missing = expected - current.keys()
+        if missing:
+            ProjectAccess.objects.bulk_create(
+                [
+                    ProjectAccess(user_id=user_id, project_id=project_id, access_kind=access_kind)
+                    for user_id, project_id, access_kind in missing
+                ],
+                ignore_conflicts=True,
+            )
+
+
+def refresh_project_access_for_team(team_id):
+    refresh_project_access(Project.objects.filter(team_id=team_id).values_list("id", flat=True))
+
+
+def _project_id_chunks():
+    project_ids = list(Project.objects.order_by("id").values_list("id", flat=True))
+    for start in range(0, len(project_ids), REBUILD_CHUNK_SIZE):
+        yield project_ids[start:start + REBUILD_CHUNK_SIZE]
+
+
+def rebuild_project_access():
+    """
+    Drops the whole access table and rebuilds it from the live rules.
+    Returns the number of rows written.
+    """
+    written = 0
+    with transaction.atomic():
+        ProjectAccess.objects.all().delete()
+        for chunk in _project_id_chunks():
+            rows = expected_project_access(chunk)
+            ProjectAccess.objects.bulk_create(
+                [
+                    ProjectAccess(user_id=user_id, project_id=project_id, access_kind=access_kind)
+                    for user_id, project_id, access_kind in rows
+                ],
+                batch_size=1000,
+            )
+            written += len(rows)
+    return written
+
+
+def find_project_access_drift():
+    """
+    Compares the access table against the live rules.
+    Returns (missing, stale) sets of (user_id, project_id, access_kind).
+    """
+    missing = set()
+    stale = set()
+    for chunk in _project_id_chunks():
+        expected = expected_project_access(chunk)
+        current = set(_current_project_access(chunk))
+        missing |= expected - current
+        stale |= current - expected
+
+    orphaned = ProjectAccess.objects.exclude(project_id__in=Project.objects.values("id"))
+    stale |= set(orphaned.values_list("user_id", "project_id", "access_kind"))
+    return missing, stale
@@ -0,0 +1,48 @@
+from django.db.models import Case, Count, F, IntegerField, Value, When, Window
+from django.db.models.functions import Least, RowNumber
+
+from work.models import Task
+
+
+BOARD_ORDER = (F("priority").desc(), F("created_at").desc(), F("id").desc())
+
+
+def build_task_board(queryset, offsets, limit):
+    """
+    One page per status column of an already scoped task queryset, in a
+    single windowed query. `offsets` maps a status to the number of tasks
+    to skip in that column.
+
+    Returns a list of {"status", "count", "offset", "tasks"} in board order.
+    """
+    column_offset = Case(
+        *(When(status=status, then=Value(offset)) for status, offset in offsets.items() if offset),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    rows = (
+        queryset.order_by()
+        .annotate(
+            board_position=Window(RowNumber(), partition_by=[F("status")], order_by=BOARD_ORDER),
+            column_count=Window(Count("id"), partition_by=[F("status")]),
+            column_offset=column_offset,
+        )
+        # Keep the last row of a column paged past its end so its count is
+        # still known; it is dropped below.
+        .filter(
+            board_position__gt=Least(F("column_offset"), F("column_count") - 1),
+            board_position__lte=F("column_offset") + limit,
+        )
+        .order_by("status_order", "board_position")
+    )
+
+    columns = {
+        status: {"status": status, "count": 0, "offset": offsets.get(status, 0), "tasks": []}
+        for status in sorted(Task.Status.values, key=Task.STATUS_ORDER.get)
+    }
+    for task in rows:
+        column = columns[task.status]
+        column["count"] = task.column_count
+        if task.board_position > column["offset"]:
+            column["tasks"].append(task)
+    return list(columns.values())
@@ -0,0 +1,52 @@
+from core.permissions.services import PermissionService
+from work.models import Task
+
+
+class TaskRuleViolation(Exception):
+    """
+    An update a user may not make to a task. `permission` separates missing
+    rights (403) from rule breaches such as editing a completed task (400).
+    """
+
+    def __init__(self, message, permission=False):
+        super().__init__(message)
+        self.permission = permission
+
+
+def check_task_update(user, task, fields, new_status=None, *, permitted, manages_project):
+    """
+    Apply the task update rules for `user` changing `fields` of `task`.
+
+    `permitted` is the outcome of PermissionService.can_update_task and
+    `manages_project` of PermissionService.can_update_project for the
+    task's project; callers pass them in so batches can reuse loaded rows.
+    """
+    if PermissionService.is_admin(user):
+        return
+
+    if not permitted:
+        raise TaskRuleViolation("You do not have permission to update this task.", permission=True)
+
+    # EMPLOYEE rules
+    if PermissionService.is_employee(user):
+        if set(fields) - {"status"}:
+            raise TaskRuleViolation("Employees can only update task status.")
+
+        if task.status == Task.Status.DONE:
+            raise TaskRuleViolation("Completed tasks are immutable.")
+
+        if (
+            task.status == Task.Status.BLOCKED
+            and new_status
+            and new_status != Task.Status.BLOCKED
+        ):
+            raise TaskRuleViolation("Only managers can unblock tasks.")
+        return
+
+    if manages_project:
+        if task.status == Task.Status.DONE:
+            raise TaskRuleViolation("Completed tasks are immutable.")
+        return
+
+    # Anything else is forbidden
+    raise TaskRuleViolation("You do not have permission to update this task.", permission=True)
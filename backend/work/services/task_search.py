@@ -0,0 +1,39 @@
+from django.db import connection
+from django.db.models import BooleanField, Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+
+# Must match the configuration the search_vector column is built with
+# (work/migrations/0009_task_search_vector.py).
+SEARCH_CONFIG = "english"
+
+
+def search_tasks(queryset, term):
+    """
+    Ranked full-text search over an already scoped task queryset.
+
+    On Postgres this matches the indexed search_vector column with
+    websearch_to_tsquery and ranks with ts_rank. Other databases fall back
+    to a case-insensitive LIKE on every word, ranking title hits first.
+    Each returned task carries a `search_rank` annotation.
+    """
+    term = (term or "").strip()
+    if not term:
+        return queryset.none()
+
+    if connection.vendor == "postgresql":
+        tsquery = "websearch_to_tsquery(%s::regconfig, %s)"
+        return (
+            queryset
+            .filter(RawSQL(f'"work_task"."search_vector" @@ {tsquery}', (SEARCH_CONFIG, term), output_field=BooleanField()))
+            .annotate(search_rank=RawSQL(f'ts_rank("work_task"."search_vector", {tsquery})', (SEARCH_CONFIG, term), output_field=FloatField()))
+            .order_by("-search_rank", "-created_at", "-id")
+        )
+
+    for word in term.split():
+        queryset = queryset.filter(Q(title__icontains=word) | Q(description__icontains=word))
+    return (
+        queryset
+        .annotate(search_rank=Case(When(title__icontains=term, then=Value(1.0)), default=Value(0.5), output_field=FloatField()))
+        .order_by("-search_rank", "-created_at", "-id")
+    )
@@ -0,0 +1,173 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+
+from work.models import Project, ProjectTaskStats, Task
+
+
+REBUILD_CHUNK_SIZE = 500
+
+STATUS_COUNT_FIELDS = {
+    Task.Status.TODO: "todo_count",
+    Task.Status.IN_PROGRESS: "in_progress_count",
+    Task.Status.REVIEW: "review_count",
+    Task.Status.BLOCKED: "blocked_count",
+    Task.Status.DONE: "done_count",
+}
+PRIORITY_COUNT_FIELDS = {
+    Task.Priority.HIGH: "high_priority_count",
+    Task.Priority.MEDIUM: "medium_priority_count",
+    Task.Priority.LOW: "low_priority_count",
+}
+STATS_FIELDS = (*STATUS_COUNT_FIELDS.values(), *PRIORITY_COUNT_FIELDS.values(), "estimated_hours_total")
+
+# Task columns the stats are derived from, by attname.
+TASK_STATS_SOURCES = ("project_id", "status", "priority", "estimated_hours")
+
+
+class TaskStatsDelta:
+    """Accumulates per-project stat changes to apply in one UPDATE per project."""
+
+    def __init__(self):
+        self._changes = defaultdict(Counter)
+
+    def add(self, project_id, status, priority, estimated_hours, sign=1):
+        self.add_group(project_id, status, priority, sign, sign * (estimated_hours or 0))
+
+    def add_group(self, project_id, status, priority, count, estimated_hours):
+        """Adds `count` tasks sharing a status and priority; negative values remove them."""
+        changes = self._changes[project_id]
+        changes[STATUS_COUNT_FIELDS[status]] += count
+        changes[PRIORITY_COUNT_FIELDS[priority]] += count
+        changes["estimated_hours_total"] += estimated_hours
+
+    def change_status(self, project_id, old_status, new_status):
+        changes = self._changes[project_id]
+        changes[STATUS_COUNT_FIELDS[old_status]] -= 1
+        changes[STATUS_COUNT_FIELDS[new_status]] += 1
+
+    def add_values(self, values, sign=1):
+        self.add(values["project_id"], values["status"], values["priority"], values["estimated_hours"], sign)
+
+    def add_task(self, task, sign=1):
+        self.add(task.project_id, task.status, task.priority, task.estimated_hours, sign)
+
+    def apply(self, create_missing=True):
+        """
+        Applies the accumulated deltas with F() expressions. A project
+        without a stats row is recounted from scratch when create_missing
+        is set; deletes pass False so a cascading project delete does not
+        recreate the row it is removing.
+        """
+        missing = []
+        for project_id, changes in self._changes.items():
+            updates = {field: F(field) + value for field, value in changes.items() if value}
+            if updates and not ProjectTaskStats.objects.filter(project_id=project_id).update(**updates):
+                missing.append(project_id)
+        if create_missing and missing:
+            refresh_task_stats(missing)
+        self._changes.clear()
+
+
+def record_task_save(task, previous, update_fields=None):
+    """
+    Moves one saved task's contribution from `previous` (its stats source
+    values before the save, or None when it is new) to its current values.
+    """
+    current = {
+        name: getattr(task, name)
+        if previous is None or update_fields is None or {name, name.removesuffix("_id")} & set(update_fields)
+        else previous[name]
+        for name in TASK_STATS_SOURCES
+    }
+    if current != previous:
+        delta = TaskStatsDelta()
+        if previous is not None:
+            delta.add_values(previous, sign=-1)
+        delta.add_values(current)
+        delta.apply()
+
+
+def record_tasks_deleted(queryset):
+    """
+    Removes the tasks of a queryset about to be deleted from their
+    projects' stats, counted with one grouped query. Returns the project ids.
+    """
+    delta = TaskStatsDelta()
+    rows = (
+        queryset.order_by()
+        .values("project_id", "status", "priority")
+        .annotate(tasks=Count("id"), hours=Coalesce(Sum("estimated_hours"), 0))
+    )
+    project_ids = set()
+    for row in rows:
+        delta.add_group(row["project_id"], row["status"], row["priority"], -row["tasks"], -row["hours"])
+        project_ids.add(row["project_id"])
+    delta.apply(create_missing=False)
+    return project_ids
+
+
+def _stats_aggregates():
+    aggregates = {field: Count("id", filter=Q(status=status)) for status, field in STATUS_COUNT_FIELDS.items()}
+    aggregates.update(
+        {field: Count("id", filter=Q(priority=priority)) for priority, field in PRIORITY_COUNT_FIELDS.items()}
+    )
+    aggregates["estimated_hours_total"] = Coalesce(Sum("estimated_hours"), 0)
+    return aggregates
+
+
+def expected_task_stats(project_ids):
+    """Counts the given projects' tasks with one GROUP BY; returns {project_id: {field: value}}."""
+    expected = {project_id: dict.fromkeys(STATS_FIELDS, 0) for project_id in project_ids}
+    rows = (
+        Task.objects.filter(project_id__in=project_ids)
+        .order_by()
+        .values("project_id")
+        .annotate(**_stats_aggregates())
+    )
+    for row in rows:
+        expected[row.pop("project_id")] = row
+    return expected
+
+
+def refresh_task_stats(project_ids):
+    """Recounts the stats rows of the given projects and writes them."""
+    project_ids = set(Project.objects.filter(id__in=project_ids).values_list("id", flat=True))
+    if not project_ids:
+        return
+
+    with transaction.atomic():
+        expected = expected_task_stats(project_ids)
+        existing = set(ProjectTaskStats.objects.filter(project_id__in=project_ids).values_list("project_id", flat=True))
+        rows = [ProjectTaskStats(project_id=project_id, **values) for project_id, values in expected.items()]
+        ProjectTaskStats.objects.bulk_create([row for row in rows if row.project_id not in existing])
+        ProjectTaskStats.objects.bulk_update([row for row in rows if row.project_id in existing], STATS_FIELDS)
+
+
+def _project_id_chunks(project_ids=None):
+    if project_ids is None:
+        project_ids = Project.objects.order_by("id").values_list("id", flat=True)
+    project_ids = sorted(project_ids)
+    for start in range(0, len(project_ids), REBUILD_CHUNK_SIZE):
+        yield project_ids[start:start + REBUILD_CHUNK_SIZE]
+
+
+def find_task_stats_drift(project_ids=None):
+    """
+    Compares stored stats with a fresh count. Returns {project_id: (expected,
+    stored)} for every project that differs; stored is None when the row is
+    missing.
+    """
+    drift = {}
+    for chunk in _project_id_chunks(project_ids):
+        expected = expected_task_stats(chunk)
+        stored = {
+            row.pop("project_id"): row
+            for row in ProjectTaskStats.objects.filter(project_id__in=chunk).values("project_id", *STATS_FIELDS)
+        }
+        for project_id, values in expected.items():
+            if stored.get(project_id) != values:
+                drift[project_id] = (values, stored.get(project_id))
+    return drift
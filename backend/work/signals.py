@@ -0,0 +1,80 @@
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from accounts.models import User
+from core.permissions.shared_cache import bump_project_version
+from organization.models import Team
+from .models import Assignment, Project, ProjectTaskStats, Task
+from .services.project_access import refresh_project_access
+from .services.task_stats import TaskStatsDelta, record_tasks_deleted
+
+
+@receiver(post_save, sender=Project)
+def refresh_access_on_project_save(sender, instance, **kwargs):
+    refresh_project_access([instance.id])
+
+
+@receiver(post_save, sender=Project)
+def create_task_stats(sender, instance, created, **kwargs):
+    if created:
+        ProjectTaskStats.objects.bulk_create([ProjectTaskStats(project=instance)], ignore_conflicts=True)
+
+
+@receiver(post_delete, sender=Project)
+def forget_deleted_project(sender, instance, **kwargs):
+    bump_project_version(instance.id)
+
+
+@receiver(pre_delete, sender=Task)
+def update_projects_on_task_queryset_delete(sender, instance, origin=None, **kwargs):
+    # A queryset delete signals once per task; count the whole queryset on
+    # the first signal so each project gets one UPDATE rather than one per task.
+    if not isinstance(origin, QuerySet) or origin.model is not Task or getattr(origin, "_task_stats_recorded", False):
+        return
+    origin._task_stats_recorded = True
+    project_ids = record_tasks_deleted(origin)
+    if project_ids:
+        Project.bump_task_version(*project_ids)
+
+
+@receiver(post_delete, sender=Task)
+def update_project_on_task_delete(sender, instance, origin=None, **kwargs):
+    # Queryset deletes were counted in pre_delete, and a project delete takes
+    # its stats row and task_version with it.
+    if isinstance(origin, (QuerySet, Project)):
+        return
+    delta = TaskStatsDelta()
+    delta.add_task(instance, sign=-1)
+    delta.apply(create_missing=False)
+    Project.bump_task_version(instance.project_id)
+
+
+@receiver(pre_delete, sender=User)
+def touch_tasks_of_deleted_user(sender, instance, **kwargs):
+    # The delete nulls assigned_to/created_by with a plain UPDATE that moves
+    # neither updated_at nor task_version, so cached task ETags would still
+    # match. Move both up front, once per project.
+    tasks = Task.objects.filter(Q(assigned_to=instance) | Q(created_by=instance))
+    project_ids = set(tasks.order_by().values_list("project_id", flat=True))
+    if project_ids:
+        tasks.update(updated_at=timezone.now())
+        Project.bump_task_version(*project_ids)
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+def refresh_access_on_assignment_change(sender, instance, **kwargs):
+    refresh_project_access([instance.project_id])
+
+
+@receiver(pre_delete, sender=Team)
+def remember_team_projects(sender, instance, **kwargs):
+    # Projects lose their team through SET_NULL, so collect them up front.
+    instance._access_project_ids = list(instance.projects.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Team)
+def refresh_access_on_team_delete(sender, instance, **kwargs):
+    refresh_project_access(getattr(instance, "_access_project_ids", []))
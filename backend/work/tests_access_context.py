@@ -0,0 +1,84 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from audit.models import ActivityLog
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+class AccessContextQueryTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.other_employee = User.objects.create_user(email="emp2@test.com", username="emp2", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        Assignment.objects.create(project=self.project, user=self.other_employee, role="SOFTWARE_ENGINEER")
+        self.task = Task.objects.create(project=self.project, title="Task 1", assigned_to=self.employee)
+        self.url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.task.id})
+
+    def test_employee_status_update_loads_task_once(self):
+        self.client.force_authenticate(user=self.employee)
+
+        # collection check (2), scoped task load, locked stats read, update, stats delta,
+        # task_version bump
+        with self.assertNumQueries(7):
+            response = self.client.patch(self.url, {"status": Task.Status.IN_PROGRESS})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_manager_reassignment_loads_task_once(self):
+        self.client.force_authenticate(user=self.manager)
+
+        # collection check, scoped task load, assignee lookup, assignee membership, locked
+        # stats read, update, task_version bump (the stats are unchanged by a reassignment)
+        with self.assertNumQueries(7):
+            response = self.client.patch(self.url, {"assigned_to": self.other_employee.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.assigned_to, self.other_employee)
+
+    def test_serializer_rules_still_apply(self):
+        self.client.force_authenticate(user=self.employee)
+        response = self.client.patch(self.url, {"title": "Renamed"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.other_employee)
+        response = self.client.patch(self.url, {"status": Task.Status.DONE})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_manager_delete_loads_task_once(self):
+        self.client.force_authenticate(user=self.manager)
+        task_id = self.task.id
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.delete(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        task_loads = [query for query in context.captured_queries if query["sql"].startswith('SELECT "work_task"."id"')]
+        self.assertEqual(len(task_loads), 1)
+        log = ActivityLog.objects.get(action_type="TASK_DELETED", target_id=task_id)
+        self.assertEqual(log.metadata["status"], {"old": Task.Status.TODO, "new": None})
+
+    def test_update_log_diffs_against_the_pre_change_snapshot(self):
+        self.client.force_authenticate(user=self.manager)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, {"title": "Renamed", "priority": Task.Priority.HIGH})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        log = ActivityLog.objects.get(action_type="TASK_DETAILS_UPDATED", target_id=self.task.id)
+        self.assertEqual(log.metadata, {
+            "title": {"old": "Task 1", "new": "Renamed"},
+            "priority": {"old": Task.Priority.LOW, "new": Task.Priority.HIGH},
+        })
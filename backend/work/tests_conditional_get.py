@@ -0,0 +1,153 @@
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+from work.serializers import TaskReadSerializer
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.task = Task.objects.create(project=self.project, title="Task", assigned_to=self.employee)
+        self.tasks_url = reverse("project-tasks-list", kwargs={"project_pk": self.project.id})
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_task_list_answers_304_with_one_lookup_and_no_serialization(self):
+        self.client.force_authenticate(user=self.manager)
+        first = self.client.get(self.tasks_url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        with mock.patch.object(TaskReadSerializer, "to_representation") as to_representation:
+            # The project permission check, then the version lookup.
+            with self.assertNumQueries(2):
+                response = self.client.get(self.tasks_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        to_representation.assert_not_called()
+
+    def test_task_writes_change_the_list_etag(self):
+        self.client.force_authenticate(user=self.manager)
+        etag = self.client.get(self.tasks_url)["ETag"]
+
+        self.task.title = "Renamed"
+        self.task.save()
+        response = self._revalidate(self.tasks_url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        transition_url = reverse("project-tasks-bulk-transition", kwargs={"project_pk": self.project.id})
+        self.client.post(transition_url, {"task_ids": [self.task.id], "status": Task.Status.IN_PROGRESS}, format="json")
+        response = self._revalidate(self.tasks_url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        Task.objects.get(pk=self.task.pk).delete()
+        self.assertEqual(self._revalidate(self.tasks_url, etag).status_code, status.HTTP_200_OK)
+
+    def test_etag_differs_per_user_and_query(self):
+        self.client.force_authenticate(user=self.manager)
+        manager_etag = self.client.get(self.tasks_url)["ETag"]
+        filtered_etag = self.client.get(self.tasks_url, {"page_size": 1})["ETag"]
+
+        self.client.force_authenticate(user=self.employee)
+        self.assertEqual(self._revalidate(self.tasks_url, manager_etag).status_code, status.HTTP_200_OK)
+        self.assertNotEqual(manager_etag, filtered_etag)
+
+    def test_task_retrieve_revalidates_against_updated_at(self):
+        url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.task.id})
+        self.client.force_authenticate(user=self.employee)
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self._revalidate(url, etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(url, {"status": Task.Status.IN_PROGRESS}, format="json")
+        self.assertEqual(self._revalidate(url, etag).status_code, status.HTTP_200_OK)
+
+    def test_project_detail_and_list(self):
+        detail_url = reverse("project-detail", kwargs={"pk": self.project.id})
+        list_url = reverse("project-list")
+        self.client.force_authenticate(user=self.manager)
+        detail_etag = self.client.get(detail_url)["ETag"]
+        list_etag = self.client.get(list_url)["ETag"]
+
+        self.assertEqual(self._revalidate(detail_url, detail_etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(self._revalidate(list_url, list_etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.project.description = "Changed"
+        self.project.save()
+        self.assertEqual(self._revalidate(detail_url, detail_etag).status_code, status.HTTP_200_OK)
+        self.assertEqual(self._revalidate(list_url, list_etag).status_code, status.HTTP_200_OK)
+
+    def test_team_list_changes_when_team_is_updated(self):
+        list_url = reverse("team-list")
+        self.client.force_authenticate(user=self.manager)
+        etag = self.client.get(list_url)["ETag"]
+
+        self.assertEqual(self._revalidate(list_url, etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.team.name = "Team B"
+        self.team.save()
+        self.assertEqual(self._revalidate(list_url, etag).status_code, status.HTTP_200_OK)
+
+    def test_team_list_changes_when_the_member_moves_team(self):
+        other = Team.objects.create(name="Team B", code="TB", department=self.dept, manager=self.manager)
+        Team.objects.update(updated_at=self.team.updated_at)
+        self.employee.team = self.team
+        self.employee.save(update_fields=["team"])
+        list_url = reverse("team-list")
+        self.client.force_authenticate(user=self.employee)
+        etag = self.client.get(list_url)["ETag"]
+
+        self.employee.team = other
+        self.employee.save(update_fields=["team"])
+
+        self.assertEqual(self._revalidate(list_url, etag).status_code, status.HTTP_200_OK)
+
+    @override_settings(PERMISSION_SHARED_CACHE_ENABLED=True)
+    def test_team_list_changes_when_membership_changes(self):
+        self.employee.department = self.dept
+        self.employee.save(update_fields=["department"])
+        list_url = reverse("team-list")
+        self.client.force_authenticate(user=self.manager)
+        etag = self.client.get(list_url)["ETag"]
+        self.assertEqual(self._revalidate(list_url, etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.post(
+            reverse("team-assign-user", kwargs={"pk": self.team.id}), {"user_id": self.employee.id}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._revalidate(list_url, etag).status_code, status.HTTP_200_OK)
+
+    def test_deleting_the_assignee_changes_task_etags(self):
+        leaver = User.objects.create_user(email="leaver@test.com", username="leaver", role=User.Role.EMPLOYEE)
+        Task.objects.filter(pk=self.task.pk).update(assigned_to=leaver)
+        detail_url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.task.id})
+        self.client.force_authenticate(user=self.manager)
+        list_etag = self.client.get(self.tasks_url)["ETag"]
+        detail_etag = self.client.get(detail_url)["ETag"]
+
+        leaver.delete()
+
+        self.assertEqual(self._revalidate(self.tasks_url, list_etag).status_code, status.HTTP_200_OK)
+        response = self._revalidate(detail_url, detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["assigned_to"])
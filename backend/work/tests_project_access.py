@@ -0,0 +1,77 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from core.permissions.services import PermissionService
+from organization.models import Department, Team
+from work.models import Assignment, Project, ProjectAccess
+
+
+class ProjectAccessIndexTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", password="password", role=User.Role.ADMIN)
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", password="password", role=User.Role.MANAGER)
+        self.new_manager = User.objects.create_user(email="manager2@test.com", username="manager2", password="password", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", password="password", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1",
+            code="P1",
+            team=self.team,
+            department=self.dept,
+            start_date="2026-01-01",
+            created_by=self.admin,
+        )
+
+    def _rows(self):
+        return set(ProjectAccess.objects.values_list("user_id", "project_id", "access_kind"))
+
+    def test_project_save_indexes_managers(self):
+        self.assertSetEqual(
+            self._rows(),
+            {
+                (self.manager.id, self.project.id, ProjectAccess.Kind.MANAGER),
+                (self.manager.id, self.project.id, ProjectAccess.Kind.TEAM_MANAGER),
+            },
+        )
+
+    def test_assignment_writes_maintain_member_rows(self):
+        assignment = Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.assertIn((self.employee.id, self.project.id, ProjectAccess.Kind.MEMBER), self._rows())
+        self.assertIn(self.project, PermissionService.scope_projects(self.employee, Project.objects.all()))
+
+        assignment.is_active = False
+        assignment.save()
+        self.assertNotIn((self.employee.id, self.project.id, ProjectAccess.Kind.MEMBER), self._rows())
+        self.assertFalse(PermissionService.scope_projects(self.employee, Project.objects.all()).exists())
+
+    def test_team_manager_change_moves_manager_rows(self):
+        self.team.manager = self.new_manager
+        self.team.save()
+
+        self.assertSetEqual(
+            self._rows(),
+            {
+                (self.new_manager.id, self.project.id, ProjectAccess.Kind.MANAGER),
+                (self.new_manager.id, self.project.id, ProjectAccess.Kind.TEAM_MANAGER),
+            },
+        )
+        self.assertFalse(PermissionService.scope_projects(self.manager, Project.objects.all()).exists())
+        self.assertTrue(PermissionService.scope_projects(self.new_manager, Project.objects.all()).exists())
+
+    def test_rebuild_command_repairs_drift(self):
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        ProjectAccess.objects.filter(user=self.employee).delete()
+        ProjectAccess.objects.create(user=self.new_manager, project=self.project, access_kind=ProjectAccess.Kind.MANAGER)
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_project_access", "--check", stdout=StringIO(), stderr=StringIO())
+
+        call_command("rebuild_project_access", stdout=StringIO())
+        call_command("rebuild_project_access", "--check", stdout=StringIO())
+        self.assertIn((self.employee.id, self.project.id, ProjectAccess.Kind.MEMBER), self._rows())
+        self.assertNotIn((self.new_manager.id, self.project.id, ProjectAccess.Kind.MANAGER), self._rows())
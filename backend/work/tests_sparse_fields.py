@@ -0,0 +1,87 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+class SparseFieldsTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", description="Long project text", team=self.team,
+            department=self.dept, start_date="2026-01-01", created_by=self.manager,
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.tasks = [
+            Task.objects.create(project=self.project, title=f"Task {index}", description="x" * 500, assigned_to=self.employee)
+            for index in range(3)
+        ]
+        self.tasks_url = reverse("project-tasks-list", kwargs={"project_pk": self.project.id})
+        self.client.force_authenticate(user=self.manager)
+
+    def _task_select(self, context):
+        return [query["sql"] for query in context.captured_queries if query["sql"].startswith('SELECT "work_task"."id"')]
+
+    def test_task_list_is_compact_and_never_reads_descriptions(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.tasks_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("description", response.data[0])
+        self.assertIn("title", response.data[0])
+        [sql] = self._task_select(context)
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_task_detail_keeps_the_full_representation(self):
+        url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": self.tasks[0].id})
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["description"], "x" * 500)
+        self.assertIn("created_by", response.data)
+
+    def test_fields_parameter_selects_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.tasks_url, {"fields": "title,description"})
+
+        self.assertEqual(set(response.data[0]), {"id", "title", "description"})
+        [sql] = self._task_select(context)
+        self.assertIn('"description"', sql)
+        self.assertNotIn('"estimated_hours"', sql)
+
+    def test_omit_parameter_trims_detail(self):
+        url = reverse("project-detail", kwargs={"pk": self.project.id})
+        response = self.client.get(url, {"omit": "description,created_by"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("description", response.data)
+        self.assertNotIn("created_by", response.data)
+        self.assertEqual(response.data["code"], "P1")
+
+    def test_project_list_is_compact(self):
+        response = self.client.get(reverse("project-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("description", response.data[0])
+        self.assertEqual(response.data[0]["code"], "P1")
+
+    def test_sparse_list_still_pages_by_cursor(self):
+        first = self.client.get(self.tasks_url, {"page_size": 2, "fields": "title"})
+        second = self.client.get(first.data["next"])
+
+        titles = [row["title"] for row in first.data["results"] + second.data["results"]]
+        self.assertCountEqual(titles, [task.title for task in self.tasks])
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(self.tasks_url, {"fields": "title,secret"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("secret", str(response.data["fields"]))
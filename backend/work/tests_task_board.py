@@ -0,0 +1,78 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+class TaskBoardTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+
+        for index in range(5):
+            Task.objects.create(project=self.project, title=f"Todo {index}", priority=Task.Priority.values[index % 3])
+        for index in range(2):
+            Task.objects.create(project=self.project, title=f"Done {index}", status=Task.Status.DONE, assigned_to=self.employee)
+
+        self.url = reverse("project-tasks-board", kwargs={"project_pk": self.project.id})
+
+    def _columns(self, response):
+        return {column["status"]: column for column in response.data["columns"]}
+
+    def test_board_groups_tasks_in_a_single_query(self):
+        self.client.force_authenticate(user=self.manager)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, {"limit": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task_queries = [query for query in context.captured_queries if '"work_task"' in query["sql"]]
+        self.assertEqual(len(task_queries), 1)
+
+        columns = self._columns(response)
+        self.assertEqual([column["status"] for column in response.data["columns"]], ["TODO", "IN_PROGRESS", "REVIEW", "BLOCKED", "DONE"])
+        self.assertEqual(columns["TODO"]["count"], 5)
+        self.assertEqual(columns["TODO"]["next_offset"], 2)
+        self.assertEqual(columns["DONE"]["count"], 2)
+        self.assertIsNone(columns["DONE"]["next_offset"])
+        self.assertEqual(columns["REVIEW"], {"status": "REVIEW", "count": 0, "offset": 0, "next_offset": None, "results": []})
+
+        expected = list(
+            Task.objects.filter(status=Task.Status.TODO).order_by("-priority", "-created_at", "-id").values_list("id", flat=True)[:2]
+        )
+        self.assertEqual([task["id"] for task in columns["TODO"]["results"]], expected)
+
+    def test_columns_page_independently(self):
+        self.client.force_authenticate(user=self.manager)
+        expected = list(
+            Task.objects.filter(status=Task.Status.TODO).order_by("-priority", "-created_at", "-id").values_list("id", flat=True)
+        )
+
+        response = self.client.get(self.url, {"limit": 2, "offset_TODO": 4, "offset_DONE": 5})
+        columns = self._columns(response)
+
+        self.assertEqual([task["id"] for task in columns["TODO"]["results"]], expected[4:])
+        self.assertIsNone(columns["TODO"]["next_offset"])
+        self.assertEqual(columns["DONE"]["count"], 2)
+        self.assertEqual(columns["DONE"]["results"], [])
+
+    def test_board_respects_task_scoping(self):
+        self.client.force_authenticate(user=self.employee)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        columns = self._columns(response)
+        self.assertEqual(columns["TODO"]["count"], 0)
+        self.assertEqual(columns["DONE"]["count"], 2)
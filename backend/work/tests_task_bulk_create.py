@@ -0,0 +1,91 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from audit.models import ActivityLog
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+class TaskBulkCreateTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.outsider = User.objects.create_user(email="out@test.com", username="out", role=User.Role.EMPLOYEE)
+        self.members = [
+            User.objects.create_user(email=f"emp{index}@test.com", username=f"emp{index}", role=User.Role.EMPLOYEE)
+            for index in range(3)
+        ]
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        for member in self.members:
+            Assignment.objects.create(project=self.project, user=member, role="SOFTWARE_ENGINEER")
+
+        self.url = reverse("project-tasks-bulk-create", kwargs={"project_pk": self.project.id})
+        self.client.force_authenticate(user=self.manager)
+
+    def _payload(self, count):
+        return [
+            {
+                "title": f"Task {index}",
+                "status": Task.Status.DONE if index % 2 else Task.Status.TODO,
+                "assigned_to": self.members[index % len(self.members)].id,
+            }
+            for index in range(count)
+        ]
+
+    def test_bulk_create_uses_constant_queries_and_one_log_batch(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with CaptureQueriesContext(connection) as small:
+                response = self.client.post(self.url, self._payload(3), format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(callbacks), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as large:
+                self.client.post(self.url, self._payload(30), format="json")
+
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+        self.assertEqual(Task.objects.count(), 33)
+        self.assertEqual(ActivityLog.objects.filter(action_type="TASK_CREATED").count(), 33)
+        self.assertSetEqual(
+            set(Task.objects.filter(status=Task.Status.DONE).values_list("status_order", flat=True)),
+            {Task.STATUS_ORDER[Task.Status.DONE]},
+        )
+
+    def test_results_follow_request_order(self):
+        # Meta ordering would list the TODO items before the DONE ones.
+        payload = self._payload(4)
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([task["title"] for task in response.data], [item["title"] for item in payload])
+
+    def test_invalid_items_reject_whole_batch_with_per_item_errors(self):
+        payload = self._payload(3)
+        payload[1]["assigned_to"] = self.outsider.id
+        payload[2]["title"] = ""
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("title", response.data[2])
+        self.assertFalse(Task.objects.exists())
+
+        payload[2]["title"] = "Fixed"
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[1], {"assigned_to": ["Assignee must belong to this project."]})
+
+    def test_employee_cannot_bulk_create(self):
+        self.client.force_authenticate(user=self.members[0])
+        response = self.client.post(self.url, self._payload(1), format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,81 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from audit.models import ActivityLog
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+class TaskBulkTransitionTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.review = [
+            Task.objects.create(project=self.project, title=f"Review {index}", status=Task.Status.REVIEW, assigned_to=self.employee)
+            for index in range(4)
+        ]
+        self.url = reverse("project-tasks-bulk-transition", kwargs={"project_pk": self.project.id})
+
+    def _post(self, task_ids, new_status):
+        return self.client.post(self.url, {"task_ids": task_ids, "status": new_status}, format="json")
+
+    def test_manager_closes_tasks_with_one_update_and_one_log_batch(self):
+        self.client.force_authenticate(user=self.manager)
+        ids = [task.id for task in self.review]
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with CaptureQueriesContext(connection) as context:
+                response = self._post(ids, Task.Status.DONE)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], sorted(ids))
+        updates = [query for query in context.captured_queries if query["sql"].startswith('UPDATE "work_task"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(len(callbacks), 1)
+
+        self.assertSetEqual(
+            set(Task.objects.values_list("status", "status_order")),
+            {(Task.Status.DONE, Task.STATUS_ORDER[Task.Status.DONE])},
+        )
+        self.assertEqual(ActivityLog.objects.filter(action_type="TASK_STATUS_CHANGED").count(), 4)
+
+    def test_done_tasks_are_immutable(self):
+        done = Task.objects.create(project=self.project, title="Done", status=Task.Status.DONE)
+        self.client.force_authenticate(user=self.manager)
+
+        response = self._post([self.review[0].id, done.id], Task.Status.IN_PROGRESS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"], {done.id: "Completed tasks are immutable."})
+        self.review[0].refresh_from_db()
+        self.assertEqual(self.review[0].status, Task.Status.REVIEW)
+
+    def test_employee_cannot_unblock(self):
+        blocked = Task.objects.create(
+            project=self.project, title="Blocked", status=Task.Status.BLOCKED, assigned_to=self.employee
+        )
+        self.client.force_authenticate(user=self.employee)
+
+        response = self._post([blocked.id], Task.Status.IN_PROGRESS)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"], {blocked.id: "Only managers can unblock tasks."})
+
+        response = self._post([self.review[0].id, self.review[1].id], Task.Status.IN_PROGRESS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["updated"]), 2)
+
+    def test_unknown_or_hidden_tasks_are_reported(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self._post([self.review[0].id, 10 ** 9], Task.Status.DONE)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"], {10 ** 9: "Task not found."})
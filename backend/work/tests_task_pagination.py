@@ -0,0 +1,61 @@
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Project, Task
+
+
+class TaskKeysetPaginationTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+        statuses = [Task.Status.TODO, Task.Status.DONE, Task.Status.IN_PROGRESS]
+        for index in range(9):
+            Task.objects.create(
+                project=self.project,
+                title=f"Task {index}",
+                status=statuses[index % 3],
+                priority=Task.Priority.values[index % 2],
+            )
+        # Identical timestamps force the id tie-breaker.
+        Task.objects.update(created_at=timezone.now())
+
+        self.url = reverse("project-tasks-list", kwargs={"project_pk": self.project.id})
+        self.client.force_authenticate(user=self.manager)
+
+    def _expected_ids(self):
+        return list(
+            Task.objects.order_by("status_order", "-priority", "-created_at", "-id").values_list("id", flat=True)
+        )
+
+    def test_without_cursor_returns_unpaginated_list(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 9)
+
+    def test_walking_pages_visits_every_task_once_in_order(self):
+        seen = []
+        url = f"{self.url}?page_size=2"
+        while url:
+            # permission check, ETag version lookup, page
+            with self.assertNumQueries(3):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(seen, self._expected_ids())
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
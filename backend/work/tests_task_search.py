@@ -0,0 +1,87 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+from work.services.task_search import search_tasks
+
+
+class TaskSearchTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.other_manager = User.objects.create_user(email="other@test.com", username="other", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        other_team = Team.objects.create(name="Team B", code="TB", department=self.dept, manager=self.other_manager)
+        self.project = self._project("P1", team)
+        self.second_project = self._project("P2", team)
+        self.foreign_project = self._project("P3", other_team)
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+
+        self.title_hit = Task.objects.create(project=self.project, title="Fix login redirect", assigned_to=self.employee)
+        self.description_hit = Task.objects.create(
+            project=self.project, title="Session cleanup", description="Users lose their login state"
+        )
+        self.second_hit = Task.objects.create(project=self.second_project, title="Login audit trail")
+        self.foreign_hit = Task.objects.create(project=self.foreign_project, title="Login page copy")
+        Task.objects.create(project=self.project, title="Unrelated", description="Nothing to see")
+
+    def _project(self, code, team):
+        return Project.objects.create(
+            name=code, code=code, team=team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+
+    def _ids(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["id"] for row in response.data]
+
+    def test_project_search_ranks_title_matches_first(self):
+        self.client.force_authenticate(user=self.manager)
+        url = reverse("project-tasks-search", kwargs={"project_pk": self.project.id})
+
+        ids = self._ids(self.client.get(url, {"q": "login"}))
+
+        self.assertEqual(ids, [self.title_hit.id, self.description_hit.id])
+
+    def test_search_across_projects_is_scoped(self):
+        url = reverse("task-search")
+
+        self.client.force_authenticate(user=self.manager)
+        self.assertCountEqual(
+            self._ids(self.client.get(url, {"q": "login"})),
+            [self.title_hit.id, self.description_hit.id, self.second_hit.id],
+        )
+
+        self.client.force_authenticate(user=self.employee)
+        self.assertEqual(self._ids(self.client.get(url, {"q": "login"})), [self.title_hit.id])
+
+    def test_all_words_must_match(self):
+        self.client.force_authenticate(user=self.manager)
+        ids = self._ids(self.client.get(reverse("task-search"), {"q": "login audit"}))
+
+        self.assertEqual(ids, [self.second_hit.id])
+
+    def test_results_are_compact_and_limited(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(reverse("task-search"), {"q": "login", "limit": 1})
+
+        self.assertEqual(len(response.data), 1)
+        self.assertNotIn("description", response.data[0])
+
+    def test_empty_query_returns_nothing(self):
+        self.client.force_authenticate(user=self.manager)
+        self.assertEqual(self._ids(self.client.get(reverse("task-search"), {"q": "  "})), [])
+
+    @skipUnless(connection.vendor == "postgresql", "search_vector exists on Postgres only")
+    def test_postgres_matches_word_stems(self):
+        results = list(search_tasks(Task.objects.all(), "logins"))
+
+        self.assertIn(self.title_hit, results)
+        # Title words carry weight A, so the description-only hit ranks last.
+        self.assertEqual(results[-1], self.description_hit)
@@ -0,0 +1,229 @@
+import threading
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, connections, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Assignment, Project, ProjectTaskStats, Task
+from work.services.task_stats import find_task_stats_drift
+
+
+class ProjectTaskStatsTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        self.project = self._project("P1")
+        Assignment.objects.create(project=self.project, user=self.employee, role="SOFTWARE_ENGINEER")
+        self.client.force_authenticate(user=self.manager)
+
+    def _project(self, code):
+        return Project.objects.create(
+            name=code, code=code, team=self.team, department=self.dept, start_date="2026-01-01", created_by=self.manager
+        )
+
+    def _stats(self):
+        return ProjectTaskStats.objects.get(project=self.project)
+
+    def assertNoDrift(self):
+        self.assertEqual(find_task_stats_drift(), {})
+
+    def test_new_project_starts_with_an_empty_row(self):
+        stats = self._stats()
+
+        self.assertEqual((stats.todo_count, stats.estimated_hours_total), (0, 0))
+
+    def test_task_endpoints_keep_stats_in_step(self):
+        tasks_url = reverse("project-tasks-list", kwargs={"project_pk": self.project.id})
+        created = self.client.post(
+            tasks_url, {"title": "One", "priority": Task.Priority.HIGH, "estimated_hours": 5}, format="json"
+        )
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((self._stats().todo_count, self._stats().high_priority_count), (1, 1))
+
+        detail_url = reverse("project-tasks-detail", kwargs={"project_pk": self.project.id, "pk": created.data["id"]})
+        self.client.patch(detail_url, {"status": Task.Status.IN_PROGRESS, "estimated_hours": 8}, format="json")
+        stats = self._stats()
+        self.assertEqual((stats.todo_count, stats.in_progress_count, stats.estimated_hours_total), (0, 1, 8))
+
+        self.client.delete(detail_url)
+        self.assertEqual(self._stats().in_progress_count, 0)
+        self.assertNoDrift()
+
+    def test_bulk_paths_apply_one_delta_per_project(self):
+        bulk_url = reverse("project-tasks-bulk-create", kwargs={"project_pk": self.project.id})
+        response = self.client.post(
+            bulk_url, [{"title": f"Bulk {index}", "estimated_hours": 2} for index in range(4)], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((self._stats().todo_count, self._stats().estimated_hours_total), (4, 8))
+
+        transition_url = reverse("project-tasks-bulk-transition", kwargs={"project_pk": self.project.id})
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(
+                transition_url, {"task_ids": [row["id"] for row in response.data[:3]], "status": "IN_PROGRESS"}, format="json"
+            )
+        stats_updates = [query for query in context.captured_queries if 'UPDATE "work_projecttaskstats"' in query["sql"]]
+        self.assertEqual(len(stats_updates), 1)
+        self.assertEqual((self._stats().todo_count, self._stats().in_progress_count), (1, 3))
+        self.assertNoDrift()
+
+    def test_saves_from_partial_instances_are_counted_correctly(self):
+        task = Task.objects.create(project=self.project, title="Task", priority=Task.Priority.MEDIUM)
+
+        partial = Task.objects.only("id", "title").get(pk=task.pk)
+        partial.status = Task.Status.DONE
+        partial.save(update_fields=["status"])
+
+        stale = Task.objects.get(pk=task.pk)
+        stale.title = "Renamed"
+        stale.save(update_fields=["title"])
+
+        stats = self._stats()
+        self.assertEqual((stats.done_count, stats.medium_priority_count), (1, 1))
+        self.assertNoDrift()
+
+    def test_stale_instances_do_not_apply_a_change_twice(self):
+        task = Task.objects.create(project=self.project, title="Task")
+        first, second = Task.objects.get(pk=task.pk), Task.objects.get(pk=task.pk)
+
+        for copy in (first, second):
+            copy.status = Task.Status.DONE
+            copy.save()
+
+        stats = self._stats()
+        self.assertEqual((stats.todo_count, stats.done_count), (0, 1))
+        self.assertNoDrift()
+
+    def test_project_serializer_embeds_stats(self):
+        Task.objects.create(project=self.project, title="Task", status=Task.Status.REVIEW)
+        detail = self.client.get(reverse("project-detail", kwargs={"pk": self.project.id}))
+
+        self.assertEqual(detail.data["task_stats"]["total"], 1)
+        self.assertEqual(detail.data["task_stats"]["by_status"]["REVIEW"], 1)
+        self.assertEqual(detail.data["task_stats"]["by_priority"]["LOW"], 1)
+
+    def test_list_embeds_stats_on_request_without_extra_queries(self):
+        for index in range(3):
+            self._project(f"X{index}")
+        url = reverse("project-list")
+
+        self.assertNotIn("task_stats", self.client.get(url).data[0])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, {"fields": "code,task_stats"})
+
+        self.assertEqual(len(response.data), 4)
+        self.assertTrue(all(row["task_stats"]["total"] == 0 for row in response.data))
+        self.assertFalse(any("work_projecttaskstats" in query["sql"] and "JOIN" not in query["sql"]
+                             for query in context.captured_queries))
+
+    def test_reconcile_command_reports_and_repairs_drift(self):
+        Task.objects.create(project=self.project, title="Task")
+        other = self._project("P2")
+        ProjectTaskStats.objects.filter(project=self.project).update(todo_count=7)
+        ProjectTaskStats.objects.filter(project=other).delete()
+
+        with self.assertRaises(CommandError):
+            call_command("reconcile_project_task_stats", "--check", stdout=StringIO(), stderr=StringIO())
+
+        call_command("reconcile_project_task_stats", stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(self._stats().todo_count, 1)
+        self.assertTrue(ProjectTaskStats.objects.filter(project=other).exists())
+        self.assertNoDrift()
+
+    def test_deleting_a_project_removes_its_stats(self):
+        project = self._project("P2")
+        Task.objects.create(project=project, title="Task")
+        project_id = project.id
+
+        project.delete()
+
+        self.assertFalse(ProjectTaskStats.objects.filter(project_id=project_id).exists())
+
+    def test_project_delete_does_not_update_per_task(self):
+        project = self._project("P2")
+        Task.objects.bulk_create([Task(project=project, title=f"Task {index}") for index in range(50)])
+
+        with CaptureQueriesContext(connection) as context:
+            project.delete()
+
+        self.assertLessEqual(len(context.captured_queries), 6)
+        self.assertFalse(any(
+            query["sql"].startswith(('UPDATE "work_projecttaskstats"', 'UPDATE "work_project"'))
+            for query in context.captured_queries
+        ))
+
+    def test_queryset_delete_updates_each_project_once(self):
+        other = self._project("P2")
+        for project in (self.project, other):
+            for index in range(5):
+                Task.objects.create(project=project, title=f"Task {index}", estimated_hours=2)
+        Task.objects.create(project=self.project, title="Keep", estimated_hours=3)
+        versions = dict(Project.objects.values_list("id", "task_version"))
+
+        with CaptureQueriesContext(connection) as context:
+            Task.objects.filter(title__startswith="Task ").delete()
+
+        stats_updates = [query for query in context.captured_queries if 'UPDATE "work_projecttaskstats"' in query["sql"]]
+        self.assertEqual(len(stats_updates), 2)
+        self.assertEqual((self._stats().todo_count, self._stats().estimated_hours_total), (1, 3))
+        self.assertEqual(
+            {pk: version - versions[pk] for pk, version in Project.objects.values_list("id", "task_version")},
+            {self.project.id: 1, other.id: 1},
+        )
+        self.assertNoDrift()
+
+
+@skipUnless(connection.vendor == "postgresql", "needs concurrent transactions")
+class ConcurrentTaskSaveTests(TransactionTestCase):
+    def test_concurrent_saves_of_the_same_change_count_once(self):
+        dept = Department.objects.create(name="Engineering", code="ENG")
+        manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        team = Team.objects.create(name="Team A", code="TA", department=dept, manager=manager)
+        project = Project.objects.create(
+            name="P1", code="P1", team=team, department=dept, start_date="2026-01-01", created_by=manager
+        )
+        task = Task.objects.create(project=project, title="Task")
+        first_saved, second_started = threading.Event(), threading.Event()
+
+        def first():
+            try:
+                with transaction.atomic():
+                    copy = Task.objects.get(pk=task.pk)
+                    copy.status = Task.Status.DONE
+                    copy.save()
+                    first_saved.set()
+                    # Hold the row lock while the second save loads its copy and tries to save.
+                    second_started.wait(5)
+            finally:
+                connections.close_all()
+
+        def second():
+            try:
+                copy = Task.objects.get(pk=task.pk)
+                first_saved.wait(5)
+                copy.status = Task.Status.DONE
+                second_started.set()
+                copy.save()
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = ProjectTaskStats.objects.get(project=project)
+        self.assertEqual((stats.todo_count, stats.done_count), (0, 1))
+        self.assertEqual(find_task_stats_drift(), {})
@@ -0,0 +1,30 @@
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Project, Task
+
+
+class TaskStatusOrderTests(APITestCase):
+    def setUp(self):
+        dept = Department.objects.create(name="Engineering", code="ENG")
+        manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        team = Team.objects.create(name="Team A", code="TA", department=dept, manager=manager)
+        self.project = Project.objects.create(
+            name="Project 1", code="P1", team=team, department=dept, start_date="2026-01-01", created_by=manager
+        )
+
+    def _orders(self):
+        return set(Task.objects.values_list("status", "status_order"))
+
+    def test_status_order_follows_every_write_path(self):
+        task = Task.objects.create(project=self.project, title="Saved", status=Task.Status.REVIEW)
+        Task.objects.bulk_create([Task(project=self.project, title="Bulk", status=Task.Status.BLOCKED)])
+        self.assertSetEqual(self._orders(), {("REVIEW", 3), ("BLOCKED", 4)})
+
+        Task.objects.update(status=Task.Status.IN_PROGRESS)
+        self.assertSetEqual(self._orders(), {("IN_PROGRESS", 2)})
+
+        task.status = Task.Status.DONE
+        Task.objects.bulk_update([task], ["status"])
+        self.assertSetEqual(self._orders(), {("IN_PROGRESS", 2), ("DONE", 5)})
@@ -0,0 +1,101 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from organization.models import Department, Team
+from work.models import Assignment, Project, Task
+
+
+class UserTaskListTests(APITestCase):
+    def setUp(self):
+        self.dept = Department.objects.create(name="Engineering", code="ENG")
+        self.admin = User.objects.create_user(email="admin@test.com", username="admin", role=User.Role.ADMIN)
+        self.manager = User.objects.create_user(email="manager@test.com", username="manager", role=User.Role.MANAGER)
+        self.other_manager = User.objects.create_user(email="other@test.com", username="other", role=User.Role.MANAGER)
+        self.employee = User.objects.create_user(email="emp@test.com", username="emp", role=User.Role.EMPLOYEE)
+        self.colleague = User.objects.create_user(email="col@test.com", username="col", role=User.Role.EMPLOYEE)
+        team = Team.objects.create(name="Team A", code="TA", department=self.dept, manager=self.manager)
+        other_team = Team.objects.create(name="Team B", code="TB", department=self.dept, manager=self.other_manager)
+
+        self.projects = [self._project("P1", team), self._project("P2", team), self._project("P3", other_team)]
+        for project in self.projects:
+            Assignment.objects.create(project=project, user=self.employee, role="SOFTWARE_ENGINEER")
+
+        self.tasks = []
+        for project in self.projects:
+            for index, task_status in enumerate([Task.Status.TODO, Task.Status.REVIEW, Task.Status.DONE]):
+                self.tasks.append(Task.objects.create(
+                    project=project,
+                    title=f"{project.code} task {index}",
+                    status=task_status,
+                    priority=Task.Priority.HIGH if index == 0 else Task.Priority.LOW,
+                    assigned_to=self.employee,
+                ))
+        Task.objects.create(project=self.projects[0], title="Someone else's", assigned_to=self.colleague)
+
+    def _project(self, code, team):
+        return Project.objects.create(
+            name=code, code=code, team=team, department=self.dept, start_date="2026-01-01", created_by=self.admin
+        )
+
+    def _walk(self, url, params=None):
+        ids = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(row["id"] for row in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_my_tasks_span_every_project_in_one_page_query(self):
+        self.client.force_authenticate(user=self.employee)
+        url = reverse("my-tasks")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual([row["id"] for row in response.data["results"]], [task.id for task in self.tasks])
+        self.assertNotIn("description", response.data["results"][0])
+
+    def test_cursor_pages_cover_every_task_in_order(self):
+        self.client.force_authenticate(user=self.employee)
+
+        ids = self._walk(reverse("my-tasks"), {"page_size": 2})
+
+        expected = Task.objects.filter(assigned_to=self.employee).order_by("status_order", "-priority", "-created_at", "-id")
+        self.assertEqual(ids, [task.id for task in expected])
+
+    def test_status_and_priority_filters(self):
+        self.client.force_authenticate(user=self.employee)
+        url = reverse("my-tasks")
+
+        review = self._walk(url, {"status": Task.Status.REVIEW})
+        open_high = self._walk(url, {"status__in": "TODO,REVIEW", "priority": Task.Priority.HIGH})
+
+        self.assertCountEqual(review, [task.id for task in self.tasks if task.status == Task.Status.REVIEW])
+        self.assertCountEqual(open_high, [task.id for task in self.tasks if task.priority == Task.Priority.HIGH])
+        self.assertEqual(self.client.get(url, {"status": "NOPE"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_manager_sees_only_their_projects(self):
+        self.client.force_authenticate(user=self.manager)
+
+        ids = self._walk(reverse("user-tasks", kwargs={"user_pk": self.employee.id}))
+
+        self.assertCountEqual(ids, [task.id for task in self.tasks if task.project_id != self.projects[2].id])
+
+    def test_admin_sees_everything(self):
+        self.client.force_authenticate(user=self.admin)
+
+        ids = self._walk(reverse("user-tasks", kwargs={"user_pk": self.employee.id}))
+
+        self.assertEqual(len(ids), len(self.tasks))
+
+    def test_employee_cannot_list_someone_else(self):
+        self.client.force_authenticate(user=self.employee)
+
+        response = self.client.get(reverse("user-tasks", kwargs={"user_pk": self.colleague.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,6 +1,6 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
-from .views import AssignmentViewSet, ManagerProjectViewSet, ProjectMemberViewSet, ProjectViewSet, TaskViewSet, UserProjectViewSet
+from .views import AssignmentViewSet, ManagerProjectViewSet, ProjectMemberViewSet, ProjectViewSet, TaskSearchViewSet, TaskViewSet, UserProjectViewSet, UserTaskViewSet
 
 router = DefaultRouter()
 
@@ -13,4 +13,7 @@ urlpatterns = [
     path('users/<int:user_pk>/projects/',UserProjectViewSet.as_view({'get': 'list'}),name='user-projects'),
     path('projects/<int:project_pk>/members/',ProjectMemberViewSet.as_view({'get': 'list'}),name='project-members'),
     path('managers/<int:manager_pk>/projects/', ManagerProjectViewSet.as_view({'get': 'list'}), name='manager-projects'),
+    path('tasks/search/', TaskSearchViewSet.as_view({'get': 'list'}), name='task-search'),
+    path('me/tasks/', UserTaskViewSet.as_view({'get': 'list'}), name='my-tasks'),
+    path('users/<int:user_pk>/tasks/', UserTaskViewSet.as_view({'get': 'list'}), name='user-tasks'),
 ]
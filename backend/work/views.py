@@ -3,19 +3,33 @@ from rest_framework import viewsets, mixins
 # CRITICAL: NEVER bypass PermissionService for access control.
 
 from . models import Assignment, Project, Task
-from . serializers import AssignmentSerializer, ProjectMemberSerializer, ProjectSerializer, TaskCreateSerializer, TaskReadSerializer, TaskUpdateSerializer, UserProjectSerializer
-
-from core.permissions import ProjectPermission, AssignmentPermission, TaskPermission, UserProjectPermission
+from . pagination import AssigneeTaskPagination, TaskKeysetPagination
+from . services.task_board import build_task_board
+from . services.task_search import search_tasks
+from . services.task_stats import TaskStatsDelta
+from . services.task_rules import TaskRuleViolation, check_task_update
+from . serializers import AssignmentSerializer, ProjectMemberSerializer, ProjectSerializer, TaskBulkCreateSerializer, TaskBulkTransitionSerializer, TaskCreateSerializer, TaskReadSerializer, TaskUpdateSerializer, UserProjectSerializer
+
+from core.permissions import ProjectPermission, AssignmentPermission, TaskPermission, UserProjectPermission, UserTaskPermission
 from core.permissions.services import PermissionService
 from core.permissions.scoped_viewsets import BaseScopedViewSet
-
+from core.conditional import ConditionalGetMixin
+from core.sparse_fields import SparseFieldsMixin
+
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+from rest_framework import status as http_status
+from rest_framework.decorators import action
 from rest_framework.exceptions import MethodNotAllowed
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.response import Response
+from accounts.authentication import StatelessJWTAuthentication
 from accounts.models import User
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
 from audit.services import (
     ActivityActionType,
+    ActivityLogService,
     ActivityTargetType,
     log_activity,
 )
@@ -39,6 +53,14 @@ def _extract_changes(instance_before, validated_data, fields):
     return changes
 
 
+def _int_query_param(request, name, default, maximum=None):
+    try:
+        value = max(int(request.query_params.get(name, default)), 0)
+    except (TypeError, ValueError):
+        value = default
+    return min(value, maximum) if maximum is not None else value
+
+
 def _create_metadata(values):
     return {field: {"old": None, "new": value} for field, value in values.items()}
 
@@ -48,17 +70,31 @@ def _delete_metadata(values):
 
 
 class ProjectViewSet(
+    ConditionalGetMixin,
+    SparseFieldsMixin,
     BaseScopedViewSet
 ):
     serializer_class = ProjectSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [ProjectPermission]
-    
+    list_fields = ("id", "name", "code", "department", "team", "manager", "status", "start_date", "end_date", "updated_at")
+    sparse_select_related = ("task_stats",)
+
     def get_queryset(self):
         user = self.request.user
         if not user.is_authenticated:
             return Project.objects.none()
-        return PermissionService.scope_projects(user, Project.objects.all())
+        return PermissionService.scope_projects(user, Project.objects.select_related("task_stats"))
+
+    # Embedded task stats change with every task write, which bumps task_version.
+    def get_list_version(self, queryset):
+        version = queryset.order_by().aggregate(
+            count=Count("pk"), last=Max("updated_at"), tasks=Sum("task_version")
+        )
+        return version["count"], version["last"], version["tasks"]
+
+    def get_object_version(self, obj):
+        return obj.updated_at, obj.task_version
 
     def perform_create(self, serializer):
         project = serializer.save(created_by=self.request.user)
@@ -77,7 +113,7 @@ class ProjectViewSet(
         )
 
     def perform_update(self, serializer):
-        project = self.get_object()
+        project = self.get_snapshot()
         tracked_fields = [
             "name",
             "description",
@@ -105,7 +141,7 @@ class AssignmentViewSet(
     BaseScopedViewSet
 ):
     serializer_class = AssignmentSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [AssignmentPermission]
 
     def get_queryset(self):
@@ -135,8 +171,8 @@ class AssignmentViewSet(
         )
 
     def perform_update(self, serializer):
-        assignment = self.get_object()
-        project = assignment.project
+        assignment = self.get_snapshot()
+        project = self.get_access_context().project
         assignee = serializer.validated_data.get("user", assignment.user)
         if not PermissionService.is_team_member(assignee, project.team):
             raise PermissionDenied("User does not belong to this project's team.")
@@ -168,7 +204,7 @@ class AssignmentViewSet(
     
 class UserProjectViewSet(BaseScopedViewSet):
     serializer_class = UserProjectSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [UserProjectPermission]
 
     def get_queryset(self):
@@ -185,7 +221,7 @@ class UserProjectViewSet(BaseScopedViewSet):
     
 class ProjectMemberViewSet(BaseScopedViewSet):
     serializer_class = ProjectMemberSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [ProjectPermission]
 
     def get_queryset(self):
@@ -202,7 +238,7 @@ class ProjectMemberViewSet(BaseScopedViewSet):
 
 class ManagerProjectViewSet(BaseScopedViewSet):
     serializer_class = ProjectSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -218,12 +254,16 @@ class ManagerProjectViewSet(BaseScopedViewSet):
             raise PermissionDenied("Employees cannot access this endpoint.")
         if not PermissionService.can_view_manager_projects(requester, user_pk_int):
             raise PermissionDenied("Managers can view only their own projects.")
-        return Project.objects.filter(manager_id=user_pk_int)
+        return Project.objects.filter(manager_id=user_pk_int).select_related("task_stats")
 
-class TaskViewSet(BaseScopedViewSet):
+class TaskViewSet(ConditionalGetMixin, SparseFieldsMixin, BaseScopedViewSet):
     model = Task
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [TaskPermission]
+    pagination_class = TaskKeysetPagination
+    list_fields = ("id", "project", "title", "status", "priority", "assigned_to", "estimated_hours", "created_at", "updated_at")
+    # Read by the keyset cursor even when not rendered.
+    sparse_required_fields = ("status_order", "priority", "created_at")
     
     def get_queryset(self):
         user = self.request.user
@@ -233,13 +273,190 @@ class TaskViewSet(BaseScopedViewSet):
         qs = Task.objects.select_related("project", "assigned_to", "created_by").filter(project_id=project_id)
         return PermissionService.scope_tasks(user, qs)
     
+    def get_list_version(self, queryset):
+        # Every task write bumps the project's task_version, so one row of
+        # the project covers the whole list. The manager is included because
+        # it changes which tasks a manager is allowed to see.
+        return Project.objects.filter(pk=self.kwargs.get("project_pk")).order_by().values_list(
+            "task_version", "manager_id", "updated_at"
+        ).first()
+
     def get_serializer_class(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'board', 'search']:
             return TaskReadSerializer
         if self.action == 'create':
             return TaskCreateSerializer
+        if self.action == 'bulk_create':
+            return TaskBulkCreateSerializer
+        if self.action == 'bulk_transition':
+            return TaskBulkTransitionSerializer
         return TaskUpdateSerializer
     
+    board_default_limit = 20
+    board_max_limit = 100
+
+    @action(detail=False, methods=["get"])
+    def board(self, request, *args, **kwargs):
+        """
+        Tasks grouped by status. Each column returns its total count and up
+        to `limit` tasks, and is paged on its own with `offset_<STATUS>`.
+        """
+        limit = _int_query_param(request, "limit", self.board_default_limit, self.board_max_limit) or 1
+        offsets = {status: _int_query_param(request, f"offset_{status}", 0) for status in Task.Status.values}
+
+        columns = build_task_board(self.get_queryset(), offsets, limit)
+        return Response({
+            "limit": limit,
+            "columns": [
+                {
+                    "status": column["status"],
+                    "count": column["count"],
+                    "offset": column["offset"],
+                    "next_offset": column["offset"] + limit if column["offset"] + limit < column["count"] else None,
+                    "results": self.get_serializer(column["tasks"], many=True).data,
+                }
+                for column in columns
+            ],
+        })
+
+    search_default_limit = 50
+    search_max_limit = 100
+
+    @action(detail=False, methods=["get"])
+    def search(self, request, *args, **kwargs):
+        """
+        Ranked full-text search (`q`) over the project's tasks visible to the
+        user, returning at most `limit` compact rows.
+        """
+        limit = _int_query_param(request, "limit", self.search_default_limit, self.search_max_limit) or 1
+        tasks = search_tasks(self.get_queryset().select_related(None), request.query_params.get("q"))[:limit]
+        return Response(self.get_serializer(tasks, many=True, fields=self.list_fields).data)
+
+    bulk_create_max_items = 500
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request, *args, **kwargs):
+        """
+        Create a list of tasks in one transaction. Nothing is written if any
+        item is invalid; errors are returned per item, in request order.
+        """
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False, max_length=self.bulk_create_max_items
+        )
+        serializer.is_valid(raise_exception=True)
+
+        project_id = int(self.kwargs["project_pk"])
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create([
+                Task(
+                    **{field: value for field, value in item.items() if field != "assigned_to"},
+                    assigned_to_id=item.get("assigned_to"),
+                    project_id=project_id,
+                    created_by=request.user,
+                )
+                for item in serializer.validated_data
+            ])
+            stats = TaskStatsDelta()
+            for task in tasks:
+                stats.add_task(task)
+            stats.apply()
+            Project.bump_task_version(project_id)
+            ActivityLogService.enqueue_logs(
+                user=request.user,
+                entries=[
+                    {
+                        "action_type": ActivityActionType.TASK_CREATED,
+                        "target_type": ActivityTargetType.TASK,
+                        "target_id": task.id,
+                        "metadata": _create_metadata({
+                            "project_id": task.project_id,
+                            "title": task.title,
+                            "status": task.status,
+                            "assigned_to": task.assigned_to_id,
+                        }),
+                    }
+                    for task in tasks
+                ],
+            )
+
+        # Re-read so database-computed columns (status_order) are included,
+        # keeping request order so result i is the task created from item i.
+        created = Task.objects.in_bulk([task.id for task in tasks])
+        return Response(
+            TaskReadSerializer([created[task.id] for task in tasks], many=True).data,
+            status=http_status.HTTP_201_CREATED,
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-transition")
+    def bulk_transition(self, request, *args, **kwargs):
+        """
+        Move a set of tasks to one status under the TaskUpdateSerializer
+        rules. All or nothing: any refused task is reported by id and no
+        task changes. Applied as a single UPDATE.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        task_ids = set(serializer.validated_data["task_ids"])
+        new_status = serializer.validated_data["status"]
+        user = request.user
+
+        with transaction.atomic():
+            tasks = {
+                task.id: task
+                for task in self.get_queryset()
+                .filter(id__in=task_ids)
+                .select_related(None)
+                .select_related("project")
+                .select_for_update(of=("self",))
+                .only("id", "status", "assigned_to_id", "project_id", "project__manager_id")
+            }
+
+            errors = {}
+            for task_id in sorted(task_ids):
+                task = tasks.get(task_id)
+                if task is None:
+                    errors[task_id] = "Task not found."
+                    continue
+                try:
+                    check_task_update(
+                        user,
+                        task,
+                        ["status"],
+                        new_status,
+                        permitted=PermissionService.can_update_task(user, task),
+                        manages_project=PermissionService.can_update_project(user, task.project),
+                    )
+                except TaskRuleViolation as exc:
+                    errors[task_id] = str(exc)
+            if errors:
+                return Response({"errors": errors}, status=http_status.HTTP_400_BAD_REQUEST)
+
+            changed = [task for task in tasks.values() if task.status != new_status]
+            Task.objects.filter(id__in=[task.id for task in changed]).update(status=new_status, updated_at=timezone.now())
+            stats = TaskStatsDelta()
+            for task in changed:
+                stats.change_status(task.project_id, task.status, new_status)
+            stats.apply()
+            Project.bump_task_version(*{task.project_id for task in changed})
+            ActivityLogService.enqueue_logs(
+                user=user,
+                entries=[
+                    {
+                        "action_type": ActivityActionType.TASK_STATUS_CHANGED,
+                        "target_type": ActivityTargetType.TASK,
+                        "target_id": task.id,
+                        "metadata": {"status": {"old": task.status, "new": new_status}},
+                    }
+                    for task in changed
+                ],
+            )
+
+        return Response({
+            "status": new_status,
+            "updated": sorted(task.id for task in changed),
+            "unchanged": sorted(set(tasks) - {task.id for task in changed}),
+        })
+
     def perform_create(self, serializer):
         project_id = self.kwargs.get("project_pk")
         task = serializer.save(project_id=project_id, created_by=self.request.user)
@@ -257,7 +474,7 @@ class TaskViewSet(BaseScopedViewSet):
         )
 
     def perform_update(self, serializer):
-        task = self.get_object()
+        task = self.get_snapshot()
         tracked_fields = [
             "title",
             "description",
@@ -295,20 +512,54 @@ class TaskViewSet(BaseScopedViewSet):
             metadata=changes,
         )
 
-    def destroy(self, request, *args, **kwargs):
-        task = self.get_object()
-        task_id = task.id
+    def perform_destroy(self, instance):
+        task_id = instance.id
         metadata = {
-            "project_id": task.project_id,
-            "status": task.status,
-            "assigned_to": task.assigned_to_id,
+            "project_id": instance.project_id,
+            "status": instance.status,
+            "assigned_to": instance.assigned_to_id,
         }
-        response = super().destroy(request, *args, **kwargs)
+        super().perform_destroy(instance)
         log_activity(
-            user=request.user,
+            user=self.request.user,
             action_type=ActivityActionType.TASK_DELETED,
             target_type=ActivityTargetType.TASK,
             target_id=task_id,
             metadata=_delete_metadata(metadata),
         )
-        return response
+
+
+class TaskSearchViewSet(BaseScopedViewSet):
+    """Task search across every project the user can see tasks in."""
+    serializer_class = TaskReadSerializer
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return PermissionService.scope_tasks(self.request.user, Task.objects.all())
+
+    def list(self, request, *args, **kwargs):
+        limit = _int_query_param(request, "limit", TaskViewSet.search_default_limit, TaskViewSet.search_max_limit) or 1
+        tasks = search_tasks(self.get_queryset(), request.query_params.get("q"))[:limit]
+        return Response(self.get_serializer(tasks, many=True, fields=TaskViewSet.list_fields).data)
+
+
+class UserTaskViewSet(SparseFieldsMixin, BaseScopedViewSet):
+    """
+    One user's tasks across every project the requester can see, served at
+    me/tasks/ and users/{pk}/tasks/. Always keyset paginated.
+    """
+    serializer_class = TaskReadSerializer
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [UserTaskPermission]
+    pagination_class = AssigneeTaskPagination
+    filterset_fields = {
+        "status": ["exact", "in"],
+        "priority": ["exact", "in"],
+    }
+    list_fields = TaskViewSet.list_fields
+    sparse_required_fields = TaskViewSet.sparse_required_fields
+
+    def get_queryset(self):
+        user_id = self.kwargs.get("user_pk", self.request.user.id)
+        return PermissionService.scope_tasks(self.request.user, Task.objects.filter(assigned_to_id=user_id))